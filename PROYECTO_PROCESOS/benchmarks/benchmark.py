@@ -0,0 +1,246 @@
+"""Benchmarks de rendimiento del simulador (no son pruebas de corrección).
+
+Mide, para cada tamaño de carga, el tiempo de cada algoritmo, de calculate_metrics y
+del dibujo del diagrama de Gantt. Informa eventos por segundo (tramos del timeline)
+y memoria máxima, y escribe los resultados en JSON. También mide el arranque en frío
+de la interfaz y de la línea de comandos: importarlas no debe cargar matplotlib (se
+carga con el primer gráfico), y si lo hace se informa como regresión aunque no haya
+línea base. Si existe una línea base
+(baseline.json junto a este archivo o --baseline), marca como regresión todo
+benchmark más lento o con más memoria que la línea base más la tolerancia, y termina
+con código 1.
+
+Ejemplos:
+    python benchmarks/benchmark.py --sizes 1e3,1e4,1e5 -o resultados.json
+    python benchmarks/benchmark.py --sizes 1e3,1e4,1e5 --save-baseline
+"""
+import argparse
+import gc
+import json
+import os
+import platform
+import subprocess
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+import matplotlib
+
+matplotlib.use("Agg")
+from matplotlib.backends.backend_agg import FigureCanvasAgg
+from matplotlib.figure import Figure
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir, "src")
+sys.path.insert(0, SRC_DIR)
+
+from gantt import WaitMarkers, draw_lanes
+from generator import generate_workload
+from scheduler import ALGORITHMS, calculate_metrics, run_algorithm, supported_algorithms
+
+
+BASELINE_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "baseline.json")
+DEFAULT_SIZES = "1e3,1e4,1e5,1e6"
+# Carga al ~90% de uso de CPU: ráfaga media 5 y una llegada cada 5.5 unidades
+MEAN_BURST = 5.0
+ARRIVAL_RATE = 0.18
+# El dibujo del Gantt no escala como los motores; por encima de este tamaño se omite
+MAX_GANTT_SIZE = 10 ** 6
+# Diferencias de tiempo menores que esto son ruido de medición, no regresiones
+MIN_REGRESSION_SECONDS = 0.005
+# Módulo de entrada -> módulos que no debe cargar al importarse
+STARTUP_MODULES = {"Programa": ("matplotlib",), "scheduler": ("matplotlib",)}
+STARTUP_SCRIPT = ("import json, sys, time; started = time.perf_counter(); import {module}; "
+                  "print(json.dumps([time.perf_counter() - started, sorted(sys.modules)]))")
+
+
+def parse_sizes(text):
+    # "1e3,1e4" -> [1000, 10000]
+    return [int(float(size)) for size in text.split(",") if size.strip()]
+
+
+def draw_gantt(timeline):
+    fig = Figure(figsize=(12, 5))
+    canvas = FigureCanvasAgg(fig)
+    ax = fig.add_subplot()
+    ax.set_xlim(0, int(timeline.end.max()) * 1.05)
+    draw_lanes(ax, timeline)
+    WaitMarkers(ax, timeline)
+    canvas.draw()
+
+
+def measure(work, repeat, memory):
+    # Mejor tiempo de `repeat` ejecuciones; la memoria se mide en una ejecución aparte
+    # porque tracemalloc hace más lento el código
+    seconds = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        started = time.perf_counter()
+        result = work()
+        seconds = min(seconds, time.perf_counter() - started)
+    peak = None
+    if memory:
+        gc.collect()
+        tracemalloc.start()
+        work()
+        peak = tracemalloc.get_traced_memory()[1] / 2 ** 20
+        tracemalloc.stop()
+    return result, seconds, peak
+
+
+def measure_startup(module, forbidden, repeat):
+    # Importación en un intérprete nuevo: lo que tarda en aparecer la ventana antes del
+    # bucle de Tk (o en empezar la línea de comandos)
+    seconds = float("inf")
+    for _ in range(repeat):
+        output = subprocess.run([sys.executable, "-c", STARTUP_SCRIPT.format(module=module)], cwd=SRC_DIR,
+                                capture_output=True, text=True, check=True).stdout
+        elapsed, modules = json.loads(output)
+        seconds = min(seconds, elapsed)
+    unexpected = sorted(name for name in forbidden if name in modules)
+    return {"name": f"startup:{module}", "size": 0, "seconds": seconds, "events": None, "events_per_second": None,
+            "peak_memory_mb": None, "unexpected_imports": unexpected}
+
+
+def run_benchmarks(sizes, algorithms=None, quantum=2, repeat=3, memory=True, seed=1, report=None, cores=1):
+    # Sin algorithms se miden todos los que soportan los núcleos pedidos (MLFQ solo con uno)
+    if algorithms is None:
+        algorithms = supported_algorithms(cores)
+    results = []
+
+    def record(name, size, seconds, peak, events):
+        entry = {"name": name, "size": size, "cores": cores, "seconds": seconds, "events": events,
+                 "events_per_second": events / seconds if events and seconds > 0 else None, "peak_memory_mb": peak}
+        results.append(entry)
+        if report is not None:
+            report(entry)
+
+    for size in sizes:
+        processes = generate_workload(size, seed, arrival_rate=ARRIVAL_RATE, mean_burst=MEAN_BURST)
+        busiest = None
+        for algorithm in algorithms:
+            timeline, seconds, peak = measure(lambda: run_algorithm(algorithm, processes, quantum, cores=cores),
+                                              repeat, memory)
+            record(algorithm, size, seconds, peak, len(timeline))
+            if busiest is None or len(timeline) > len(busiest):
+                busiest = timeline
+        if busiest is None:
+            continue
+        # Métricas y Gantt sobre el timeline con más tramos
+        _, seconds, peak = measure(lambda: calculate_metrics(processes, busiest), repeat, memory)
+        record("calculate_metrics", size, seconds, peak, len(busiest))
+        if size <= MAX_GANTT_SIZE:
+            _, seconds, peak = measure(lambda: draw_gantt(busiest), repeat, memory)
+            record("gantt", size, seconds, peak, len(busiest))
+    return results
+
+
+def find_regressions(results, baseline, tolerance):
+    # Benchmarks que tardan o usan más memoria que la línea base más la tolerancia, con
+    # el mismo número de núcleos (las líneas base sin núcleos son de uno)
+    previous = {(entry["name"], entry["size"], entry.get("cores", 1)): entry for entry in baseline["results"]}
+    regressions = []
+    for entry in results:
+        old = previous.get((entry["name"], entry["size"], entry.get("cores", 1)))
+        if old is None:
+            continue
+        for field in ("seconds", "peak_memory_mb"):
+            if entry[field] is None or not old.get(field) or entry[field] <= old[field] * (1 + tolerance):
+                continue
+            if field == "seconds" and entry[field] - old[field] < MIN_REGRESSION_SECONDS:
+                continue
+            regressions.append({"name": entry["name"], "size": entry["size"], "field": field,
+                                "baseline": old[field], "value": entry[field], "ratio": entry[field] / old[field]})
+    return regressions
+
+
+def startup_violations(results):
+    return [{"name": entry["name"], "size": entry["size"], "field": "imports", "baseline": [],
+             "value": entry["unexpected_imports"], "ratio": None}
+            for entry in results if entry.get("unexpected_imports")]
+
+
+def environment():
+    return {"python": platform.python_version(), "numpy": np.__version__, "matplotlib": matplotlib.__version__,
+            "platform": platform.platform(), "cpus": os.cpu_count()}
+
+
+def print_entry(entry):
+    peak = "" if entry["peak_memory_mb"] is None else f"{entry['peak_memory_mb']:10.1f} MB"
+    rate = entry["events_per_second"] or 0
+    sys.stderr.write(f"{entry['name']:>18} {entry['size']:>10} {entry['seconds']:10.4f} s "
+                     f"{rate:14.0f} eventos/s {peak}\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de rendimiento del simulador")
+    parser.add_argument("--sizes", default=DEFAULT_SIZES, help="cantidades de procesos, p.ej. 1e3,1e4,1e7")
+    parser.add_argument("--algorithms",
+                        help="algoritmos separados por comas (%s); por defecto, todos los que soportan los "
+                             "núcleos pedidos" % ", ".join(ALGORITHMS))
+    parser.add_argument("--cores", type=int, default=1, help="número de núcleos simulados (MLFQ solo con uno)")
+    parser.add_argument("-q", "--quantum", type=int, default=2, help="quantum para Round Robin")
+    parser.add_argument("--repeat", type=int, default=3, help="ejecuciones por benchmark (se toma la mejor)")
+    parser.add_argument("--no-memory", action="store_true", help="no medir la memoria máxima (más rápido)")
+    parser.add_argument("--no-startup", action="store_true", help="no medir el arranque de la interfaz y la CLI")
+    parser.add_argument("--seed", type=int, default=1, help="semilla de la carga generada")
+    parser.add_argument("-o", "--output", help="archivo JSON de resultados (por defecto, la salida estándar)")
+    parser.add_argument("--baseline", default=BASELINE_PATH, help="línea base con la que comparar")
+    parser.add_argument("--save-baseline", action="store_true", help="guardar los resultados como línea base")
+    parser.add_argument("--tolerance", type=float, default=0.25,
+                        help="aumento relativo tolerado antes de marcar una regresión (0.25 = 25%%)")
+    args = parser.parse_args(argv)
+
+    if args.cores <= 0:
+        parser.exit(1, "Error: el número de núcleos debe ser mayor que 0\n")
+    algorithms = supported_algorithms(args.cores)
+    if args.algorithms:
+        algorithms = [algorithm.strip() for algorithm in args.algorithms.split(",") if algorithm.strip()]
+    unknown = [algorithm for algorithm in algorithms if algorithm not in ALGORITHMS]
+    if unknown:
+        parser.exit(1, f"Error: algoritmos desconocidos: {', '.join(unknown)}\n")
+    unsupported = [algorithm for algorithm in algorithms if algorithm not in supported_algorithms(args.cores)]
+    if unsupported:
+        parser.exit(1, f"Error: {', '.join(unsupported)} no se simula con {args.cores} núcleos\n")
+    try:
+        sizes = parse_sizes(args.sizes)
+    except ValueError:
+        parser.exit(1, "Error: los tamaños deben ser números separados por comas\n")
+
+    results = []
+    if not args.no_startup:
+        for module, forbidden in STARTUP_MODULES.items():
+            results.append(measure_startup(module, forbidden, max(args.repeat, 1)))
+            print_entry(results[-1])
+    results += run_benchmarks(sizes, algorithms, args.quantum, max(args.repeat, 1), not args.no_memory, args.seed,
+                              report=print_entry, cores=args.cores)
+    output = {"environment": environment(), "settings": {"quantum": args.quantum, "repeat": args.repeat,
+                                                         "seed": args.seed, "cores": args.cores}, "results": results}
+
+    output["regressions"] = startup_violations(results)
+    if not args.save_baseline and os.path.exists(args.baseline):
+        with open(args.baseline) as f:
+            output["regressions"] += find_regressions(results, json.load(f), args.tolerance)
+    for regression in output["regressions"]:
+        if regression["field"] == "imports":
+            sys.stderr.write(f"REGRESIÓN {regression['name']}: carga {', '.join(regression['value'])} al iniciar\n")
+        else:
+            sys.stderr.write(f"REGRESIÓN {regression['name']} ({regression['size']}): {regression['field']} "
+                             f"{regression['value']:.4f} vs {regression['baseline']:.4f} "
+                             f"(x{regression['ratio']:.2f})\n")
+
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(output, f, indent=2)
+    else:
+        json.dump(output, sys.stdout, indent=2)
+        sys.stdout.write("\n")
+    if args.save_baseline:
+        with open(args.baseline, "w") as f:
+            json.dump(output, f, indent=2)
+    if output.get("regressions"):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,16 +1,51 @@
 import tkinter as tk
 from tkinter import ttk, messagebox, filedialog
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
-import matplotlib.pyplot as plt
-import matplotlib as mpl
-import matplotlib.patches as patches
-from matplotlib.animation import FuncAnimation
 import json
+import os
 import numpy as np
-from collections import deque
 
-# Configuración para evitar errores de icono
-mpl.rcParams['toolbar'] = 'None'
+from cache import MAX_BYTES, ResultCache, result_key
+from diagnostics import Instrumentation, timeline_counters
+from export import export_timeline
+from incremental import IncrementalSimulator
+from loaders import format_bursts, load_workload, parse_bursts
+from model import ProcessStore, Timeline
+from scheduler import (ALGORITHMS, MLFQ_QUANTA, calculate_metrics, compare_algorithms, mlfq_settings, parse_int_range,
+                       quantum_sweep, supported_algorithms)
+from smp import smp_algorithm
+from storage import load_timeline, save_process_set, save_timeline
+from worker import BackgroundTask
+
+# Cada cuánto (ms) se consulta el avance de la simulación en segundo plano
+TASK_POLL_INTERVAL = 100
+# Procesos que se listan uno por uno en las métricas; del resto solo se da la cantidad
+MAX_LISTED_PROCESSES = 1000
+
+def cache_limit():
+    try:
+        return int(float(os.environ["SIMULADOR_CACHE_MB"]) * 2 ** 20)
+    except (KeyError, ValueError):
+        return MAX_BYTES
+
+
+def timeline_metrics(timeline, instrumentation):
+    # Corre en el hilo de la tarea: con millones de procesos las métricas tardan
+    # segundos y la ventana seguiría respondiendo
+    with instrumentation.phase("Métricas"):
+        metrics = calculate_metrics(timeline.processes, timeline, max_listed=MAX_LISTED_PROCESSES)
+    instrumentation.count(**timeline_counters(timeline), context_switches=metrics["context_switches"])
+    return metrics
+
+
+def pyplot():
+    # matplotlib (con su backend de Tk y gantt.py) se importa con el primer gráfico:
+    # es la mayor parte del arranque y muchas sesiones no dibujan nada
+    import matplotlib as mpl
+    # Configuración para evitar errores de icono
+    mpl.rcParams['toolbar'] = 'None'
+    import matplotlib.pyplot as plt
+    return plt
+
 
 class EnhancedProcessSchedulingSimulator:
     def __init__(self, root):
@@ -18,12 +53,41 @@ class EnhancedProcessSchedulingSimulator:
         self.root.title("Simulador de Planificación de Procesos")
         self.root.geometry("1400x900")
         
-        self.processes = []
+        self.processes = ProcessStore()
+        # La tabla solo muestra la ventana visible del almacén a partir de esta fila
+        self.tree_offset = 0
+        self.tree_visible_rows = 12
+        self.selected_pids = set()
+        # iid de cada fila visible de la tabla -> ID del proceso
+        self.tree_pids = {}
         self.current_id = 1
         self.algorithm = "FCFS"
         self.quantum = 2
+        # Núcleos simulados y, con más de uno, tipo de colas y robo de trabajo
+        self.cores = 1
+        self.per_core_queues = False
+        self.work_stealing = False
+        # Niveles, boost y envejecimiento de MLFQ (ver mlfq_settings)
+        self.mlfq = mlfq_settings()
+        # Costo de cambio de contexto y penalización por caché fría al reanudar
+        self.switch_cost = 0
+        self.warmup = 0
         self.animation = None
         self.animation_running = False
+        # Un simulador incremental por algoritmo: tras editar procesos solo se
+        # recalcula desde el último punto de control anterior al cambio
+        self.simulators = {}
+        # Resultados ya calculados por carga, algoritmo y parámetros. Si se define
+        # SIMULADOR_CACHE_DIR también se conservan en disco entre sesiones;
+        # SIMULADOR_CACHE_MB limita la memoria que ocupan
+        self.result_cache = ResultCache(cache_limit(), os.environ.get("SIMULADOR_CACHE_DIR"))
+        # Simulación en segundo plano en curso (solo una a la vez)
+        self.task = None
+        # Tiempos y contadores de la última simulación (panel de diagnóstico)
+        self.instrumentation = Instrumentation()
+        # Último timeline mostrado y el algoritmo y parámetros con que se calculó
+        self.timeline = None
+        self.timeline_info = {}
         
         self.setup_ui()
         
@@ -56,6 +120,8 @@ class EnhancedProcessSchedulingSimulator:
         ttk.Label(process_frame, text="Tiempo de ráfaga:").grid(row=2, column=0, padx=5, pady=2, sticky=tk.W)
         self.burst_entry = ttk.Entry(process_frame, width=10)
         self.burst_entry.grid(row=2, column=1, padx=5, pady=2, sticky=tk.W)
+        ttk.Label(process_frame, text="(con E/S: CPU, E/S, CPU... p.ej. 5, 3:disco, 2)").grid(
+            row=2, column=2, padx=5, pady=2, sticky=tk.W)
         
         ttk.Label(process_frame, text="Prioridad:").grid(row=3, column=0, padx=5, pady=2, sticky=tk.W)
         self.priority_entry = ttk.Entry(process_frame, width=10)
@@ -79,14 +145,24 @@ class EnhancedProcessSchedulingSimulator:
         self.process_tree.column("Arrival", width=80, anchor=tk.CENTER)
         self.process_tree.column("Burst", width=80, anchor=tk.CENTER)
         self.process_tree.column("Priority", width=80, anchor=tk.CENTER)
-        self.process_tree.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
+        tree_frame = ttk.Frame(parent)
+        tree_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        self.process_tree.pack(in_=tree_frame, side=tk.LEFT, fill=tk.BOTH, expand=True)
+        self.tree_scrollbar = ttk.Scrollbar(tree_frame, orient="vertical", command=self.on_tree_scrollbar)
+        self.tree_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.process_tree.bind("<Configure>", self.on_tree_resize)
+        self.process_tree.bind("<<TreeviewSelect>>", self.on_tree_select)
+        self.process_tree.bind("<MouseWheel>", self.on_tree_wheel)
+        self.process_tree.bind("<Button-4>", self.on_tree_wheel)
+        self.process_tree.bind("<Button-5>", self.on_tree_wheel)
         
         config_frame = ttk.LabelFrame(parent, text="Configuración del Algoritmo")
         config_frame.pack(fill=tk.X, padx=5, pady=5)
         
         ttk.Label(config_frame, text="Algoritmo:").grid(row=0, column=0, padx=5, pady=2, sticky=tk.W)
         self.algorithm_var = tk.StringVar(value="FCFS")
-        algorithms = ["FCFS", "SJF", "Round Robin", "Prioridades"]
+        algorithms = list(ALGORITHMS)
         self.algorithm_menu = ttk.Combobox(config_frame, textvariable=self.algorithm_var, values=algorithms, state="readonly", width=15)
         self.algorithm_menu.grid(row=0, column=1, padx=5, pady=2, sticky=tk.W)
         self.algorithm_menu.bind("<<ComboboxSelected>>", self.update_algorithm_settings)
@@ -98,6 +174,65 @@ class EnhancedProcessSchedulingSimulator:
         self.quantum_label = ttk.Label(config_frame, text="(Solo para Round Robin)")
         self.quantum_label.grid(row=1, column=2, padx=5, pady=2, sticky=tk.W)
         
+        ttk.Label(config_frame, text="Barrido de quanta:").grid(row=2, column=0, padx=5, pady=2, sticky=tk.W)
+        self.sweep_entry = ttk.Entry(config_frame, width=10)
+        self.sweep_entry.grid(row=2, column=1, padx=5, pady=2, sticky=tk.W)
+        self.sweep_entry.insert(0, "1-10")
+        ttk.Label(config_frame, text="(p.ej. 1-10 o 1,2,4,8)").grid(row=2, column=2, padx=5, pady=2, sticky=tk.W)
+        
+        ttk.Label(config_frame, text="Costos de cambio:").grid(row=3, column=0, padx=5, pady=2, sticky=tk.W)
+        self.switch_costs_entry = ttk.Entry(config_frame, width=10)
+        self.switch_costs_entry.grid(row=3, column=1, padx=5, pady=2, sticky=tk.W)
+        self.switch_costs_entry.insert(0, "0")
+        ttk.Label(config_frame, text="(para el barrido, p.ej. 0,1,2)").grid(row=3, column=2, padx=5, pady=2, sticky=tk.W)
+        
+        ttk.Label(config_frame, text="Núcleos:").grid(row=4, column=0, padx=5, pady=2, sticky=tk.W)
+        self.cores_entry = ttk.Entry(config_frame, width=10)
+        self.cores_entry.grid(row=4, column=1, padx=5, pady=2, sticky=tk.W)
+        self.cores_entry.insert(0, "1")
+        self.cores_entry.bind("<KeyRelease>", self.update_algorithm_choices)
+        self.cores_entry.bind("<FocusOut>", self.update_algorithm_choices)
+        
+        ttk.Label(config_frame, text="Colas de listos:").grid(row=5, column=0, padx=5, pady=2, sticky=tk.W)
+        self.queue_mode_var = tk.StringVar(value="Global")
+        ttk.Combobox(config_frame, textvariable=self.queue_mode_var, values=["Global", "Por núcleo"],
+                     state="readonly", width=15).grid(row=5, column=1, padx=5, pady=2, sticky=tk.W)
+        self.work_stealing_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(config_frame, text="Robo de trabajo", variable=self.work_stealing_var).grid(
+            row=5, column=2, padx=5, pady=2, sticky=tk.W)
+        
+        ttk.Label(config_frame, text="Quanta MLFQ:").grid(row=6, column=0, padx=5, pady=2, sticky=tk.W)
+        self.mlfq_quanta_entry = ttk.Entry(config_frame, width=10)
+        self.mlfq_quanta_entry.grid(row=6, column=1, padx=5, pady=2, sticky=tk.W)
+        self.mlfq_quanta_entry.insert(0, ",".join(map(str, MLFQ_QUANTA)))
+        self.mlfq_label = ttk.Label(config_frame, text="(un quantum por nivel, p.ej. 2,4,8)")
+        self.mlfq_label.grid(row=6, column=2, padx=5, pady=2, sticky=tk.W)
+        
+        ttk.Label(config_frame, text="Boost / envejec.:").grid(row=7, column=0, padx=5, pady=2, sticky=tk.W)
+        mlfq_frame = ttk.Frame(config_frame)
+        mlfq_frame.grid(row=7, column=1, padx=5, pady=2, sticky=tk.W)
+        self.boost_entry = ttk.Entry(mlfq_frame, width=4)
+        self.boost_entry.pack(side=tk.LEFT)
+        self.boost_entry.insert(0, "0")
+        self.aging_entry = ttk.Entry(mlfq_frame, width=4)
+        self.aging_entry.pack(side=tk.LEFT, padx=(2, 0))
+        self.aging_entry.insert(0, "0")
+        self.mlfq_rules_label = ttk.Label(config_frame, text="(0 desactiva la regla)")
+        self.mlfq_rules_label.grid(row=7, column=2, padx=5, pady=2, sticky=tk.W)
+        self.update_mlfq_settings()
+        
+        ttk.Label(config_frame, text="Cambio / calent.:").grid(row=8, column=0, padx=5, pady=2, sticky=tk.W)
+        cost_frame = ttk.Frame(config_frame)
+        cost_frame.grid(row=8, column=1, padx=5, pady=2, sticky=tk.W)
+        self.switch_cost_entry = ttk.Entry(cost_frame, width=4)
+        self.switch_cost_entry.pack(side=tk.LEFT)
+        self.switch_cost_entry.insert(0, "0")
+        self.warmup_entry = ttk.Entry(cost_frame, width=4)
+        self.warmup_entry.pack(side=tk.LEFT, padx=(2, 0))
+        self.warmup_entry.insert(0, "0")
+        ttk.Label(config_frame, text="(costo por cambio de proceso y al reanudar)").grid(
+            row=8, column=2, padx=5, pady=2, sticky=tk.W)
+        
         control_frame = ttk.Frame(parent)
         control_frame.pack(fill=tk.X, padx=5, pady=5)
         
@@ -105,11 +240,32 @@ class EnhancedProcessSchedulingSimulator:
         ttk.Button(control_frame, text="Comparar Algoritmos", command=self.run_benchmark).pack(side=tk.LEFT, padx=2, fill=tk.X, expand=True)
         ttk.Button(control_frame, text="Animación", command=self.toggle_animation).pack(side=tk.LEFT, padx=2, fill=tk.X, expand=True)
         
+        sweep_frame = ttk.Frame(parent)
+        sweep_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        ttk.Button(sweep_frame, text="Barrido de Quantum", command=self.run_quantum_sweep).pack(side=tk.LEFT, padx=2, fill=tk.X, expand=True)
+        
+        task_frame = ttk.Frame(parent)
+        task_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        self.task_progress = ttk.Progressbar(task_frame, mode='determinate', maximum=100)
+        self.task_progress.pack(side=tk.LEFT, padx=2, fill=tk.X, expand=True)
+        self.cancel_button = ttk.Button(task_frame, text="Cancelar", command=self.cancel_task, state=tk.DISABLED)
+        self.cancel_button.pack(side=tk.LEFT, padx=2)
+        self.task_status = ttk.Label(parent, text="")
+        self.task_status.pack(fill=tk.X, padx=7)
+        
         file_frame = ttk.Frame(parent)
         file_frame.pack(fill=tk.X, padx=5, pady=5)
         
         ttk.Button(file_frame, text="Guardar Procesos", command=self.save_processes).pack(side=tk.LEFT, padx=2, fill=tk.X, expand=True)
         ttk.Button(file_frame, text="Cargar Procesos", command=self.load_processes).pack(side=tk.LEFT, padx=2, fill=tk.X, expand=True)
+        
+        timeline_frame = ttk.Frame(parent)
+        timeline_frame.pack(fill=tk.X, padx=5, pady=(0, 5))
+        
+        ttk.Button(timeline_frame, text="Guardar Timeline", command=self.save_timeline).pack(side=tk.LEFT, padx=2, fill=tk.X, expand=True)
+        ttk.Button(timeline_frame, text="Abrir Timeline", command=self.open_timeline).pack(side=tk.LEFT, padx=2, fill=tk.X, expand=True)
     
     def setup_output_panel(self, parent):
         notebook = ttk.Notebook(parent)
@@ -121,8 +277,11 @@ class EnhancedProcessSchedulingSimulator:
         self.gantt_frame = ttk.Frame(sim_tab)
         self.gantt_frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
-        metrics_frame = ttk.LabelFrame(sim_tab, text="Métricas")
-        metrics_frame.pack(fill=tk.X, padx=5, pady=5)
+        results_frame = ttk.Frame(sim_tab)
+        results_frame.pack(fill=tk.X, padx=5, pady=5)
+        
+        metrics_frame = ttk.LabelFrame(results_frame, text="Métricas")
+        metrics_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
         self.metrics_text = tk.Text(metrics_frame, height=8, state=tk.DISABLED)
         scrollbar = ttk.Scrollbar(metrics_frame, orient="vertical", command=self.metrics_text.yview)
@@ -131,6 +290,26 @@ class EnhancedProcessSchedulingSimulator:
         scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
         self.metrics_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
+        # Diagnóstico: dónde se fue el tiempo de la última simulación
+        diagnostics_frame = ttk.LabelFrame(results_frame, text="Diagnóstico")
+        diagnostics_frame.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(5, 0))
+        
+        options_frame = ttk.Frame(diagnostics_frame)
+        options_frame.pack(fill=tk.X, padx=5)
+        self.profile_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(options_frame, text="cProfile", variable=self.profile_var).pack(side=tk.LEFT)
+        self.trace_memory_var = tk.BooleanVar(value=False)
+        ttk.Checkbutton(options_frame, text="tracemalloc", variable=self.trace_memory_var).pack(side=tk.LEFT, padx=5)
+        ttk.Button(options_frame, text="Exportar JSON", command=self.export_diagnostics).pack(side=tk.RIGHT)
+        
+        self.diagnostics_text = tk.Text(diagnostics_frame, height=7, state=tk.DISABLED)
+        diagnostics_scrollbar = ttk.Scrollbar(diagnostics_frame, orient="vertical",
+                                              command=self.diagnostics_text.yview)
+        self.diagnostics_text.configure(yscrollcommand=diagnostics_scrollbar.set)
+        
+        diagnostics_scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self.diagnostics_text.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
+        
         self.compare_tab = ttk.Frame(notebook)
         notebook.add(self.compare_tab, text="Comparación", state="normal")
         
@@ -145,21 +324,47 @@ class EnhancedProcessSchedulingSimulator:
         else:
             self.quantum_entry.config(state="disabled")
             self.quantum_label.config(foreground="gray")
+        self.update_mlfq_settings()
+    
+    def update_algorithm_choices(self, event=None):
+        # MLFQ solo se simula con un núcleo y sin ráfagas de E/S: no se ofrece si la
+        # lista tiene procesos con E/S o se piden varios núcleos
+        try:
+            cores = int(self.cores_entry.get())
+        except ValueError:
+            cores = 1
+        algorithms = supported_algorithms(cores, bool(self.processes.io))
+        self.algorithm_menu.config(values=algorithms)
+        if self.algorithm_var.get() not in algorithms:
+            self.algorithm_var.set(algorithms[0])
+            self.update_algorithm_settings()
+    
+    def update_mlfq_settings(self):
+        enabled = self.algorithm_var.get() == "MLFQ"
+        for entry in (self.mlfq_quanta_entry, self.boost_entry, self.aging_entry):
+            entry.config(state="normal" if enabled else "disabled")
+        for label in (self.mlfq_label, self.mlfq_rules_label):
+            label.config(foreground="black" if enabled else "gray")
     
     def add_process(self):
         try:
             pid = self.id_entry.get()
             arrival = int(self.arrival_entry.get())
-            burst = int(self.burst_entry.get())
+            bursts, devices = parse_bursts(self.burst_entry.get())
             priority = self.priority_entry.get()
             
             if not pid:
                 messagebox.showerror("Error", "El ID del proceso no puede estar vacío")
                 return
                 
-            if burst <= 0:
+            if len(bursts) % 2 == 0:
+                messagebox.showerror("Error", "Las ráfagas deben alternar CPU y E/S, empezando y terminando en CPU")
+                return
+                
+            if min(bursts) <= 0:
                 messagebox.showerror("Error", "El tiempo de ráfaga debe ser mayor que 0")
                 return
+            burst = sum(bursts[::2])
                 
             if arrival < 0:
                 messagebox.showerror("Error", "El tiempo de llegada no puede ser negativo")
@@ -167,18 +372,17 @@ class EnhancedProcessSchedulingSimulator:
                 
             priority = int(priority) if priority else 0
             
-            for item in self.process_tree.get_children():
-                if self.process_tree.item(item, "values")[0] == pid:
-                    messagebox.showerror("Error", f"El proceso con ID {pid} ya existe")
-                    return
+            if pid in self.processes:
+                messagebox.showerror("Error", f"El proceso con ID {pid} ya existe")
+                return
             
-            self.process_tree.insert("", tk.END, values=(pid, arrival, burst, priority))
-            self.processes.append({"id": pid, "arrival": arrival, "burst": burst, "priority": priority})
+            self.processes.append(pid, arrival, burst, priority, bursts, devices)
+            self.render_process_tree()
+            self.update_algorithm_choices()
             
-            try:
-                next_id = max(int(pid) for pid in [p["id"] for p in self.processes] if pid.isdigit()) + 1
-                self.current_id = next_id
-            except:
+            if self.processes.max_numeric_id is not None:
+                self.current_id = self.processes.max_numeric_id + 1
+            else:
                 self.current_id += 1
             self.id_entry.delete(0, tk.END)
             self.id_entry.insert(0, str(self.current_id))
@@ -191,39 +395,111 @@ class EnhancedProcessSchedulingSimulator:
             messagebox.showerror("Error", "Por favor ingrese valores numéricos válidos")
     
     def edit_process(self):
-        selected = self.process_tree.selection()
-        if not selected:
+        if not self.selected_pids:
             messagebox.showerror("Error", "Por favor seleccione un proceso para editar")
             return
             
-        item = selected[0]
-        values = self.process_tree.item(item, "values")
+        process = self.processes.get(next(iter(self.selected_pids)))
         
         self.id_entry.delete(0, tk.END)
-        self.id_entry.insert(0, values[0])
+        self.id_entry.insert(0, process["id"])
         self.arrival_entry.delete(0, tk.END)
-        self.arrival_entry.insert(0, values[1])
+        self.arrival_entry.insert(0, process["arrival"])
         self.burst_entry.delete(0, tk.END)
-        self.burst_entry.insert(0, values[2])
+        if "bursts" in process:
+            self.burst_entry.insert(0, format_bursts(process["bursts"], process["device"]))
+        else:
+            self.burst_entry.insert(0, process["burst"])
         self.priority_entry.delete(0, tk.END)
-        self.priority_entry.insert(0, values[3])
+        self.priority_entry.insert(0, process["priority"])
         
+        self.selected_pids = {process["id"]}
         self.delete_process()
     
     def delete_process(self):
-        selected = self.process_tree.selection()
-        if not selected:
+        if not self.selected_pids:
             messagebox.showerror("Error", "Por favor seleccione un proceso para eliminar")
             return
             
-        for item in selected:
-            pid = self.process_tree.item(item, "values")[0]
-            self.process_tree.delete(item)
-            self.processes = [p for p in self.processes if p["id"] != pid]
+        for pid in self.selected_pids:
+            self.processes.remove(pid)
+        self.selected_pids = set()
+        self.render_process_tree()
+        self.update_algorithm_choices()
     
-    def clear_processes(self):
+    def render_process_tree(self):
+        # Tabla virtual: solo se insertan las filas visibles del almacén
+        total = len(self.processes)
+        visible = self.tree_visible_rows
+        self.tree_offset = max(0, min(self.tree_offset, total - visible))
+        end = min(total, self.tree_offset + visible)
+        
         self.process_tree.delete(*self.process_tree.get_children())
-        self.processes = []
+        self.tree_pids = {}
+        selection = []
+        # window salta los procesos eliminados sin compactar el almacén, así que
+        # eliminar y redibujar no recorre todas las filas
+        for row, process in enumerate(self.processes.window(self.tree_offset, end - self.tree_offset),
+                                      self.tree_offset):
+            pid = process["id"]
+            burst = process["burst"]
+            if pid in self.processes.io:
+                burst = f"{burst} ({format_bursts(*self.processes.io[pid])})"
+            # El iid de cada fila es su posición en la tabla, no el ID mostrado
+            item = self.process_tree.insert("", tk.END, iid=str(row), values=(
+                pid, process["arrival"], burst, process["priority"]))
+            self.tree_pids[item] = pid
+            if pid in self.selected_pids:
+                selection.append(item)
+        if selection:
+            self.process_tree.selection_set(selection)
+        
+        if total > visible:
+            self.tree_scrollbar.set(self.tree_offset / total, end / total)
+        else:
+            self.tree_scrollbar.set(0, 1)
+    
+    def scroll_process_tree(self, offset):
+        offset = max(0, min(int(offset), len(self.processes) - self.tree_visible_rows))
+        if offset != self.tree_offset:
+            self.tree_offset = offset
+            self.render_process_tree()
+    
+    def on_tree_scrollbar(self, action, value, unit=None):
+        if action == "moveto":
+            self.scroll_process_tree(float(value) * len(self.processes))
+        elif action == "scroll":
+            step = self.tree_visible_rows if unit == "pages" else 1
+            self.scroll_process_tree(self.tree_offset + int(value) * step)
+    
+    def on_tree_wheel(self, event):
+        if event.num == 4 or event.delta > 0:
+            self.scroll_process_tree(self.tree_offset - 3)
+        else:
+            self.scroll_process_tree(self.tree_offset + 3)
+        return "break"
+    
+    def on_tree_resize(self, event):
+        style = ttk.Style()
+        row_height = int(style.lookup("Treeview", "rowheight") or 20)
+        # Se descuenta aproximadamente la altura del encabezado
+        visible = max(1, (event.height - 25) // row_height)
+        if visible != self.tree_visible_rows:
+            self.tree_visible_rows = visible
+            self.render_process_tree()
+    
+    def on_tree_select(self, event=None):
+        selected = self.process_tree.selection()
+        # Una selección vacía puede venir del redibujado; se conserva la anterior
+        if selected:
+            self.selected_pids = {self.tree_pids[item] for item in selected}
+    
+    def clear_processes(self):
+        self.processes.clear()
+        self.tree_offset = 0
+        self.selected_pids = set()
+        self.render_process_tree()
+        self.update_algorithm_choices()
         self.current_id = 1
         self.id_entry.delete(0, tk.END)
         self.id_entry.insert(0, "1")
@@ -238,57 +514,55 @@ class EnhancedProcessSchedulingSimulator:
             
         file_path = filedialog.asksaveasfilename(
             defaultextension=".json",
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            filetypes=[("JSON files", "*.json"), ("NumPy (binario)", "*.npz"), ("All files", "*.*")]
         )
         
         if file_path:
             try:
-                with open(file_path, "w") as f:
-                    json.dump(self.processes, f, indent=4)
+                if os.path.splitext(file_path)[1].lower() == ".npz":
+                    save_process_set(file_path, self.processes.to_process_set())
+                else:
+                    with open(file_path, "w") as f:
+                        json.dump(self.processes.to_dicts(), f, indent=4)
                 messagebox.showinfo("Éxito", "Procesos guardados correctamente")
             except Exception as e:
                 messagebox.showerror("Error", f"No se pudo guardar el archivo: {str(e)}")
     
     def load_processes(self):
+        # La carga (millones de filas tardan segundos) corre en segundo plano y se puede
+        # cancelar; la lista actual solo se reemplaza al terminar
+        if self.task_running():
+            return
         file_path = filedialog.askopenfilename(
-            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+            filetypes=[("Procesos", "*.json *.jsonl *.ndjson *.csv *.npz"), ("JSON files", "*.json"),
+                       ("JSON Lines", "*.jsonl *.ndjson"), ("CSV", "*.csv"), ("NumPy", "*.npz"), ("All files", "*.*")]
         )
         
         if file_path:
-            try:
-                with open(file_path, "r") as f:
-                    new_processes = json.load(f)
-                
-                valid = True
-                for p in new_processes:
-                    if not all(key in p for key in ["id", "arrival", "burst"]):
-                        valid = False
-                        break
-                    if "priority" not in p:
-                        p["priority"] = 0
-                
-                if not valid:
-                    messagebox.showerror("Error", "El archivo no contiene datos válidos de procesos")
-                    return
-                
-                self.clear_processes()
-                for p in new_processes:
-                    self.process_tree.insert("", tk.END, values=(p["id"], p["arrival"], p["burst"], p["priority"]))
-                self.processes = new_processes
-                
-                try:
-                    next_id = max(int(pid) for pid in [p["id"] for p in self.processes] if str(pid).isdigit()) + 1
-                    self.current_id = next_id
-                except:
-                    self.current_id = len(self.processes) + 1
-                self.id_entry.delete(0, tk.END)
-                self.id_entry.insert(0, str(self.current_id))
-                
-                messagebox.showinfo("Éxito", "Procesos cargados correctamente")
-            except Exception as e:
-                messagebox.showerror("Error", f"No se pudo cargar el archivo: {str(e)}")
+            self.start_task(
+                "Cargando procesos",
+                lambda task: ProcessStore(load_workload(file_path, progress=task.report)),
+                self.show_loaded_processes, "No se pudo cargar el archivo"
+            )
+    
+    def show_loaded_processes(self, processes):
+        self.clear_processes()
+        self.processes = processes
+        self.render_process_tree()
+        self.update_algorithm_choices()
+        
+        if self.processes.max_numeric_id is not None:
+            self.current_id = self.processes.max_numeric_id + 1
+        else:
+            self.current_id = len(self.processes) + 1
+        self.id_entry.delete(0, tk.END)
+        self.id_entry.insert(0, str(self.current_id))
+        
+        messagebox.showinfo("Éxito", "Procesos cargados correctamente")
     
     def run_simulation(self):
+        if self.task_running():
+            return
         if not self.processes:
             messagebox.showerror("Error", "No hay procesos para simular")
             return
@@ -300,422 +574,370 @@ class EnhancedProcessSchedulingSimulator:
         except ValueError:
             messagebox.showerror("Error", "Por favor ingrese un valor de quantum válido")
             return
+        if not (self.read_smp_settings() and self.read_mlfq_settings() and self.read_cost_settings()):
+            return
             
         algorithm = self.algorithm_var.get()
         
-        for widget in self.gantt_frame.winfo_children():
-            widget.destroy()
+        self.clear_gantt()
         
         self.metrics_text.config(state=tk.NORMAL)
         self.metrics_text.delete(1.0, tk.END)
         self.metrics_text.config(state=tk.DISABLED)
         
-        if algorithm == "FCFS":
-            results = self.fcfs_algorithm()
-        elif algorithm == "SJF":
-            results = self.sjf_algorithm()
-        elif algorithm == "Round Robin":
-            results = self.round_robin_algorithm()
-        elif algorithm == "Prioridades":
-            results = self.priority_algorithm()
-        else:
+        if algorithm not in ALGORITHMS:
             messagebox.showerror("Error", "Algoritmo no implementado")
             return
         
-        self.display_results(results)
-    
-    def run_algorithm(self):
-        algorithm = self.algorithm_var.get()
+        process_set = self.processes.to_process_set()
+        settings = self.settings_snapshot()
+        # La tarea llena su propia instrumentación; el panel de diagnóstico la lee recién
+        # cuando se muestra el resultado, en el hilo de Tk
+        instrumentation = Instrumentation(bool(self.profile_var.get()), bool(self.trace_memory_var.get()))
         
-        if algorithm == "FCFS":
-            return self.fcfs_algorithm()
-        elif algorithm == "SJF":
-            return self.sjf_algorithm()
-        elif algorithm == "Round Robin":
-            return self.round_robin_algorithm()
-        elif algorithm == "Prioridades":
-            return self.priority_algorithm()
-        else:
-            return []
-    
-    def fcfs_algorithm(self):
-        processes = sorted(self.processes.copy(), key=lambda x: x["arrival"])
-        timeline = []
-        current_time = 0
+        def work(task):
+            with instrumentation.phase("Simulación"):
+                timeline = self.simulate(settings, process_set, task.report, instrumentation)
+            return timeline, timeline_metrics(timeline, instrumentation)
         
-        for p in processes:
-            if current_time < p["arrival"]:
-                current_time = p["arrival"]
-            
-            timeline.append({
-                "process": p["id"],
-                "start": current_time,
-                "end": current_time + p["burst"],
-                "arrival": p["arrival"],
-                "burst": p["burst"],
-                "priority": p["priority"]
-            })
-            
-            current_time += p["burst"]
+        def show(result):
+            self.instrumentation = instrumentation
+            self.display_results(*result, settings)
         
-        return timeline
+        self.start_task(f"Simulando {algorithm}", work, show, "Error en la simulación")
     
-    def sjf_algorithm(self):
-        processes = sorted(self.processes.copy(), key=lambda x: (x["arrival"], x["burst"]))
-        timeline = []
-        current_time = 0
-        ready_queue = []
-        process_index = 0
-        
-        while process_index < len(processes) or ready_queue:
-            while process_index < len(processes) and processes[process_index]["arrival"] <= current_time:
-                ready_queue.append(processes[process_index])
-                process_index += 1
-            
-            if not ready_queue:
-                if process_index < len(processes):
-                    current_time = processes[process_index]["arrival"]
-                    continue
-                else:
-                    break
-            
-            ready_queue.sort(key=lambda x: x["burst"])
-            current_process = ready_queue.pop(0)
-            
-            timeline.append({
-                "process": current_process["id"],
-                "start": current_time,
-                "end": current_time + current_process["burst"],
-                "arrival": current_process["arrival"],
-                "burst": current_process["burst"],
-                "priority": current_process["priority"]
-            })
-            
-            current_time += current_process["burst"]
-        
+    def task_running(self):
+        # Se comprueba antes de leer la configuración, así un pedido rechazado no
+        # cambia los parámetros con que se muestra el resultado de la tarea en curso
+        if self.task is not None:
+            messagebox.showerror("Error", "Ya hay una simulación en curso")
+            return True
+        return False
+    
+    def settings_snapshot(self):
+        # Copia fija de la configuración leída: la tarea en segundo plano y el dibujo de
+        # su resultado la usan aunque el usuario cambie los campos mientras tanto
+        return {
+            "algorithm": self.algorithm_var.get(), "quantum": self.quantum, "cores": self.cores,
+            "per_core_queues": self.per_core_queues, "work_stealing": self.work_stealing, "mlfq": dict(self.mlfq),
+            "switch_cost": self.switch_cost, "warmup": self.warmup
+        }
+    
+    def read_smp_settings(self):
+        try:
+            self.cores = int(self.cores_entry.get())
+            if self.cores <= 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Error", "Por favor ingrese un número de núcleos válido")
+            return False
+        self.per_core_queues = self.queue_mode_var.get() == "Por núcleo"
+        self.work_stealing = bool(self.work_stealing_var.get())
+        return True
+    
+    def read_mlfq_settings(self):
+        try:
+            quanta = [int(quantum) for quantum in self.mlfq_quanta_entry.get().split(",")]
+            self.mlfq = mlfq_settings(quanta, int(self.boost_entry.get()), int(self.aging_entry.get()))
+        except ValueError:
+            messagebox.showerror("Error", "Por favor ingrese una configuración de MLFQ válida: quanta positivos "
+                                          "separados por comas y boost y envejecimiento enteros no negativos")
+            return False
+        return True
+    
+    def read_cost_settings(self):
+        try:
+            self.switch_cost = int(self.switch_cost_entry.get())
+            self.warmup = int(self.warmup_entry.get())
+            if self.switch_cost < 0 or self.warmup < 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Error", "Por favor ingrese costos de cambio de contexto enteros no negativos")
+            return False
+        return True
+    
+    def simulate(self, settings, process_set=None, progress=None, instrumentation=None):
+        # Primero la caché de resultados; si no está, el simulador incremental (un
+        # núcleo) o el motor SMP. settings es una copia de settings_snapshot; los
+        # contadores van a la instrumentación de la tarea que llama, no a la del panel.
+        # Solo con instrumentación los motores cuentan despachos y expropiaciones
+        if process_set is None:
+            process_set = self.processes.to_process_set()
+        algorithm, quantum, cores = settings["algorithm"], settings["quantum"], settings["cores"]
+        per_core_queues, work_stealing = settings["per_core_queues"], settings["work_stealing"]
+        mlfq, switch_cost, warmup = settings["mlfq"], settings["switch_cost"], settings["warmup"]
+        key = result_key(process_set, algorithm, quantum, switch_cost, cores, per_core_queues, work_stealing, mlfq,
+                         warmup)
+        entry = self.result_cache.get(key)
+        if instrumentation is not None:
+            instrumentation.count(cached=entry is not None and entry[0] is not None)
+        if entry is not None and entry[0] is not None:
+            return Timeline(process_set, **entry[0])
+        stats = instrumentation is not None
+        if cores > 1:
+            timeline = smp_algorithm(process_set, algorithm, cores, quantum, per_core_queues, work_stealing, progress,
+                                     switch_cost, warmup, stats=stats)
+        else:
+            simulator = self.simulators.setdefault(algorithm, IncrementalSimulator(algorithm))
+            timeline = simulator.run(process_set, quantum, switch_cost, progress, mlfq, warmup, stats)
+        self.result_cache.put(key, timeline)
         return timeline
     
-    def round_robin_algorithm(self):
-        processes = sorted(self.processes.copy(), key=lambda x: x["arrival"])
-        timeline = []
-        current_time = 0
-        ready_queue = deque()
-        process_index = 0
-        remaining_burst = {p["id"]: p["burst"] for p in processes}
-        process_info = {p["id"]: p for p in processes}
-        
-        while process_index < len(processes) or ready_queue:
-            while process_index < len(processes) and processes[process_index]["arrival"] <= current_time:
-                ready_queue.append(processes[process_index]["id"])
-                process_index += 1
-            
-            if not ready_queue:
-                if process_index < len(processes):
-                    current_time = processes[process_index]["arrival"]
-                    continue
-                else:
-                    break
-            
-            current_pid = ready_queue.popleft()
-            burst_time = remaining_burst[current_pid]
-            
-            exec_time = min(self.quantum, burst_time)
-            
-            timeline.append({
-                "process": current_pid,
-                "start": current_time,
-                "end": current_time + exec_time,
-                "arrival": process_info[current_pid]["arrival"],
-                "burst": process_info[current_pid]["burst"],
-                "priority": process_info[current_pid]["priority"]
-            })
-            
-            current_time += exec_time
-            remaining_burst[current_pid] -= exec_time
-            
-            while process_index < len(processes) and processes[process_index]["arrival"] <= current_time:
-                ready_queue.append(processes[process_index]["id"])
-                process_index += 1
-            
-            if remaining_burst[current_pid] > 0:
-                ready_queue.append(current_pid)
+    def start_task(self, description, work, on_done, error_title):
+        # work(task) corre en otro hilo sobre una copia fija de los procesos; on_done
+        # recibe el resultado en el hilo de Tk, que es el único que dibuja
+        if self.task_running():
+            return
+        self.task = BackgroundTask(work, description).start()
+        self.task_handlers = (on_done, error_title)
+        self.task_status.config(text=f"{description}...")
+        self.task_progress.config(value=0)
+        self.cancel_button.config(state=tk.NORMAL)
+        self.root.after(TASK_POLL_INTERVAL, self.poll_task)
+    
+    def poll_task(self):
+        task = self.task
+        on_done, error_title = self.task_handlers
+        if not task.finished:
+            self.task_progress.config(value=task.fraction * 100)
+            self.root.after(TASK_POLL_INTERVAL, self.poll_task)
+            return
         
-        return timeline
+        self.task = None
+        self.cancel_button.config(state=tk.DISABLED)
+        self.task_progress.config(value=0 if task.cancelled else 100)
+        if task.cancelled:
+            self.task_status.config(text=f"{task.description}: cancelado")
+        elif task.error is not None:
+            self.task_status.config(text="")
+            messagebox.showerror("Error", f"{error_title}: {str(task.error)}")
+        else:
+            self.task_status.config(text="")
+            on_done(task.result)
     
-    def priority_algorithm(self):
-        processes = sorted(self.processes.copy(), key=lambda x: x["arrival"])
-        timeline = []
-        current_time = 0
-        ready_queue = []
-        process_index = 0
-        current_process = None
-        remaining_burst = {p["id"]: p["burst"] for p in processes}
-
-        while process_index < len(processes) or ready_queue or current_process:
-            # Agregar procesos que han llegado al sistema
-            while process_index < len(processes) and processes[process_index]["arrival"] <= current_time:
-                ready_queue.append(processes[process_index])
-                process_index += 1
-
-            # Ordenar por prioridad (menor número = mayor prioridad)
-            ready_queue.sort(key=lambda x: x["priority"])
-
-            # Seleccionar el proceso con mayor prioridad (si hay uno)
-            if ready_queue:
-                next_process = ready_queue[0]
-                if current_process is None or next_process["priority"] < current_process["priority"]:
-                    if current_process:
-                        # Interrumpir el proceso actual y guardar su progreso
-                        timeline.append({
-                            "process": current_process["id"],
-                            "start": start_time,
-                            "end": current_time,
-                            "arrival": current_process["arrival"],
-                            "burst": current_process["burst"],
-                            "priority": current_process["priority"]
-                        })
-                        remaining_burst[current_process["id"]] -= (current_time - start_time)
-                        ready_queue.append(current_process)
-                    # Tomar el nuevo proceso de mayor prioridad
-                    current_process = next_process
-                    ready_queue.remove(next_process)
-                    start_time = current_time
-
-            # Si no hay proceso en ejecución, avanzar el tiempo
-            if current_process is None:
-                current_time += 1
-                continue
-
-            # Ejecutar el proceso actual por 1 unidad de tiempo
-            current_time += 1
-            remaining_burst[current_process["id"]] -= 1
-
-            # Si el proceso actual termina
-            if remaining_burst[current_process["id"]] == 0:
-                timeline.append({
-                    "process": current_process["id"],
-                    "start": start_time,
-                    "end": current_time,
-                    "arrival": current_process["arrival"],
-                    "burst": current_process["burst"],
-                    "priority": current_process["priority"]
-                })
-                current_process = None
-
-        return timeline
-
+    def cancel_task(self):
+        if self.task is not None:
+            # El motor se detiene en su siguiente punto de control
+            self.task.cancel()
+            self.task_status.config(text=f"{self.task.description}: cancelando...")
+            self.cancel_button.config(state=tk.DISABLED)
     
-    def display_results(self, timeline):
+    def display_results(self, timeline, metrics, settings):
+        # settings: la configuración con que se calculó el timeline (no la de los campos);
+        # metrics viene de timeline_metrics, calculado fuera del hilo de Tk
         if not timeline:
             messagebox.showerror("Error", "No se generó una línea de tiempo válida")
             return
-        
-        metrics = self.calculate_metrics(timeline)
+        self.timeline = timeline
+        self.timeline_info = settings
+        algorithm, mlfq = settings["algorithm"], settings["mlfq"]
         
         self.metrics_text.config(state=tk.NORMAL)
         self.metrics_text.delete(1.0, tk.END)
         
         self.metrics_text.insert(tk.END, "Métricas de desempeño:\n\n")
-        self.metrics_text.insert(tk.END, f"Algoritmo utilizado: {self.algorithm_var.get()}\n")
-        if self.algorithm_var.get() == "Round Robin":
-            self.metrics_text.insert(tk.END, f"Quantum: {self.quantum}\n")
+        self.metrics_text.insert(tk.END, f"Algoritmo utilizado: {algorithm}\n")
+        if algorithm == "Round Robin":
+            self.metrics_text.insert(tk.END, f"Quantum: {settings['quantum']}\n")
+        if algorithm == "MLFQ":
+            self.metrics_text.insert(tk.END, f"Quanta por nivel: {', '.join(map(str, mlfq['quanta']))}\n")
+            self.metrics_text.insert(
+                tk.END, f"Boost cada: {mlfq['boost_interval'] or 'nunca'}, "
+                        f"envejecimiento: {mlfq['aging'] or 'no'}\n")
+        if timeline.cpu is not None:
+            per_core_queues = settings["per_core_queues"]
+            queues = "por núcleo" if per_core_queues else "global"
+            stealing = ", con robo de trabajo" if per_core_queues and settings["work_stealing"] else ""
+            self.metrics_text.insert(tk.END, f"Núcleos: {timeline.cores} (cola {queues}{stealing})\n")
+        if settings["switch_cost"] or settings["warmup"]:
+            self.metrics_text.insert(
+                tk.END, f"Costo de cambio de contexto: {settings['switch_cost']}, "
+                        f"calentamiento: {settings['warmup']}\n")
         
         self.metrics_text.insert(tk.END, "\nTiempos por proceso:\n")
-        for pid, data in metrics["process_metrics"].items():
-            self.metrics_text.insert(tk.END, 
-                f"Proceso {pid}: Espera={data['wait_time']}, Respuesta={data['response_time']}, Retorno={data['turnaround_time']}\n")
+        listed = metrics["process_metrics"]
+        lines = [f"Proceso {pid}: Espera={data['wait_time']}, Respuesta={data['response_time']}, "
+                 f"Retorno={data['turnaround_time']}\n" for pid, data in listed.items()]
+        if metrics["completed"] > len(listed):
+            lines.append(f"… y {metrics['completed'] - len(listed)} más\n")
+        self.metrics_text.insert(tk.END, "".join(lines))
         
         self.metrics_text.insert(tk.END, "\nMétricas promedio:\n")
         self.metrics_text.insert(tk.END, f"Tiempo de espera promedio: {metrics['avg_wait_time']:.2f}\n")
         self.metrics_text.insert(tk.END, f"Tiempo de respuesta promedio: {metrics['avg_response_time']:.2f}\n")
         self.metrics_text.insert(tk.END, f"Tiempo de retorno promedio: {metrics['avg_turnaround_time']:.2f}\n")
         self.metrics_text.insert(tk.END, f"Uso de CPU: {metrics['cpu_usage']:.2f}%\n")
+        if "core_usage" in metrics:
+            for core, usage in enumerate(metrics["core_usage"]):
+                self.metrics_text.insert(tk.END, f"  CPU {core}: {usage:.2f}%\n")
+        if "device_usage" in metrics:
+            self.metrics_text.insert(tk.END, "Uso de dispositivos de E/S:\n")
+            for device, usage in metrics["device_usage"].items():
+                self.metrics_text.insert(tk.END, f"  {device}: {usage:.2f}%\n")
+        self.metrics_text.insert(tk.END, f"Throughput: {metrics['throughput']:.4f} procesos/unidad de tiempo\n")
+        self.metrics_text.insert(tk.END, f"Cambios de contexto: {metrics['context_switches']} "
+                                         f"(sobrecarga {metrics['overhead_pct']:.2f}%)\n")
+        
+        self.metrics_text.insert(tk.END, "\nPercentiles (p50 / p95 / p99):\n")
+        for name, key in (("Espera", "wait_time"), ("Respuesta", "response_time"), ("Retorno", "turnaround_time")):
+            self.metrics_text.insert(tk.END,
+                f"{name}: {metrics[f'p50_{key}']:.2f} / {metrics[f'p95_{key}']:.2f} / {metrics[f'p99_{key}']:.2f}\n")
         
         self.metrics_text.config(state=tk.DISABLED)
         
-        self.plot_enhanced_gantt_chart(timeline)
+        with self.instrumentation.phase("Gantt"):
+            self.plot_enhanced_gantt_chart(timeline, settings)
+        self.display_diagnostics()
     
-    def calculate_metrics(self, timeline):
-        process_info = {p["id"]: p for p in self.processes}
-        process_metrics = {}
-        
-        for pid in process_info:
-            process_metrics[pid] = {
-                "first_run": None,
-                "last_run": None,
-                "burst_time": process_info[pid]["burst"],
-                "arrival_time": process_info[pid]["arrival"]
-            }
+    def save_timeline(self):
+        if self.timeline is None:
+            messagebox.showerror("Error", "Ejecute una simulación antes de guardar el timeline")
+            return
         
-        for event in timeline:
-            pid = event["process"]
-            if process_metrics[pid]["first_run"] is None:
-                process_metrics[pid]["first_run"] = event["start"]
-            process_metrics[pid]["last_run"] = event["end"]
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".npz",
+            filetypes=[("NumPy (binario)", "*.npz"), ("CSV", "*.csv"), ("JSON Lines", "*.jsonl *.ndjson"),
+                       ("All files", "*.*")]
+        )
         
-        total_wait_time = 0
-        total_response_time = 0
-        total_turnaround_time = 0
-        total_cpu_time = 0
+        if file_path:
+            try:
+                if os.path.splitext(file_path)[1].lower() == ".npz":
+                    save_timeline(file_path, self.timeline, self.timeline_info)
+                else:
+                    # Un tramo por fila, para procesarlo con otras herramientas
+                    export_timeline(file_path, [self.timeline])
+                messagebox.showinfo("Éxito", "Timeline guardado correctamente")
+            except Exception as e:
+                messagebox.showerror("Error", f"No se pudo guardar el archivo: {str(e)}")
+    
+    def open_timeline(self):
+        # El timeline se abre mapeado en memoria y se muestra sin volver a simular; la
+        # lista de procesos no cambia
+        if self.task_running():
+            return
+        file_path = filedialog.askopenfilename(
+            filetypes=[("NumPy (binario)", "*.npz"), ("All files", "*.*")]
+        )
         
-        for pid, metrics in process_metrics.items():
-            if metrics["first_run"] is None:
-                continue
+        if file_path:
+            instrumentation = Instrumentation(bool(self.profile_var.get()), bool(self.trace_memory_var.get()))
+            # Los parámetros guardados solo describen el timeline en las métricas y el
+            # Gantt; los que falten se toman de la configuración actual
+            settings = self.settings_snapshot()
             
-            metrics["response_time"] = metrics["first_run"] - metrics["arrival_time"]
-            metrics["turnaround_time"] = metrics["last_run"] - metrics["arrival_time"]
-            metrics["wait_time"] = metrics["turnaround_time"] - metrics["burst_time"]
+            def work(task):
+                with instrumentation.phase("Carga"):
+                    timeline, info = load_timeline(file_path)
+                settings.update((name, info[name]) for name in list(settings) if info.get(name) is not None)
+                return timeline, timeline_metrics(timeline, instrumentation)
             
-            total_wait_time += metrics["wait_time"]
-            total_response_time += metrics["response_time"]
-            total_turnaround_time += metrics["turnaround_time"]
-            total_cpu_time += metrics["burst_time"]
-        
-        num_processes = len(process_metrics)
-        avg_wait_time = total_wait_time / num_processes
-        avg_response_time = total_response_time / num_processes
-        avg_turnaround_time = total_turnaround_time / num_processes
+            def show(result):
+                self.instrumentation = instrumentation
+                if settings["algorithm"] in ALGORITHMS:
+                    self.algorithm_var.set(settings["algorithm"])
+                    self.update_algorithm_settings()
+                self.display_results(*result, settings)
+            
+            self.start_task("Abriendo timeline", work, show, "No se pudo cargar el archivo")
+    
+    def display_diagnostics(self):
+        self.diagnostics_text.config(state=tk.NORMAL)
+        self.diagnostics_text.delete(1.0, tk.END)
+        self.diagnostics_text.insert(tk.END, "\n".join(self.instrumentation.report_lines()) + "\n")
+        self.diagnostics_text.config(state=tk.DISABLED)
+    
+    def export_diagnostics(self):
+        if not self.instrumentation.timers:
+            messagebox.showerror("Error", "Ejecute una simulación antes de exportar el diagnóstico")
+            return
         
-        total_time = max(event["end"] for event in timeline) if timeline else 0
-        cpu_usage = (total_cpu_time / total_time) * 100 if total_time > 0 else 0
+        file_path = filedialog.asksaveasfilename(
+            defaultextension=".json",
+            filetypes=[("JSON files", "*.json"), ("All files", "*.*")]
+        )
         
-        return {
-            "process_metrics": {pid: {
-                "wait_time": data["wait_time"],
-                "response_time": data["response_time"],
-                "turnaround_time": data["turnaround_time"]
-            } for pid, data in process_metrics.items()},
-            "avg_wait_time": avg_wait_time,
-            "avg_response_time": avg_response_time,
-            "avg_turnaround_time": avg_turnaround_time,
-            "cpu_usage": cpu_usage
-        }
+        if file_path:
+            try:
+                with open(file_path, "w") as f:
+                    json.dump(self.instrumentation.to_dict(), f, indent=4)
+                messagebox.showinfo("Éxito", "Diagnóstico exportado correctamente")
+            except Exception as e:
+                messagebox.showerror("Error", f"No se pudo guardar el archivo: {str(e)}")
     
-    def plot_enhanced_gantt_chart(self, timeline):
+    def clear_gantt(self):
+        # La animación se detiene antes de destruir su lienzo: su temporizador after()
+        # seguiría dibujando sobre widgets destruidos
+        if self.animation:
+            self.animation.stop()
+            self.animation = None
+        self.animation_running = False
         for widget in self.gantt_frame.winfo_children():
             widget.destroy()
+    
+    def plot_enhanced_gantt_chart(self, timeline, settings):
+        self.clear_gantt()
         
         if not timeline:
             return
         
+        plt = pyplot()
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+        from gantt import GanttHover, OverheadBars, WaitMarkers, draw_lanes
+        
         fig, ax = plt.subplots(figsize=(12, 5))
-        algorithm = self.algorithm_var.get()
+        algorithm = settings["algorithm"]
         algorithm_styles = {
             "FCFS": {"color": "tab:blue", "hatch": None, "alpha": 0.7},
             "SJF": {"color": "tab:green", "hatch": "//", "alpha": 0.7},
+            "SRTF": {"color": "tab:olive", "hatch": "\\\\", "alpha": 0.7},
             "Round Robin": {"color": "tab:orange", "hatch": "xx", "alpha": 0.7},
-            "Prioridades": {"color": "tab:purple", "hatch": "..", "alpha": 0.7}
+            "Prioridades": {"color": "tab:purple", "hatch": "..", "alpha": 0.7},
+            "MLFQ": {"color": "tab:cyan", "hatch": "++", "alpha": 0.7}
         }
         style = algorithm_styles.get(algorithm, {"color": "tab:blue", "hatch": None, "alpha": 0.7})
         
-        unique_processes = list(set(event["process"] for event in timeline))
-        color_map = plt.get_cmap('tab20', len(unique_processes))
-        
         ax.set_title(f"Diagrama de Gantt - Algoritmo {algorithm}", pad=20)
         ax.set_xlabel('Tiempo')
-        ax.set_yticks([1])
-        ax.set_yticklabels(['CPU'])
         ax.grid(True, axis='x', linestyle='--', alpha=0.6)
         
-        for i, event in enumerate(timeline):
-            pid = event["process"]
-            start = event["start"]
-            duration = event["end"] - start
-            color_idx = unique_processes.index(pid)
-            
-            rect = patches.Rectangle(
-                (start, 0), duration, 1,
-                facecolor=color_map(color_idx),
-                edgecolor='black',
-                linewidth=1,
-                label=pid,
-                alpha=style["alpha"],
-                hatch=style["hatch"]
-            )
-            ax.add_patch(rect)
-            
-            ax.text(start + duration/2, 0.5, pid, 
-                   ha='center', va='center', color='white', weight='bold', fontsize=10)
-            
-            if i < len(timeline) - 1:
-                ax.axvline(x=event["end"], color='gray', linestyle=':', linewidth=1, alpha=0.5)
-            
-            if "arrival" in event and event["arrival"] < start:
-                ax.axvline(x=event["arrival"], color='red', linestyle='--', linewidth=1, alpha=0.7)
-                ax.text(event["arrival"], 1.1, f"Llegada {pid}", 
-                       ha='center', va='bottom', color='red', fontsize=8)
-        
-        for p in self.processes:
-            first_run = next((e["start"] for e in timeline if e["process"] == p["id"]), None)
-            if first_run and first_run > p["arrival"]:
-                ax.axvspan(p["arrival"], first_run, color='gray', alpha=0.2, hatch='//')
-                ax.text((p["arrival"] + first_run)/2, 0.3, f"Espera {p['id']}", 
-                       ha='center', va='center', color='black', fontsize=8)
-        
-        max_time = max(event["end"] for event in timeline)
+        max_time = int(timeline.end.max())
         ax.set_xlim(0, max_time * 1.05)
-        ax.set_ylim(0, 1.2)
-        
-        handles = []
-        for i, pid in enumerate(unique_processes):
-            handles.append(patches.Patch(
-                facecolor=color_map(i),
-                edgecolor='black',
-                label=f"Proceso {pid}",
-                alpha=style["alpha"],
-                hatch=style["hatch"]
-            ))
-        
-        legend = ax.legend(
-            handles=handles, 
-            title="Procesos", 
-            bbox_to_anchor=(1.05, 1), 
-            loc='upper left',
-            fontsize=8
-        )
+        
+        # Un carril por núcleo; las capas se redibujan solas con el nivel de detalle
+        # que permite el zoom
+        lanes = draw_lanes(ax, timeline, alpha=style["alpha"], hatch=style["hatch"])
+        WaitMarkers(ax, timeline)
+        
+        handles = lanes[0].legend_handles(timeline.processes, style["alpha"], style["hatch"])
+        if handles and isinstance(lanes[-1], OverheadBars):
+            handles += lanes[-1].legend_handles()
+        if handles:
+            ax.legend(
+                handles=handles, 
+                title="Procesos", 
+                bbox_to_anchor=(1.05, 1), 
+                loc='upper left',
+                fontsize=8
+            )
         
         ax.text(
             0.98, 1.08, 
-            f"Algoritmo: {algorithm}\nQuantum: {self.quantum if algorithm == 'Round Robin' else 'N/A'}", 
+            f"Algoritmo: {algorithm}\nQuantum: {self.quantum_text(settings)}", 
             transform=ax.transAxes,
             ha='right',
             va='top',
             bbox=dict(boxstyle='round', facecolor='white', alpha=0.8)
         )
         
-        def on_hover(event):
-            if event.inaxes == ax:
-                for patch in ax.patches:
-                    if isinstance(patch, patches.Rectangle):
-                        contains, _ = patch.contains(event)
-                        if contains:
-                            pid = patch.get_label()
-                            process = next(p for p in self.processes if p["id"] == pid)
-                            patch.set_edgecolor('yellow')
-                            patch.set_linewidth(2)
-                            
-                            ax.annotate(
-                                f"Proceso {pid}\n"
-                                f"Llegada: {process['arrival']}\n"
-                                f"Ráfaga: {process['burst']}\n"
-                                f"Prioridad: {process.get('priority', 'N/A')}",
-                                xy=(patch.get_x() + patch.get_width()/2, 1.1),
-                                xytext=(10, 10),
-                                textcoords='offset points',
-                                bbox=dict(boxstyle='round', facecolor='white', alpha=0.9),
-                                arrowprops=dict(arrowstyle='->')
-                            )
-                        else:
-                            patch.set_edgecolor('black')
-                            patch.set_linewidth(1)
-                fig.canvas.draw_idle()
-        
-        fig.canvas.mpl_connect('motion_notify_event', on_hover)
+        # Matplotlib solo guarda referencias débiles a los métodos conectados
+        self.gantt_hover = GanttHover(ax, timeline)
         
         plt.tight_layout()
         
         canvas = FigureCanvasTkAgg(fig, master=self.gantt_frame)
-        canvas.draw()
+        with self.instrumentation.phase("Dibujo (canvas.draw)"):
+            canvas.draw()
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
         toolbar = NavigationToolbar2Tk(canvas, self.gantt_frame)
@@ -726,21 +948,46 @@ class EnhancedProcessSchedulingSimulator:
         self.current_ax = ax
         self.current_canvas = canvas
     
+    def quantum_text(self, settings):
+        if settings["algorithm"] == "Round Robin":
+            return settings["quantum"]
+        if settings["algorithm"] == "MLFQ":
+            return ",".join(map(str, settings["mlfq"]["quanta"]))
+        return "N/A"
+    
     def run_benchmark(self):
+        if self.task_running():
+            return
         if not self.processes:
             messagebox.showerror("Error", "No hay procesos para comparar")
             return
             
+        if not (self.read_smp_settings() and self.read_mlfq_settings() and self.read_cost_settings()):
+            return
+        # compare_algorithms elige los algoritmos que soportan la carga y los núcleos
+        process_set = self.processes.to_process_set()
+        settings = self.settings_snapshot()
+        options = {name: settings[name] for name in
+                   ("cores", "per_core_queues", "work_stealing", "mlfq", "switch_cost", "warmup")}
+        self.start_task(
+            "Comparando algoritmos",
+            lambda task: compare_algorithms(process_set, quantum=settings["quantum"], cache=self.result_cache,
+                                            progress=task.report, **options),
+            lambda results: self.display_benchmark(list(results), results), "Error en comparación"
+        )
+    
+    def display_benchmark(self, algorithms, results):
         for widget in self.compare_tab.winfo_children():
             widget.destroy()
         
+        plt = pyplot()
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+        
         try:
-            fig, axs = plt.subplots(4, 1, figsize=(12, 12))
-            algorithms = ["FCFS", "SJF", "Round Robin", "Prioridades"]
+            fig, axs = plt.subplots(len(algorithms), 1, figsize=(12, 3 * len(algorithms)))
             
             for i, algo in enumerate(algorithms):
-                self.algorithm_var.set(algo)
-                timeline = self.run_algorithm()
+                timeline, _ = results[algo]
                 self.plot_comparison_gantt(axs[i], timeline, algo)
             
             plt.tight_layout()
@@ -753,7 +1000,7 @@ class EnhancedProcessSchedulingSimulator:
             toolbar.update()
             canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
             
-            self.plot_metrics_comparison()
+            self.plot_metrics_comparison(results)
         except Exception as e:
             messagebox.showerror("Error", f"Error en comparación: {str(e)}")
 
@@ -766,65 +1013,42 @@ class EnhancedProcessSchedulingSimulator:
         algorithm_styles = {
             "FCFS": {"color": "tab:blue", "hatch": None, "alpha": 0.7},
             "SJF": {"color": "tab:green", "hatch": "//", "alpha": 0.7},
+            "SRTF": {"color": "tab:olive", "hatch": "\\\\", "alpha": 0.7},
             "Round Robin": {"color": "tab:orange", "hatch": "xx", "alpha": 0.7},
-            "Prioridades": {"color": "tab:purple", "hatch": "..", "alpha": 0.7}
+            "Prioridades": {"color": "tab:purple", "hatch": "..", "alpha": 0.7},
+            "MLFQ": {"color": "tab:cyan", "hatch": "++", "alpha": 0.7}
         }
         style = algorithm_styles.get(title, {"color": "tab:blue", "hatch": None, "alpha": 0.7})
         
-        unique_processes = list(set(event["process"] for event in timeline))
-        color_map = plt.get_cmap('tab20', len(unique_processes))
-        
         ax.set_title(title, pad=10)
-        ax.set_yticks([1])
-        ax.set_yticklabels(['CPU'])
         ax.grid(True, axis='x', linestyle='--', alpha=0.6)
         
-        for i, event in enumerate(timeline):
-            pid = event["process"]
-            start = event["start"]
-            duration = event["end"] - start
-            color_idx = unique_processes.index(pid)
-            
-            rect = patches.Rectangle(
-                (start, 0), duration, 1,
-                facecolor=color_map(color_idx),
-                edgecolor='black',
-                linewidth=1,
-                alpha=style["alpha"],
-                hatch=style["hatch"]
-            )
-            ax.add_patch(rect)
-            
-            if duration >= 2:
-                ax.text(start + duration/2, 0.5, pid, 
-                       ha='center', va='center', color='white', weight='bold', fontsize=8)
-            
-            if i < len(timeline) - 1:
-                ax.axvline(x=event["end"], color='gray', linestyle=':', linewidth=1, alpha=0.5)
-        
-        max_time = max(event["end"] for event in timeline)
+        max_time = int(timeline.end.max())
         ax.set_xlim(0, max_time * 1.05)
-        ax.set_ylim(0, 1.2)
+        
+        from gantt import draw_lanes
+        draw_lanes(ax, timeline, alpha=style["alpha"], hatch=style["hatch"], fontsize=8, min_label_width=2)
     
-    def plot_metrics_comparison(self):
-        if not self.processes:
+    def plot_metrics_comparison(self, results):
+        if not results:
             return
             
         for widget in self.metrics_tab.winfo_children():
             widget.destroy()
         
-        algorithms = ["FCFS", "SJF", "Round Robin", "Prioridades"]
+        algorithms = list(results)
         metrics = {'wait': [], 'response': [], 'turnaround': [], 'cpu_usage': []}
         
         for algo in algorithms:
-            self.algorithm_var.set(algo)
-            timeline = self.run_algorithm()
-            m = self.calculate_metrics(timeline)
+            _, m = results[algo]
             metrics['wait'].append(m['avg_wait_time'])
             metrics['response'].append(m['avg_response_time'])
             metrics['turnaround'].append(m['avg_turnaround_time'])
             metrics['cpu_usage'].append(m['cpu_usage'])
         
+        plt = pyplot()
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+        
         try:
             fig, ax = plt.subplots(figsize=(10, 6))
             x = np.arange(len(algorithms))
@@ -867,85 +1091,170 @@ class EnhancedProcessSchedulingSimulator:
         except Exception as e:
             messagebox.showerror("Error", f"Error en métricas: {str(e)}")
     
+    def run_quantum_sweep(self):
+        if self.task_running():
+            return
+        if not self.processes:
+            messagebox.showerror("Error", "No hay procesos para el barrido")
+            return
+        
+        try:
+            quanta = parse_int_range(self.sweep_entry.get())
+            switch_costs = parse_int_range(self.switch_costs_entry.get())
+            if quanta[0] <= 0 or switch_costs[0] < 0:
+                raise ValueError
+        except ValueError:
+            messagebox.showerror("Error", "Por favor ingrese rangos válidos de quanta y costos de cambio")
+            return
+        if not self.read_cost_settings():
+            return
+        
+        process_set = self.processes.to_process_set()
+        warmup = self.warmup
+        self.start_task(
+            "Barrido de quantum",
+            lambda task: quantum_sweep(process_set, quanta, switch_costs, cache=self.result_cache,
+                                       progress=task.report, warmup=warmup),
+            self.plot_quantum_sweep, "Error en el barrido"
+        )
+    
+    def plot_quantum_sweep(self, rows):
+        for widget in self.metrics_tab.winfo_children():
+            widget.destroy()
+        
+        plt = pyplot()
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg, NavigationToolbar2Tk
+        
+        fig, (ax, ax_switches) = plt.subplots(1, 2, figsize=(12, 6))
+        ax_overhead = ax_switches.twinx()
+        series = [("avg_wait_time", "Espera Promedio", "tab:blue"),
+                  ("avg_response_time", "Respuesta Promedio", "tab:orange"),
+                  ("avg_turnaround_time", "Retorno Promedio", "tab:green")]
+        line_styles = ["-", "--", ":", "-."]
+        
+        costs = sorted(set(row["switch_cost"] for row in rows))
+        for i, cost in enumerate(costs):
+            cost_rows = [row for row in rows if row["switch_cost"] == cost]
+            quanta = [row["quantum"] for row in cost_rows]
+            style = line_styles[i % len(line_styles)]
+            suffix = f" (costo {cost})" if len(costs) > 1 else ""
+            
+            for key, label, color in series:
+                ax.plot(quanta, [row[key] for row in cost_rows], linestyle=style, marker='o',
+                        color=color, label=label + suffix)
+            ax_switches.plot(quanta, [row["context_switches"] for row in cost_rows], linestyle=style,
+                             marker='o', color='tab:red', label=f"Cambios de contexto{suffix}")
+            ax_overhead.plot(quanta, [row["overhead_pct"] for row in cost_rows], linestyle=style,
+                             marker='s', color='tab:gray', label=f"Sobrecarga (%){suffix}")
+        
+        ax.set_title('Round Robin: métricas por quantum')
+        ax.set_xlabel('Quantum')
+        ax.set_ylabel('Tiempo')
+        ax.grid(True, linestyle='--', alpha=0.6)
+        ax.legend(fontsize=8)
+        
+        ax_switches.set_title('Round Robin: cambios de contexto por quantum')
+        ax_switches.set_xlabel('Quantum')
+        ax_switches.set_ylabel('Cambios de contexto')
+        ax_overhead.set_ylabel('Tiempo perdido en cambios (%)')
+        ax_switches.grid(True, linestyle='--', alpha=0.6)
+        lines = ax_switches.get_lines() + ax_overhead.get_lines()
+        ax_switches.legend(lines, [line.get_label() for line in lines], fontsize=8)
+        
+        plt.tight_layout()
+        
+        canvas = FigureCanvasTkAgg(fig, master=self.metrics_tab)
+        canvas.draw()
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        
+        toolbar = NavigationToolbar2Tk(canvas, self.metrics_tab)
+        toolbar.update()
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+    
     def toggle_animation(self):
         if not self.processes:
             messagebox.showerror("Error", "No hay procesos para animar")
             return
             
         if self.animation_running:
-            if self.animation and self.animation.event_source:
-                self.animation.event_source.stop()
-                self.animation = None
-            self.animation_running = False
-            for widget in self.gantt_frame.winfo_children():
-                widget.destroy()
+            self.clear_gantt()
+            return
+        if self.task_running():
+            return
+        if not (self.read_smp_settings() and self.read_mlfq_settings() and self.read_cost_settings()):
             return
             
-        for widget in self.gantt_frame.winfo_children():
-            widget.destroy()
+        settings = self.settings_snapshot()
+        process_set = self.processes.to_process_set()
+        self.start_task(
+            f"Preparando animación de {settings['algorithm']}",
+            lambda task: self.simulate(settings, process_set, task.report),
+            lambda timeline: self.start_animation(timeline, settings), "Error en la animación"
+        )
+    
+    def start_animation(self, timeline, settings):
+        self.clear_gantt()
         
-        timeline = self.run_algorithm()
         if not timeline:
             return
         
+        plt = pyplot()
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        from gantt import GanttPlayer
+        
         fig, ax = plt.subplots(figsize=(12, 5))
-        ax.set_title(f"Animación - Algoritmo {self.algorithm_var.get()}", pad=20)
+        ax.set_title(f"Animación - Algoritmo {settings['algorithm']}", pad=20)
         ax.set_xlabel('Tiempo')
-        ax.set_yticks([1])
-        ax.set_yticklabels(['CPU'])
         ax.grid(True, axis='x', linestyle='--', alpha=0.6)
         
-        max_time = max(event["end"] for event in timeline) if timeline else 10
+        max_time = int(timeline.end.max()) if timeline else 10
         ax.set_xlim(0, max_time * 1.05)
-        ax.set_ylim(0, 1.2)
-        
-        rects = []
-        for event in timeline:
-            pid = event["process"]
-            start = event["start"]
-            duration = event["end"] - start
-            
-            rect = patches.Rectangle(
-                (start, 0), duration, 1,
-                facecolor='gray',
-                edgecolor='black',
-                alpha=0.3
-            )
-            ax.add_patch(rect)
-            rects.append(rect)
-        
-        def init():
-            for rect in rects:
-                rect.set_width(0)
-            return rects
-        
-        def animate(i):
-            for j, rect in enumerate(rects):
-                if j <= i:
-                    event = timeline[j]
-                    pid = event["process"]
-                    start = event["start"]
-                    duration = event["end"] - start
-                    
-                    rect.set_width(duration)
-                    rect.set_x(start)
-                    rect.set_facecolor(plt.get_cmap('tab20')(j % 20))
-                    
-                    if j == i:
-                        ax.text(start + duration/2, 0.5, pid, 
-                               ha='center', va='center', color='white', weight='bold')
-            return rects
-        
-        self.animation = FuncAnimation(
-            fig, animate, frames=len(timeline),
-            init_func=init, blit=True, interval=500, repeat=False
-        )
+        
+        controls = ttk.Frame(self.gantt_frame)
+        controls.pack(side=tk.BOTTOM, fill=tk.X, padx=5, pady=2)
         
         canvas = FigureCanvasTkAgg(fig, master=self.gantt_frame)
+        self.animation = GanttPlayer(ax, timeline)
+        
+        # La barra sigue el avance y, al arrastrarla, salta a ese instante
+        progress = tk.DoubleVar(value=0)
+        self.animation.on_progress = progress.set
+        
+        self.pause_button = ttk.Button(controls, text="Pausa", width=10, command=self.toggle_animation_pause)
+        self.pause_button.pack(side=tk.LEFT, padx=2)
+        ttk.Label(controls, text="Velocidad (t/s):").pack(side=tk.LEFT, padx=2)
+        self.speed_entry = ttk.Entry(controls, width=8)
+        self.speed_entry.insert(0, f"{self.animation.speed:g}")
+        self.speed_entry.bind('<Return>', self.update_animation_speed)
+        self.speed_entry.pack(side=tk.LEFT, padx=2)
+        ttk.Scale(
+            controls, from_=0, to=self.animation.duration, variable=progress,
+            command=lambda value: self.animation.seek(value)
+        ).pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
+        
         canvas.draw()
         canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
         
+        self.animation.play()
         self.animation_running = True
+    
+    def toggle_animation_pause(self):
+        if not self.animation:
+            return
+        if self.animation.playing:
+            self.animation.pause()
+            self.pause_button.config(text="Reanudar")
+        else:
+            self.animation.play()
+            self.pause_button.config(text="Pausa")
+    
+    def update_animation_speed(self, event=None):
+        if not self.animation:
+            return
+        try:
+            self.animation.set_speed(float(self.speed_entry.get()))
+        except ValueError:
+            messagebox.showerror("Error", "Por favor ingrese una velocidad válida")
 
 if __name__ == "__main__":
     root = tk.Tk()
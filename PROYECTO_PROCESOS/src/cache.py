@@ -0,0 +1,143 @@
+"""Caché de resultados de simulación.
+
+La clave combina un hash del contenido de la carga de trabajo con el algoritmo y sus
+parámetros, de modo que repetir una ejecución o volver a un algoritmo ya simulado no
+recalcula nada. Los resultados recientes se guardan en memoria (LRU, limitada por el
+tamaño total de las columnas guardadas) y, si se indica un directorio, también en
+disco como archivos .npz que sobreviven entre sesiones.
+"""
+import hashlib
+import json
+import os
+from collections import OrderedDict
+
+import numpy as np
+
+
+# Se incrementa cuando cambia el formato de las entradas o el resultado de los motores
+CACHE_VERSION = 3
+# Memoria máxima de las entradas en memoria: un timeline de millones de tramos ocupa
+# decenas de MB, así que limitar la cantidad de entradas no basta
+MAX_BYTES = 256 * 2 ** 20
+# Columnas de Timeline.columns() que se guardan en disco
+TIMELINE_COLUMNS = ("pid", "start", "end", "cpu", "cores", "overhead",
+                    "io_pid", "io_device", "io_blocked", "io_start", "io_end")
+
+
+def result_key(processes, algorithm, quantum=2, switch_cost=0, cores=1, per_core_queues=False, work_stealing=False,
+               mlfq=None, warmup=0):
+    # El quantum solo afecta a Round Robin; el resto de algoritmos comparte la entrada
+    if algorithm != "Round Robin":
+        quantum = None
+    params = [CACHE_VERSION, algorithm, quantum, switch_cost]
+    if cores != 1:
+        params += [cores, bool(per_core_queues), bool(work_stealing)]
+    if algorithm == "MLFQ":
+        # None son los parámetros por defecto del motor
+        params.append(mlfq)
+    if warmup:
+        params.append(["warmup", warmup])
+    params = json.dumps(params)
+    return hashlib.blake2b(f"{processes.digest()}:{params}".encode(), digest_size=16).hexdigest()
+
+
+class ResultCache:
+    def __init__(self, max_bytes=MAX_BYTES, directory=None):
+        self.max_bytes = max_bytes
+        self.directory = directory
+        self.hits = 0
+        self.misses = 0
+        # Bytes de las columnas de las entradas en memoria (las métricas son pequeñas)
+        self.nbytes = 0
+        self._entries = OrderedDict()
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, f"{key}.npz")
+
+    @staticmethod
+    def _entry_bytes(entry):
+        columns = entry[0]
+        if columns is None:
+            return 0
+        return sum(column.nbytes for column in columns.values() if isinstance(column, np.ndarray))
+
+    def _remember(self, key, entry):
+        previous = self._entries.pop(key, None)
+        if previous is not None:
+            self.nbytes -= self._entry_bytes(previous)
+        self._entries[key] = entry
+        self.nbytes += self._entry_bytes(entry)
+        # Se descartan las menos usadas; una entrada más grande que el límite no se
+        # conserva en memoria (sí en disco, si hay directorio)
+        while self._entries and self.nbytes > self.max_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self.nbytes -= self._entry_bytes(evicted)
+
+    def _load(self, key):
+        try:
+            with np.load(self._path(key), allow_pickle=False) as data:
+                metrics = json.loads(data["metrics"].tobytes().decode()) if "metrics" in data else None
+                columns = {name: data[name] for name in TIMELINE_COLUMNS if name in data} if "pid" in data else None
+                if columns is not None and "cores" in columns:
+                    columns["cores"] = int(columns["cores"])
+                return columns, metrics
+        except (OSError, KeyError, ValueError):
+            # Entrada inexistente o dañada: se trata como fallo de caché
+            return None
+
+    def _store(self, key, columns, metrics):
+        arrays = {}
+        if columns is not None:
+            arrays.update(columns)
+            if "cores" in columns:
+                arrays["cores"] = np.int64(columns["cores"])
+        if metrics is not None:
+            arrays["metrics"] = np.frombuffer(json.dumps(metrics).encode(), dtype=np.uint8)
+        # Se escribe a un temporal y se renombra para no dejar archivos a medias
+        temporary = self._path(key) + ".tmp"
+        with open(temporary, "wb") as f:
+            np.savez(f, **arrays)
+        os.replace(temporary, self._path(key))
+
+    def get(self, key):
+        # Devuelve (columnas del timeline, métricas) o None. Una entrada puede tener solo el
+        # timeline (guardada desde la interfaz) o solo las métricas (barridos)
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        elif self.directory:
+            entry = self._load(key)
+            if entry is not None:
+                self._remember(key, entry)
+        if entry is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return entry
+
+    def put(self, key, timeline, metrics=None):
+        columns = None if timeline is None else timeline.columns()
+        previous = self._entries.get(key)
+        if previous is not None:
+            # No se pierde lo que ya se sabía de esta misma simulación
+            columns = columns if columns is not None else previous[0]
+            metrics = metrics if metrics is not None else previous[1]
+        self._remember(key, (columns, metrics))
+        if self.directory:
+            try:
+                self._store(key, columns, metrics)
+            except OSError:
+                # Sin espacio o sin permisos: la caché en memoria sigue funcionando
+                pass
+
+    def clear(self):
+        self._entries.clear()
+        self.nbytes = 0
+
+    def __contains__(self, key):
+        return key in self._entries or bool(self.directory and os.path.exists(self._path(key)))
+
+    def __len__(self):
+        return len(self._entries)
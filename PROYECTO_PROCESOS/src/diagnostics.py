@@ -0,0 +1,151 @@
+"""Instrumentación de una simulación: tiempos por fase, contadores y, opcionalmente,
+perfil con cProfile y memoria con tracemalloc.
+
+Las fases pueden anidarse (el dibujo dentro del Gantt, por ejemplo); cada una acumula
+solo su tiempo propio, así que la suma de las fases es el tiempo total medido. Cada
+fase recuerda el hilo en que corrió: la simulación y las métricas corren en el hilo
+de la tarea y el Gantt en el de Tk, y cada hilo tiene su propio perfil. Los
+contadores de despachos, expropiaciones y operaciones sobre el montículo de listos
+los llevan los motores en sus bucles cuando se les pide (stats=True) y llegan en
+Timeline.stats; un resultado tomado de la caché no los tiene.
+"""
+import cProfile
+import pstats
+import threading
+import time
+import tracemalloc
+from contextlib import contextmanager
+
+
+# Funciones del perfil que se informan, por tiempo propio
+PROFILE_ROWS = 15
+COUNTER_LABELS = {
+    "slices": "Tramos emitidos",
+    "dispatches": "Despachos",
+    "preemptions": "Expropiaciones (incluye quantum agotado)",
+    "heap_pushes": "Inserciones en el montículo de listos",
+    "heap_pops": "Extracciones del montículo de listos",
+    "context_switches": "Cambios de contexto",
+    "io_operations": "Operaciones de E/S",
+    "cached": "Resultado tomado de la caché",
+}
+
+
+def timeline_counters(timeline):
+    # Tramos y operaciones de E/S salen del timeline; los contadores del motor, de
+    # timeline.stats si el motor los llevó
+    counters = {"slices": len(timeline)}
+    if timeline.stats is not None:
+        counters.update(timeline.stats)
+    counters["io_operations"] = 0 if timeline.io_pid is None else len(timeline.io_pid)
+    return counters
+
+
+class Instrumentation:
+    def __init__(self, profile=False, trace_memory=False):
+        self.timers = {}
+        # Hilo en que corrió cada fase
+        self.threads = {}
+        # Memoria máxima (MB) asignada durante cada fase, si trace_memory
+        self.memory = {}
+        self.counters = {}
+        self.profile = profile
+        # Un perfil por hilo: cProfile solo mide el hilo que lo activa
+        self.profilers = {}
+        self.trace_memory = trace_memory
+        # tracemalloc es global: solo se detiene si lo inició esta instrumentación
+        self._started_tracemalloc = False
+        # Por hilo, [nombre, inicio, tiempo de las fases anidadas, memoria máxima de las
+        # fases anidadas] de cada fase abierta
+        self._stacks = {}
+
+    @contextmanager
+    def phase(self, name):
+        thread = threading.current_thread()
+        stack = self._stacks.setdefault(thread.ident, [])
+        outermost = not stack
+        if outermost:
+            if self.trace_memory and not tracemalloc.is_tracing():
+                tracemalloc.start()
+                self._started_tracemalloc = True
+            if self.profile:
+                self.profilers.setdefault(thread.name, cProfile.Profile()).enable()
+        baseline = 0
+        if self.trace_memory:
+            # reset_peak borra el máximo de la fase externa; por eso cada fase pasa el suyo
+            # a la que la contiene
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            self.memory.setdefault(name, 0.0)
+        # Las fases se informan en el orden en que empiezan
+        self.timers.setdefault(name, 0.0)
+        self.threads[name] = thread.name
+        frame = [name, time.perf_counter(), 0.0, baseline]
+        stack.append(frame)
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - frame[1]
+            stack.pop()
+            self.timers[name] += elapsed - frame[2]
+            if stack:
+                stack[-1][2] += elapsed
+            if self.trace_memory:
+                peak = max(tracemalloc.get_traced_memory()[1], frame[3])
+                self.memory[name] = max(self.memory[name], (peak - baseline) / 2 ** 20)
+                if stack:
+                    stack[-1][3] = max(stack[-1][3], peak)
+            if outermost:
+                del self._stacks[thread.ident]
+                if self.profile:
+                    self.profilers[thread.name].disable()
+                if self._started_tracemalloc and not any(self._stacks.values()):
+                    tracemalloc.stop()
+                    self._started_tracemalloc = False
+
+    def count(self, **counters):
+        self.counters.update(counters)
+
+    def profile_rows(self, thread, limit=PROFILE_ROWS):
+        try:
+            stats = pstats.Stats(self.profilers[thread]).stats
+        except (KeyError, TypeError):
+            # El hilo no se perfiló o su perfil está vacío
+            return []
+        rows = sorted(stats.items(), key=lambda item: item[1][2], reverse=True)[:limit]
+        return [
+            {"function": pstats.func_std_string(function), "calls": calls, "total_time": total,
+             "cumulative_time": cumulative}
+            for function, (_, calls, total, cumulative, _) in rows
+        ]
+
+    def to_dict(self):
+        return {
+            "timers": self.timers,
+            "threads": self.threads,
+            "total_time": sum(self.timers.values()),
+            "counters": self.counters,
+            "memory_mb": self.memory if self.trace_memory else None,
+            "profile": {thread: self.profile_rows(thread) for thread in self.profilers} if self.profile else None,
+        }
+
+    def report_lines(self):
+        lines = ["Tiempos por fase:"]
+        for name, seconds in self.timers.items():
+            lines.append(f"  {name}: {seconds * 1000:.1f} ms (hilo {self.threads[name]})")
+        lines.append(f"  Total: {sum(self.timers.values()) * 1000:.1f} ms")
+        if self.counters:
+            lines.append("Contadores:")
+            for name, value in self.counters.items():
+                if isinstance(value, bool):
+                    value = "sí" if value else "no"
+                lines.append(f"  {COUNTER_LABELS.get(name, name)}: {value}")
+        if self.trace_memory:
+            lines.append("Memoria máxima por fase (tracemalloc):")
+            for name, megabytes in self.memory.items():
+                lines.append(f"  {name}: {megabytes:.2f} MB")
+        for thread in self.profilers:
+            lines.append(f"Perfil del hilo {thread} (cProfile, por tiempo propio):")
+            for row in self.profile_rows(thread):
+                lines.append(f"  {row['total_time'] * 1000:9.1f} ms {row['calls']:>9}  {row['function']}")
+        return lines
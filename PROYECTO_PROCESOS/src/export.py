@@ -0,0 +1,75 @@
+"""Exportación de timelines por bloques a CSV, JSON Lines o .npz (columnar).
+
+Recibe los bloques de iter_algorithm (o una lista con un Timeline completo) y los
+escribe a medida que llegan, así que la memoria usada no depende de la duración de
+la simulación. CSV y JSON Lines tienen una fila por tramo con los mismos campos que
+Timeline.to_dicts; el .npz es el formato binario de storage.py y es el único que
+guarda también las operaciones de E/S.
+
+Ejemplo: python src/scheduler.py carga.npz -a "Round Robin" --export timeline.csv
+"""
+import csv
+import json
+import os
+from itertools import chain
+
+from loaders import CSV_EXTENSIONS, JSONL_EXTENSIONS, NPZ_EXTENSIONS
+from storage import save_timeline_chunks
+
+
+EXPORT_EXTENSIONS = CSV_EXTENSIONS + JSONL_EXTENSIONS + NPZ_EXTENSIONS
+
+
+def _fields(timeline):
+    fields = ["process", "start", "end", "arrival", "burst", "priority"]
+    if timeline.cpu is not None:
+        fields.append("cpu")
+    if timeline.overhead is not None:
+        fields.append("overhead")
+    return fields
+
+
+def _rows(timeline):
+    processes = timeline.processes
+    columns = [timeline.ids.tolist(), timeline.start.tolist(), timeline.end.tolist(),
+               processes.arrival[timeline.pid].tolist(), processes.burst[timeline.pid].tolist(),
+               processes.priority[timeline.pid].tolist()]
+    if timeline.cpu is not None:
+        columns.append(timeline.cpu.tolist())
+    if timeline.overhead is not None:
+        columns.append(timeline.overhead.tolist())
+    return columns
+
+
+def export_timeline(file_path, chunks, info=None):
+    # Formato según la extensión; info (algoritmo y parámetros) solo se guarda en .npz.
+    # Devuelve la cantidad de tramos escritos
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension not in EXPORT_EXTENSIONS:
+        raise ValueError(f"Formato de exportación no soportado: {extension or file_path} "
+                         f"(use {', '.join(EXPORT_EXTENSIONS)})")
+    if extension in NPZ_EXTENSIONS:
+        return save_timeline_chunks(file_path, chunks, info)
+
+    # El primer bloque se pide antes de crear el archivo: si el motor rechaza los
+    # parámetros no queda un archivo vacío
+    chunks = iter(chunks)
+    first = next(chunks)
+    fields = _fields(first)
+    written = 0
+    with open(file_path, "w", newline="" if extension in CSV_EXTENSIONS else None) as f:
+        if extension in CSV_EXTENSIONS:
+            writer = csv.writer(f)
+            writer.writerow(fields)
+            for chunk in chain([first], chunks):
+                writer.writerows(zip(*_rows(chunk)))
+                written += len(chunk)
+        else:
+            template = "{{" + ", ".join(f'"{field}": {{}}' for field in fields) + "}}\n"
+            for chunk in chain([first], chunks):
+                columns = _rows(chunk)
+                if chunk.processes.ids.dtype.kind not in "iu":
+                    columns[0] = [json.dumps(pid) for pid in columns[0]]
+                f.write("".join(template.format(*row) for row in zip(*columns)))
+                written += len(chunk)
+    return written
@@ -0,0 +1,468 @@
+"""Diagrama de Gantt con colecciones y nivel de detalle.
+
+Todas las barras de un carril se dibujan con una sola PolyCollection y el color de
+cada tramo sale de un índice precalculado. Al cambiar la vista (zoom o
+desplazamiento) solo se reconstruye la ventana visible: si hay más tramos que
+píxeles se agrupan por columna de píxeles, y las etiquetas, separadores y marcas
+de llegada se omiten cuando no cabrían.
+"""
+import time
+
+import matplotlib as mpl
+import numpy as np
+from matplotlib.collections import LineCollection, PolyCollection
+from matplotlib.colors import ListedColormap
+from matplotlib.patches import Patch, Rectangle
+from matplotlib.transforms import Bbox, TransformedBbox
+
+
+# Por encima de estos tramos visibles se agrupa por píxel o se omite el detalle
+MAX_BARS = 4000
+MAX_SEPARATORS = 400
+MAX_LABELS = 80
+MAX_WAITS = 40
+MAX_LEGEND_ENTRIES = 30
+# Distancia vertical entre los carriles de dos núcleos (cada barra mide 1)
+LANE_SPACING = 1.5
+# Intervalo entre cuadros de la animación (ms)
+FRAME_INTERVAL = 40
+# Sin velocidad indicada la animación completa dura este número de segundos
+DEFAULT_PLAYBACK_SECONDS = 20
+OVERHEAD_COLOR = "0.35"
+OVERHEAD_HATCH = "////"
+
+
+def process_colors(timeline, cmap="tab20"):
+    # Índice de color por tramo según la fila del proceso, sin buscar en listas
+    rows, color_index = np.unique(timeline.pid, return_inverse=True)
+    return rows, color_index, mpl.colormaps[cmap].resampled(max(len(rows), 1))
+
+
+def _rectangles(starts, ends, y, height):
+    verts = np.empty((len(starts), 4, 2))
+    verts[:, 0, 0] = verts[:, 1, 0] = starts
+    verts[:, 2, 0] = verts[:, 3, 0] = ends
+    verts[:, 0, 1] = verts[:, 3, 1] = y
+    verts[:, 1, 1] = verts[:, 2, 1] = y + height
+    return verts
+
+
+def lane_indices(timeline):
+    # Índices de los tramos de cada núcleo, en orden de inicio; None = todos (un núcleo)
+    if timeline.cpu is None:
+        return [None]
+    order = np.argsort(timeline.cpu, kind="stable")
+    bounds = np.searchsorted(timeline.cpu[order], np.arange(timeline.cores + 1))
+    return [order[bounds[lane]:bounds[lane + 1]] for lane in range(timeline.cores)]
+
+
+def lane_y(timeline, lane):
+    # CPU 0 queda arriba
+    return 0 if timeline.cpu is None else (timeline.cores - 1 - lane) * LANE_SPACING
+
+
+def lanes_height(timeline):
+    return 1 if timeline.cpu is None else (timeline.cores - 1) * LANE_SPACING + 1
+
+
+def draw_lanes(ax, timeline, **style):
+    # Un carril por núcleo con los mismos colores por proceso; también fija el eje y.
+    # Si hay costo de cambio de contexto, al final de la lista van sus bloques
+    colors = process_colors(timeline)
+    lanes = [
+        GanttBars(ax, timeline, y=lane_y(timeline, lane), indices=indices, colors=colors, **style)
+        for lane, indices in enumerate(lane_indices(timeline))
+    ]
+    if timeline.overhead is not None:
+        overhead_style = {name: value for name, value in style.items() if name in ("animated", "clip_box")}
+        lanes += [
+            OverheadBars(ax, timeline, y=lane_y(timeline, lane), indices=indices, **overhead_style)
+            for lane, indices in enumerate(lane_indices(timeline))
+        ]
+    if timeline.cpu is None:
+        ax.set_yticks([1])
+        ax.set_yticklabels(['CPU'])
+        ax.set_ylim(0, 1.2)
+    else:
+        ax.set_yticks([lane_y(timeline, lane) + 0.5 for lane in range(timeline.cores)])
+        ax.set_yticklabels([f"CPU {lane}" for lane in range(timeline.cores)])
+        ax.set_ylim(0, lanes_height(timeline) + 0.2)
+    return lanes
+
+
+def _visible_range(starts, ends, ax):
+    # Los tramos están ordenados por inicio y no se solapan dentro de un carril
+    x0, x1 = ax.get_xlim()
+    return int(np.searchsorted(ends, x0, "right")), int(np.searchsorted(starts, x1, "left"))
+
+
+class GanttBars:
+    # Con details=False no se dibujan separadores ni etiquetas
+    details = True
+
+    def __init__(self, ax, timeline, y=0, height=1, alpha=0.7, hatch=None, fontsize=10, min_label_width=0,
+                 animated=False, clip_box=None, indices=None, colors=None):
+        # indices: tramos de este carril (None = todos); colors: process_colors compartido
+        self.ax = ax
+        self.animated = animated
+        self.clip_box = clip_box
+        self.processes = timeline.processes
+        self.y = y
+        self.height = height
+        self.fontsize = fontsize
+        self.min_label_width = min_label_width
+        self._load(timeline, indices, colors)
+
+        self.bars = PolyCollection([], edgecolors="black", linewidths=1, alpha=alpha, hatch=hatch)
+        self.separators = LineCollection([], colors="gray", linestyles=":", linewidths=1, alpha=0.5)
+        ax.add_collection(self.bars)
+        ax.add_collection(self.separators)
+        self._prepare(self.bars)
+        self._prepare(self.separators)
+        self.labels = []
+        self.aggregated = False
+        ax.callbacks.connect("xlim_changed", lambda ax: self.update())
+        self.update()
+
+    def _load(self, timeline, indices, colors):
+        self.rows, self.color_index, self.cmap = colors or process_colors(timeline)
+        if indices is None:
+            self.pid, self.starts, self.ends = timeline.pid, timeline.start, timeline.end
+        else:
+            self.pid, self.starts, self.ends = timeline.pid[indices], timeline.start[indices], timeline.end[indices]
+            self.color_index = self.color_index[indices]
+
+    def _prepare(self, artist):
+        artist.set_animated(self.animated)
+        if self.clip_box is not None:
+            artist.set_clip_box(self.clip_box)
+            artist.set_clip_on(True)
+        return artist
+
+    def artists(self):
+        return [self.bars, self.separators, *self.labels]
+
+    def update(self):
+        first, last = _visible_range(self.starts, self.ends, self.ax)
+        if last - first > MAX_BARS:
+            self._draw_aggregated()
+        else:
+            self._draw_slices(first, last)
+
+    def _draw_slices(self, first, last):
+        self.aggregated = False
+        starts, ends = self.starts[first:last], self.ends[first:last]
+        self.bars.set_verts(_rectangles(starts, ends, self.y, self.height))
+        self.bars.set_facecolors(self.cmap(self.color_index[first:last]))
+        self.bars.set_linewidths(1)
+        if not self.details:
+            return
+
+        # El último tramo del timeline no lleva separador
+        boundaries = self.ends[first:min(last, len(self.ends) - 1)]
+        if len(boundaries) > MAX_SEPARATORS:
+            boundaries = boundaries[:0]
+        self.separators.set_segments(
+            [((x, self.y), (x, self.y + 1.2 * self.height)) for x in boundaries.tolist()])
+
+        self._clear_labels()
+        if last - first <= MAX_LABELS:
+            ids = self.processes.ids[self.pid[first:last]]
+            for pid, start, end in zip(ids.tolist(), starts.tolist(), ends.tolist()):
+                if end - start >= self.min_label_width:
+                    self.labels.append(self._prepare(self.ax.text(
+                        start + (end - start) / 2, self.y + self.height / 2, pid,
+                        ha='center', va='center', color='white', weight='bold', fontsize=self.fontsize)))
+
+    def _draw_aggregated(self):
+        # Una muestra por columna de píxeles: cada columna toma el color del tramo que
+        # ocupa su inicio y las columnas contiguas del mismo tramo se unen en una barra
+        self.aggregated = True
+        x0, x1 = self.ax.get_xlim()
+        columns = max(int(self.ax.bbox.width), 200)
+        edges = np.linspace(x0, x1, columns + 1)
+        slice_index = np.searchsorted(self.starts, edges[:-1], "right") - 1
+        covered = (slice_index >= 0) & (self.ends[np.maximum(slice_index, 0)] > edges[:-1])
+        color = np.where(covered, self.color_index[np.maximum(slice_index, 0)], -1)
+
+        run_starts = np.flatnonzero(np.r_[True, color[1:] != color[:-1]])
+        run_ends = np.r_[run_starts[1:], columns]
+        keep = color[run_starts] >= 0
+        run_starts, run_ends = run_starts[keep], run_ends[keep]
+
+        self.bars.set_verts(_rectangles(edges[run_starts], edges[run_ends], self.y, self.height))
+        self.bars.set_facecolors(self.cmap(color[run_starts]))
+        self.bars.set_linewidths(0)
+        self.separators.set_segments([])
+        self._clear_labels()
+
+    def _clear_labels(self):
+        for label in self.labels:
+            label.remove()
+        self.labels = []
+
+    def legend_handles(self, processes, alpha=0.7, hatch=None):
+        if len(self.rows) > MAX_LEGEND_ENTRIES:
+            return []
+        return [
+            Patch(facecolor=self.cmap(i), edgecolor='black', label=f"Proceso {pid}", alpha=alpha, hatch=hatch)
+            for i, pid in enumerate(processes.ids[self.rows].tolist())
+        ]
+
+
+class OverheadBars(GanttBars):
+    # Bloques grises con el tiempo perdido en cambios de contexto antes de cada tramo;
+    # mismo nivel de detalle que las barras de los procesos. El rayado multiplica el
+    # costo de cada dibujo, así que solo se usa en vistas estáticas con los tramos uno
+    # por uno; animadas o agregadas, los bloques llevan solo su color plano
+    details = False
+
+    def __init__(self, ax, timeline, y=0, height=1, animated=False, clip_box=None, indices=None):
+        super().__init__(ax, timeline, y, height, alpha=0.8, animated=animated, clip_box=clip_box, indices=indices)
+
+    def update(self):
+        super().update()
+        self.bars.set_hatch(None if self.animated or self.aggregated else OVERHEAD_HATCH)
+
+    def _load(self, timeline, indices, colors):
+        self.starts, self.ends = timeline.overhead_blocks(indices)
+        self.rows = np.empty(0, dtype=np.int64)
+        self.color_index = np.zeros(len(self.starts), dtype=np.int64)
+        self.cmap = ListedColormap([OVERHEAD_COLOR])
+
+    def legend_handles(self, processes=None, alpha=0.8, hatch=OVERHEAD_HATCH):
+        return [Patch(facecolor=OVERHEAD_COLOR, edgecolor='black', label="Cambio de contexto", alpha=alpha,
+                      hatch=hatch)]
+
+
+class IntervalIndex:
+    # Índice ordenado de los tramos de un carril: búsqueda binaria sobre los inicios.
+    # Devuelve la posición del tramo en el timeline completo
+    def __init__(self, timeline, indices=None):
+        self.indices = indices
+        self.starts = timeline.start if indices is None else timeline.start[indices]
+        self.ends = timeline.end if indices is None else timeline.end[indices]
+
+    def find(self, x):
+        i = int(np.searchsorted(self.starts, x, "right")) - 1
+        if i < 0 or x >= self.ends[i]:
+            return None
+        return i if self.indices is None else int(self.indices[i])
+
+
+class GanttHover:
+    # Resalta el tramo bajo el cursor y muestra sus datos. La anotación y el resaltado
+    # son artistas únicos y animados: se redibujan con blitting sobre el fondo guardado
+    # en lugar de redibujar toda la figura en cada movimiento
+    def __init__(self, ax, timeline):
+        self.ax = ax
+        self.timeline = timeline
+        self.lanes = [(lane_y(timeline, lane), IntervalIndex(timeline, indices))
+                      for lane, indices in enumerate(lane_indices(timeline))]
+        self.current = None
+        self.background = None
+
+        self.highlight = Rectangle((0, 0), 0, 1, fill=False, edgecolor='yellow', linewidth=2,
+                                   visible=False, animated=True)
+        ax.add_patch(self.highlight)
+        self.annotation = ax.annotate(
+            "", xy=(0, 1.1), xytext=(10, 10), textcoords='offset points',
+            bbox=dict(boxstyle='round', facecolor='white', alpha=0.9),
+            arrowprops=dict(arrowstyle='->'), visible=False, animated=True
+        )
+        figure = ax.figure
+        figure.canvas.mpl_connect('draw_event', self.on_draw)
+        figure.canvas.mpl_connect('motion_notify_event', self.on_move)
+
+    def on_draw(self, event):
+        self.background = event.canvas.copy_from_bbox(self.ax.figure.bbox)
+        self._draw_artists(event.canvas)
+
+    def on_move(self, event):
+        i = None
+        if event.inaxes == self.ax:
+            for y, index in self.lanes:
+                if y <= event.ydata <= y + 1:
+                    i = index.find(event.xdata)
+                    break
+        if i == self.current:
+            return
+        self.current = i
+
+        if i is not None:
+            processes = self.timeline.processes
+            row = self.timeline.pid[i]
+            start, end = int(self.timeline.start[i]), int(self.timeline.end[i])
+            self.annotation.set_text(
+                f"Proceso {processes.ids[row]}\n"
+                f"Llegada: {processes.arrival[row]}\n"
+                f"Ráfaga: {processes.burst[row]}\n"
+                f"Prioridad: {processes.priority[row]}"
+            )
+            self.annotation.xy = ((start + end) / 2, y + 1.1)
+            self.highlight.set_xy((start, y))
+            self.highlight.set_width(end - start)
+        self.annotation.set_visible(i is not None)
+        self.highlight.set_visible(i is not None)
+        self._blit(event.canvas)
+
+    def _blit(self, canvas):
+        if self.background is None or not canvas.supports_blit:
+            canvas.draw_idle()
+            return
+        canvas.restore_region(self.background)
+        self._draw_artists(canvas)
+        canvas.blit(self.ax.figure.bbox)
+
+    def _draw_artists(self, canvas):
+        self.ax.draw_artist(self.highlight)
+        self.ax.draw_artist(self.annotation)
+
+
+class GanttPlayer:
+    # Animación que avanza por tiempo simulado: en cada cuadro se calcula el instante
+    # según el reloj real y la velocidad (unidades de tiempo por segundo), así que un
+    # cuadro lento no frena la animación sino que se salta. Las barras se dibujan una
+    # sola vez y se descubren recortándolas hasta el instante actual; solo los
+    # artistas animados se redibujan con blitting
+    def __init__(self, ax, timeline, speed=None, on_progress=None, **bar_style):
+        self.ax = ax
+        self.duration = int(timeline.end.max()) if len(timeline) else 0
+        self.speed = speed or max(self.duration / DEFAULT_PLAYBACK_SECONDS, 1)
+        self.on_progress = on_progress
+        self.time = 0.0
+        self.playing = False
+        self.background = None
+        self._last_tick = None
+
+        # Caja de recorte en tiempo simulado; al mover su borde derecho se descubren los
+        # tramos sin tocar las barras
+        self.clip = Bbox([[0, 0], [0, 1]])
+        self.lanes = draw_lanes(ax, timeline, animated=True,
+                                clip_box=TransformedBbox(self.clip, ax.get_xaxis_transform()), **bar_style)
+        self.cursor = ax.axvline(0, color='red', linewidth=1.5, animated=True)
+        self.clock = ax.text(0.01, 1.02, "", transform=ax.transAxes, ha='left', va='bottom', animated=True)
+
+        ax.figure.canvas.mpl_connect('draw_event', self.on_draw)
+        self.timer = None
+
+    def play(self):
+        if self.timer is None:
+            # El temporizador se pide al lienzo definitivo (p.ej. Tk), que puede
+            # sustituir al de la figura después de crear el reproductor
+            self.timer = self.ax.figure.canvas.new_timer(interval=FRAME_INTERVAL)
+            self.timer.add_callback(self.step)
+        if self.time >= self.duration:
+            self.time = 0.0
+        self.playing = True
+        self._last_tick = time.perf_counter()
+        self.timer.start()
+
+    def pause(self):
+        self.playing = False
+        if self.timer is not None:
+            self.timer.stop()
+
+    def stop(self):
+        self.pause()
+        self.on_progress = None
+
+    def seek(self, t):
+        self.time = min(max(float(t), 0.0), self.duration)
+        self._last_tick = time.perf_counter()
+        self.render()
+
+    def set_speed(self, speed):
+        if speed <= 0:
+            raise ValueError("La velocidad debe ser mayor que 0")
+        self.speed = speed
+
+    def step(self):
+        now = time.perf_counter()
+        if self.playing and self._last_tick is not None:
+            self.time = min(self.time + (now - self._last_tick) * self.speed, self.duration)
+        self._last_tick = now
+        if self.time >= self.duration:
+            self.pause()
+        self.render()
+
+    def on_draw(self, event):
+        self.background = event.canvas.copy_from_bbox(self.ax.figure.bbox)
+        self._draw_artists()
+
+    def render(self):
+        self.clip.x1 = self.time
+        self.cursor.set_xdata([self.time, self.time])
+        self.clock.set_text(f"t = {self.time:.1f}")
+
+        canvas = self.ax.figure.canvas
+        if self.background is None or not canvas.supports_blit:
+            canvas.draw_idle()
+        else:
+            canvas.restore_region(self.background)
+            self._draw_artists()
+            canvas.blit(self.ax.figure.bbox)
+        if self.on_progress is not None:
+            self.on_progress(self.time)
+
+    def _draw_artists(self):
+        for artist in [artist for lane in self.lanes for artist in lane.artists()] + [self.cursor, self.clock]:
+            self.ax.draw_artist(artist)
+
+
+class WaitMarkers:
+    # Llegadas y esperas hasta la primera ejecución de cada proceso que tuvo que esperar
+    def __init__(self, ax, timeline):
+        # Las marcas cruzan todos los carriles
+        self.ax = ax
+        self.y = 0
+        self.height = lanes_height(timeline)
+        processes = timeline.processes
+        first_run = np.full(len(processes), np.iinfo(np.int64).max, dtype=np.int64)
+        last_start = np.full(len(processes), -1, dtype=np.int64)
+        np.minimum.at(first_run, timeline.pid, timeline.start)
+        np.maximum.at(last_start, timeline.pid, timeline.start)
+
+        arrived_before_run = last_start > processes.arrival
+        self.arrival_ids = processes.ids[arrived_before_run]
+        self.arrivals = processes.arrival[arrived_before_run]
+        waited = (last_start >= 0) & (first_run > processes.arrival)
+        self.wait_ids = processes.ids[waited]
+        self.wait_starts = processes.arrival[waited]
+        self.wait_ends = first_run[waited]
+
+        self.arrival_lines = LineCollection([], colors='red', linestyles='--', linewidths=1, alpha=0.7)
+        self.waits = PolyCollection([], facecolors='gray', edgecolors='gray', linewidths=0, alpha=0.2, hatch='//')
+        ax.add_collection(self.arrival_lines)
+        ax.add_collection(self.waits)
+        self.labels = []
+        ax.callbacks.connect("xlim_changed", lambda ax: self.update())
+        self.update()
+
+    def update(self):
+        x0, x1 = self.ax.get_xlim()
+        for label in self.labels:
+            label.remove()
+        self.labels = []
+
+        arrivals = np.flatnonzero((self.arrivals >= x0) & (self.arrivals <= x1))
+        waits = np.flatnonzero((self.wait_starts < x1) & (self.wait_ends > x0))
+        # Demasiadas marcas solo producirían una mancha uniforme
+        if len(arrivals) > MAX_WAITS:
+            arrivals = arrivals[:0]
+        if len(waits) > MAX_WAITS:
+            waits = waits[:0]
+
+        self.arrival_lines.set_segments(
+            [((x, self.y), (x, self.y + 1.2 * self.height)) for x in self.arrivals[arrivals].tolist()])
+        self.waits.set_verts(_rectangles(self.wait_starts[waits], self.wait_ends[waits],
+                                         self.y, 1.2 * self.height))
+
+        if len(arrivals) + len(waits) <= MAX_LABELS:
+            for pid, arrival in zip(self.arrival_ids[arrivals].tolist(), self.arrivals[arrivals].tolist()):
+                self.labels.append(self.ax.text(arrival, self.y + 1.1 * self.height, f"Llegada {pid}",
+                                                ha='center', va='bottom', color='red', fontsize=8))
+            for pid, start, end in zip(self.wait_ids[waits].tolist(), self.wait_starts[waits].tolist(),
+                                       self.wait_ends[waits].tolist()):
+                self.labels.append(self.ax.text((start + end) / 2, self.y + 0.3 * self.height, f"Espera {pid}",
+                                                ha='center', va='center', color='black', fontsize=8))
@@ -0,0 +1,159 @@
+"""Generador de cargas de trabajo sintéticas para pruebas de escala.
+
+Las llegadas siguen un proceso de Poisson (intervalos exponenciales) y las ráfagas
+una distribución exponencial, de Pareto (cola pesada) o bimodal (muchos procesos
+cortos y algunos largos). Todo se genera por bloques de GENERATOR_CHUNK procesos con
+un único generador de NumPy, así que la misma semilla produce la misma carga sin
+importar el formato de salida.
+
+Ejemplo: python src/generator.py 10000000 -o carga.npz --seed 1 --burst pareto
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+import numpy as np
+
+from loaders import CSV_EXTENSIONS, JSONL_EXTENSIONS, NPZ_EXTENSIONS, concat_process_sets
+from model import ProcessSet
+from storage import save_process_set
+
+
+GENERATOR_CHUNK = 1 << 20
+BURST_DISTRIBUTIONS = ("exponential", "pareto", "bimodal")
+PRIORITY_DISTRIBUTIONS = ("uniform", "geometric", "none")
+
+
+def _bursts(rng, count, distribution, mean_burst, pareto_shape, long_burst, long_fraction):
+    if distribution == "exponential":
+        values = rng.exponential(mean_burst, count)
+    elif distribution == "pareto":
+        # Escala elegida para que la media sea mean_burst
+        values = (rng.pareto(pareto_shape, count) + 1) * (mean_burst * (pareto_shape - 1) / pareto_shape)
+    else:
+        values = rng.exponential(np.where(rng.random(count) < long_fraction, long_burst, mean_burst))
+    return np.maximum(np.rint(values), 1).astype(np.int64)
+
+
+def _priorities(rng, count, distribution, levels):
+    if distribution == "uniform":
+        return rng.integers(0, levels, count, dtype=np.int64)
+    if distribution == "geometric":
+        # Pocos procesos muy prioritarios (valor bajo) y la mayoría en el último nivel
+        return levels - np.minimum(rng.geometric(0.5, count), levels).astype(np.int64)
+    return np.zeros(count, dtype=np.int64)
+
+
+def iter_workload(count, seed=None, arrival_rate=1.0, burst_distribution="exponential", mean_burst=5.0,
+                  pareto_shape=1.5, long_burst=None, long_fraction=0.1, priority_distribution="uniform",
+                  priority_levels=5):
+    # Genera la carga en bloques (ProcessSet) con IDs 1..count y la primera llegada en 0.
+    # Con la distribución bimodal, long_burst es la media de los procesos largos (por
+    # defecto 10 veces mean_burst) y long_fraction su proporción
+    if count < 0:
+        raise ValueError("La cantidad de procesos no puede ser negativa")
+    if arrival_rate <= 0 or mean_burst <= 0:
+        raise ValueError("La tasa de llegadas y la ráfaga media deben ser mayores que 0")
+    if burst_distribution not in BURST_DISTRIBUTIONS:
+        raise ValueError(f"Distribución de ráfagas desconocida: {burst_distribution}")
+    if priority_distribution not in PRIORITY_DISTRIBUTIONS:
+        raise ValueError(f"Distribución de prioridades desconocida: {priority_distribution}")
+    if burst_distribution == "pareto" and pareto_shape <= 1:
+        raise ValueError("El parámetro de forma de Pareto debe ser mayor que 1 (media finita)")
+    if not 0 <= long_fraction <= 1:
+        raise ValueError("La proporción de procesos largos debe estar entre 0 y 1")
+    if priority_levels <= 0:
+        raise ValueError("Debe haber al menos un nivel de prioridad")
+    long_burst = 10 * mean_burst if long_burst is None else long_burst
+
+    rng = np.random.default_rng(seed)
+    clock = None
+    for first in range(0, count, GENERATOR_CHUNK):
+        size = min(GENERATOR_CHUNK, count - first)
+        gaps = rng.exponential(1 / arrival_rate, size)
+        if clock is None:
+            gaps[0] = 0.0
+            clock = 0.0
+        times = np.cumsum(gaps) + clock
+        clock = float(times[-1])
+        yield ProcessSet(
+            np.arange(first + 1, first + size + 1, dtype=np.int64),
+            np.floor(times).astype(np.int64),
+            _bursts(rng, size, burst_distribution, mean_burst, pareto_shape, long_burst, long_fraction),
+            _priorities(rng, size, priority_distribution, priority_levels)
+        )
+
+
+def generate_workload(count, seed=None, **options):
+    return concat_process_sets(iter_workload(count, seed, **options))
+
+
+def _columns(processes):
+    return processes.ids.tolist(), processes.arrival.tolist(), processes.burst.tolist(), processes.priority.tolist()
+
+
+def write_workload(file_path, chunks):
+    # Escribe los bloques en el formato que indica la extensión; JSON Lines y CSV se
+    # escriben bloque a bloque, .npz y JSON necesitan la carga completa
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension in NPZ_EXTENSIONS:
+        processes = concat_process_sets(chunks)
+        save_process_set(file_path, processes)
+        return len(processes)
+
+    written = 0
+    with open(file_path, "w", newline="" if extension in CSV_EXTENSIONS else None) as f:
+        if extension in JSONL_EXTENSIONS:
+            for chunk in chunks:
+                f.write("".join(
+                    f'{{"id": {pid}, "arrival": {arrival}, "burst": {burst}, "priority": {priority}}}\n'
+                    for pid, arrival, burst, priority in zip(*_columns(chunk))))
+                written += len(chunk)
+        elif extension in CSV_EXTENSIONS:
+            f.write("id,arrival,burst,priority\n")
+            for chunk in chunks:
+                f.write("".join(f"{pid},{arrival},{burst},{priority}\n" for pid, arrival, burst, priority in
+                                zip(*_columns(chunk))))
+                written += len(chunk)
+        else:
+            processes = concat_process_sets(chunks)
+            json.dump(processes.to_dicts(), f, indent=4)
+            written = len(processes)
+    return written
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Generador de cargas de trabajo sintéticas")
+    parser.add_argument("count", type=int, help="cantidad de procesos")
+    parser.add_argument("-o", "--output", required=True,
+                        help="archivo de salida: .npz (arreglos NumPy), .jsonl, .csv o .json")
+    parser.add_argument("--seed", type=int, help="semilla para reproducir la misma carga")
+    parser.add_argument("--arrival-rate", type=float, default=1.0, help="llegadas por unidad de tiempo (Poisson)")
+    parser.add_argument("--burst", default="exponential", choices=BURST_DISTRIBUTIONS,
+                        help="distribución de las ráfagas")
+    parser.add_argument("--mean-burst", type=float, default=5.0, help="ráfaga media (de los procesos cortos si es bimodal)")
+    parser.add_argument("--pareto-shape", type=float, default=1.5, help="forma de Pareto (> 1; menor = cola más pesada)")
+    parser.add_argument("--long-burst", type=float, help="ráfaga media de los procesos largos (bimodal)")
+    parser.add_argument("--long-fraction", type=float, default=0.1, help="proporción de procesos largos (bimodal)")
+    parser.add_argument("--priority", default="uniform", choices=PRIORITY_DISTRIBUTIONS,
+                        help="distribución de las prioridades")
+    parser.add_argument("--priority-levels", type=int, default=5, help="cantidad de niveles de prioridad")
+    args = parser.parse_args(argv)
+
+    started = time.perf_counter()
+    try:
+        chunks = iter_workload(
+            args.count, args.seed, arrival_rate=args.arrival_rate, burst_distribution=args.burst,
+            mean_burst=args.mean_burst, pareto_shape=args.pareto_shape, long_burst=args.long_burst,
+            long_fraction=args.long_fraction, priority_distribution=args.priority,
+            priority_levels=args.priority_levels)
+        written = write_workload(args.output, chunks)
+    except (OSError, ValueError) as e:
+        parser.exit(1, f"Error: {e}\n")
+    sys.stderr.write(f"{written} procesos escritos en {args.output} ({time.perf_counter() - started:.2f} s)\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+"""Simulación incremental: tras editar procesos, se reanuda desde el último punto de
+control anterior al primer cambio en lugar de recalcular todo desde t=0.
+
+Los puntos de control guardan posiciones en el orden de llegada, no filas del
+ProcessSet: el prefijo del orden que no cambió conserva sus posiciones aunque el
+almacén de la interfaz, al compactar los procesos eliminados, desplace las filas
+que los siguen.
+"""
+import numpy as np
+
+from model import Timeline
+from scheduler import (arrival_order, mlfq_algorithm, mlfq_settings, priority_algorithm, round_robin_algorithm,
+                       run_algorithm, sjf_algorithm, srtf_algorithm)
+from smp import smp_algorithm
+
+
+# Campos del estado que guardan filas (las demás entradas son tiempos o contadores)
+_ROW_LISTS = ("queue",)
+_ROW_FIELDS = ("current", "last_row")
+
+
+def _common_prefix(old_columns, new_columns):
+    # Primera posición del orden de llegada donde los procesos difieren
+    length = min(len(old_columns[0]), len(new_columns[0]))
+    mismatch = np.zeros(length, dtype=bool)
+    for old, new in zip(old_columns, new_columns):
+        if old.dtype.kind != new.dtype.kind:
+            return 0
+        mismatch |= old[:length] != new[:length]
+    differences = np.flatnonzero(mismatch)
+    return int(differences[0]) if len(differences) else length
+
+
+class _CheckpointLog(list):
+    # Los motores guardan un punto de control cada pocos miles de tramos; al hacerlo
+    # se informa del avance (procesos admitidos) y se da ocasión de cancelar
+    def __init__(self, total, progress):
+        super().__init__()
+        self.total = total
+        self.progress = progress
+
+    def append(self, checkpoint):
+        super().append(checkpoint)
+        self.progress(checkpoint["process_index"], self.total)
+
+
+class IncrementalSimulator:
+    def __init__(self, algorithm):
+        self.algorithm = algorithm
+        self.params = None
+        self.resumed_from = None
+        self._columns = None
+        self._checkpoints = []
+        self._timeline = None
+
+    def _run(self, processes, resume, checkpoints, stats):
+        quantum, switch_cost, warmup, mlfq = self.params
+        if self.algorithm == "Round Robin":
+            return round_robin_algorithm(processes, quantum, switch_cost, warmup, resume, checkpoints, stats=stats)
+        if self.algorithm == "SJF":
+            return sjf_algorithm(processes, switch_cost, warmup, resume, checkpoints, stats=stats)
+        if self.algorithm == "SRTF":
+            return srtf_algorithm(processes, switch_cost, warmup, resume, checkpoints, stats=stats)
+        if self.algorithm == "Prioridades":
+            return priority_algorithm(processes, switch_cost, warmup, resume, checkpoints, stats=stats)
+        if self.algorithm == "MLFQ":
+            return mlfq_algorithm(processes, mlfq["quanta"], mlfq["boost_interval"], mlfq["aging"], switch_cost, warmup,
+                                  resume, checkpoints, stats=stats)
+        # FCFS está vectorizado: recalcularlo completo es más barato que reanudarlo
+        return run_algorithm(self.algorithm, processes, quantum, switch_cost, warmup=warmup, stats=stats)
+
+    def _restore(self, checkpoint, order):
+        # Convierte posiciones del orden de llegada en filas del ProcessSet actual
+        state = dict(checkpoint)
+        for field in _ROW_LISTS:
+            if state.get(field) is not None:
+                state[field] = order[state[field]].tolist()
+        for field in _ROW_FIELDS:
+            if state.get(field) is not None:
+                state[field] = int(order[state[field]])
+        slices = checkpoint["slices"]
+        state["pid"] = order[self._timeline[0][:slices]]
+        state["start"] = self._timeline[1][:slices]
+        state["end"] = self._timeline[2][:slices]
+        if self._timeline[3] is not None:
+            state["overhead"] = self._timeline[3][:slices]
+        return state
+
+    @staticmethod
+    def _to_positions(checkpoint, positions):
+        for field in _ROW_LISTS:
+            if checkpoint.get(field) is not None:
+                checkpoint[field] = positions[np.asarray(checkpoint[field], dtype=np.int64)]
+        for field in _ROW_FIELDS:
+            if checkpoint.get(field) is not None:
+                checkpoint[field] = int(positions[checkpoint[field]])
+        return checkpoint
+
+    def run(self, processes, quantum=2, switch_cost=0, progress=None, mlfq=None, warmup=0, stats=False):
+        # progress(admitidos, total) puede lanzar una excepción para cancelar; el estado
+        # guardado solo se reemplaza al terminar, así que una cancelación no lo corrompe.
+        # Con stats=True el timeline trae los contadores del motor; los puntos de control
+        # los guardan siempre, así que al reanudar cuentan toda la simulación
+        if processes.io is not None:
+            # Las ráfagas de E/S las simula completas el motor de eventos de smp.py
+            self.params = self._columns = self.resumed_from = None
+            self._checkpoints = []
+            return smp_algorithm(processes, self.algorithm, 1, quantum, progress=progress, switch_cost=switch_cost,
+                                 warmup=warmup, stats=stats)
+        order = arrival_order(self.algorithm, processes)
+        columns = (processes.ids[order], processes.arrival[order], processes.burst[order], processes.priority[order])
+
+        mlfq = mlfq_settings(**(mlfq or {})) if self.algorithm == "MLFQ" else None
+        if self.params != (quantum, switch_cost, warmup, mlfq):
+            self.params = (quantum, switch_cost, warmup, mlfq)
+            self._columns = None
+            self._checkpoints = []
+
+        resume = None
+        kept = []
+        self.resumed_from = None
+        if self._columns is not None:
+            prefix = _common_prefix(self._columns, columns)
+            if prefix == len(self._columns[0]) == len(columns[0]):
+                # Sin cambios: se reutiliza el resultado anterior (con sus contadores, si
+                # se pidieron en esa ejecución)
+                pid, start, end, overhead, counters = self._timeline
+                self.resumed_from = int(end.max()) if len(end) else 0
+                return Timeline(processes, order[pid], start, end, overhead=overhead, stats=counters if stats else None)
+
+            # Lo que ocurrió antes de la primera llegada afectada sigue siendo válido
+            affected = [column[prefix] for column in (self._columns[1], columns[1]) if prefix < len(column)]
+            affected_time = min(affected)
+            kept = [checkpoint for checkpoint in self._checkpoints if checkpoint["time"] < affected_time]
+            if kept:
+                resume = self._restore(kept[-1], order)
+                self.resumed_from = kept[-1]["time"]
+                kept = kept[:-1]
+
+        checkpoints = [] if progress is None else _CheckpointLog(len(order), progress)
+        timeline = self._run(processes, resume, checkpoints, stats)
+
+        positions = np.empty(len(order), dtype=np.int64)
+        positions[order] = np.arange(len(order))
+        self._checkpoints = kept + [self._to_positions(checkpoint, positions) for checkpoint in checkpoints]
+        self._columns = columns
+        self._timeline = (positions[timeline.pid], timeline.start, timeline.end, timeline.overhead, timeline.stats)
+        return timeline
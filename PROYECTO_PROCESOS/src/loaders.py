@@ -0,0 +1,179 @@
+"""Carga de cargas de trabajo (JSON, JSON Lines, CSV y .npz) hacia ProcessSet.
+
+Los formatos por líneas se leen en bloques de CHUNK_SIZE registros: cada bloque se
+valida y se convierte a columnas NumPy antes de leer el siguiente, de modo que nunca
+existe una lista completa de diccionarios en memoria. Un .npz (como los que escribe
+generator.py) ya guarda las columnas como arreglos id, arrival, burst y priority, y
+se abre mapeado en memoria (ver storage.py).
+
+Un proceso puede alternar ráfagas de CPU y E/S con "bursts": [cpu, e/s, cpu, ...]
+(empieza y termina en CPU) y "device": el nombre del dispositivo de sus ráfagas de
+E/S o una lista con uno por ráfaga. En ese caso "burst", si aparece, debe ser la suma
+de las ráfagas de CPU. En CSV y en la interfaz la secuencia se escribe como texto,
+p. ej. "5, 3:disco, 2" (ver parse_bursts).
+"""
+import csv
+import json
+import os
+import re
+from itertools import islice
+
+import numpy as np
+
+from model import DEFAULT_DEVICE, IOBursts, ProcessSet, concat_ids
+from storage import load_process_set
+
+
+CHUNK_SIZE = 65536
+JSONL_EXTENSIONS = (".jsonl", ".ndjson")
+CSV_EXTENSIONS = (".csv",)
+NPZ_EXTENSIONS = (".npz",)
+
+
+def _is_int(value):
+    return isinstance(value, int) and not isinstance(value, bool)
+
+
+def _normalize_bursts(p):
+    bursts = p["bursts"]
+    if not isinstance(bursts, list) or len(bursts) % 2 == 0 or not all(_is_int(b) and b > 0 for b in bursts):
+        raise ValueError(f"Proceso {p.get('id')}: las ráfagas deben ser enteros mayores que 0 que alternan "
+                         "CPU y E/S, empezando y terminando en CPU")
+    cpu = sum(bursts[::2])
+    if "burst" not in p:
+        p["burst"] = cpu
+    elif p["burst"] != cpu:
+        raise ValueError(f"Proceso {p.get('id')}: el tiempo de ráfaga debe ser la suma de las ráfagas de CPU")
+    device = p.get("device", DEFAULT_DEVICE)
+    if isinstance(device, list):
+        if len(device) != len(bursts) // 2 or not all(isinstance(name, str) and name for name in device):
+            raise ValueError(f"Proceso {p.get('id')}: debe indicar un dispositivo por cada ráfaga de E/S")
+    elif not isinstance(device, str) or not device:
+        raise ValueError(f"Proceso {p.get('id')}: el dispositivo de E/S no es válido")
+
+
+def normalize_processes(processes):
+    if not isinstance(processes, list):
+        raise ValueError("El archivo no contiene datos válidos de procesos")
+    for p in processes:
+        if isinstance(p, dict) and "bursts" in p:
+            _normalize_bursts(p)
+        if not isinstance(p, dict) or not all(key in p for key in ["id", "arrival", "burst"]):
+            raise ValueError("El archivo no contiene datos válidos de procesos")
+        if "priority" not in p:
+            p["priority"] = 0
+        if not all(isinstance(p[key], int) and not isinstance(p[key], bool) for key in ["arrival", "burst", "priority"]):
+            raise ValueError("Los tiempos y prioridades de los procesos deben ser enteros")
+        if p["burst"] <= 0:
+            raise ValueError(f"Proceso {p['id']}: el tiempo de ráfaga debe ser mayor que 0")
+        if p["arrival"] < 0:
+            raise ValueError(f"Proceso {p['id']}: el tiempo de llegada no puede ser negativo")
+    return processes
+
+
+def parse_bursts(text, device=DEFAULT_DEVICE):
+    # "5, 3:disco, 2" -> ([5, 3, 2], ["disco"]); las ráfagas de E/S sin nombre usan
+    # `device`. Se aceptan comas, punto y coma o espacios como separadores
+    bursts, devices = [], []
+    for k, token in enumerate(t for t in re.split(r"[,;\s]+", text.strip()) if t):
+        value, _, name = token.partition(":")
+        if name and k % 2 == 0:
+            raise ValueError("Solo las ráfagas de E/S llevan dispositivo")
+        bursts.append(int(value))
+        if k % 2:
+            devices.append(name or device)
+    if not bursts:
+        raise ValueError("No se indicaron ráfagas")
+    return bursts, devices
+
+
+def format_bursts(bursts, devices):
+    # Inversa de parse_bursts
+    tokens = [str(burst) for burst in bursts]
+    for k, name in enumerate(devices):
+        if name != DEFAULT_DEVICE:
+            tokens[2 * k + 1] += f":{name}"
+    return ", ".join(tokens)
+
+
+def _iter_jsonl_records(f):
+    for line_number, line in enumerate(f, 1):
+        line = line.strip()
+        if not line:
+            continue
+        try:
+            yield json.loads(line)
+        except json.JSONDecodeError as e:
+            raise ValueError(f"Línea {line_number}: JSON inválido ({e.msg})")
+
+
+def _iter_csv_records(f):
+    # Columnas opcionales: priority, bursts (texto de parse_bursts) y device (dispositivo
+    # de las ráfagas de E/S que no lo indican)
+    reader = csv.DictReader(f)
+    if not reader.fieldnames or not ({"id", "arrival"} <= set(reader.fieldnames)
+                                     and {"burst", "bursts"} & set(reader.fieldnames)):
+        raise ValueError("El CSV debe tener las columnas id, arrival, burst (y opcionalmente priority, "
+                         "bursts y device)")
+    for row in reader:
+        try:
+            # IDs numéricos como enteros, igual que en JSON: la misma carga debe dar los
+            # mismos IDs (y el mismo digest) sin importar el formato
+            pid = row["id"]
+            record = {"id": int(pid) if pid.isascii() and pid.isdigit() else pid, "arrival": int(row["arrival"])}
+            if row.get("burst"):
+                record["burst"] = int(row["burst"])
+            if row.get("priority"):
+                record["priority"] = int(row["priority"])
+            if row.get("bursts"):
+                record["bursts"], record["device"] = parse_bursts(row["bursts"], row.get("device") or DEFAULT_DEVICE)
+        except (TypeError, ValueError):
+            raise ValueError(f"Línea {reader.line_num}: valores numéricos inválidos")
+        yield record
+
+
+def iter_chunks(records, chunk_size=CHUNK_SIZE):
+    # Convierte un flujo de registros en bloques columnares ya validados
+    records = iter(records)
+    while True:
+        chunk = list(islice(records, chunk_size))
+        if not chunk:
+            return
+        yield ProcessSet.from_dicts(normalize_processes(chunk))
+
+
+def concat_process_sets(chunks):
+    chunks = list(chunks)
+    if not chunks:
+        return ProcessSet([], [], [], [])
+    return ProcessSet(
+        concat_ids([chunk.ids for chunk in chunks]),
+        np.concatenate([chunk.arrival for chunk in chunks]),
+        np.concatenate([chunk.burst for chunk in chunks]),
+        np.concatenate([chunk.priority for chunk in chunks]),
+        IOBursts.concat(chunks) if any(chunk.io is not None for chunk in chunks) else None
+    )
+
+
+def _reporting(chunks, f, progress):
+    # progress(bytes leídos, tamaño del archivo) tras cada bloque; puede lanzar una
+    # excepción para cancelar la carga
+    size = os.fstat(f.fileno()).st_size
+    for chunk in chunks:
+        progress(f.buffer.tell(), size)
+        yield chunk
+
+
+def load_workload(file_path, chunk_size=CHUNK_SIZE, progress=None):
+    # Con progress, JSON Lines y CSV informan el avance por bloques
+    extension = os.path.splitext(file_path)[1].lower()
+    if extension in NPZ_EXTENSIONS:
+        return load_process_set(file_path)
+    with open(file_path, "r", newline="" if extension in CSV_EXTENSIONS else None) as f:
+        if extension in JSONL_EXTENSIONS or extension in CSV_EXTENSIONS:
+            records = _iter_jsonl_records(f) if extension in JSONL_EXTENSIONS else _iter_csv_records(f)
+            chunks = iter_chunks(records, chunk_size)
+            if progress is not None:
+                chunks = _reporting(chunks, f, progress)
+            return concat_process_sets(chunks)
+        return ProcessSet.from_dicts(normalize_processes(json.load(f)))
@@ -0,0 +1,501 @@
+"""Representación columnar (struct-of-arrays) de procesos y líneas de tiempo."""
+import bisect
+import functools
+import hashlib
+from array import array
+
+import numpy as np
+
+
+def _as_id_array(ids):
+    ids = list(ids)
+    if all(isinstance(pid, int) and not isinstance(pid, bool) for pid in ids):
+        return np.asarray(ids, dtype=np.int64)
+    if all(isinstance(pid, str) for pid in ids):
+        return np.asarray(ids, dtype=str)
+    # IDs mezclados: se conservan tal cual
+    result = np.empty(len(ids), dtype=object)
+    result[:] = ids
+    return result
+
+
+# Dispositivo de las ráfagas de E/S que no indican uno
+DEFAULT_DEVICE = "E/S"
+
+
+def concat_ids(chunks):
+    # Une columnas de IDs; si los tipos no coinciden se conservan como objetos
+    chunks = list(chunks)
+    if len({chunk.dtype.kind for chunk in chunks}) > 1:
+        chunks = [chunk.astype(object) for chunk in chunks]
+    return np.concatenate(chunks)
+
+
+def io_devices(process):
+    # Dispositivo de cada ráfaga de E/S de un proceso en formato de diccionario: "device"
+    # puede ser un nombre para todas o una lista con uno por ráfaga
+    count = len(process["bursts"]) // 2
+    device = process.get("device", DEFAULT_DEVICE)
+    return [device] * count if isinstance(device, str) else list(device)
+
+
+class IOBursts:
+    # Ráfagas alternadas de CPU y E/S en formato CSR: las del proceso i son
+    # bursts[offsets[i]:offsets[i + 1]] = CPU, E/S, CPU, ..., CPU. `device` es paralelo a
+    # `bursts`: en cada ráfaga de E/S, el índice de su dispositivo en device_names; -1 en
+    # las de CPU
+    __slots__ = ("offsets", "bursts", "device", "device_names")
+
+    def __init__(self, offsets, bursts, device, device_names):
+        self.offsets = np.asarray(offsets, dtype=np.int64)
+        self.bursts = np.asarray(bursts, dtype=np.int64)
+        self.device = np.asarray(device, dtype=np.int32)
+        self.device_names = list(device_names)
+
+    @classmethod
+    def from_sequences(cls, sequences, devices):
+        # sequences: ráfagas de cada proceso; devices: nombres de dispositivo de sus
+        # ráfagas de E/S (None en los procesos sin E/S)
+        names = {}
+        lengths = np.fromiter((len(sequence) for sequence in sequences), dtype=np.int64, count=len(sequences))
+        offsets = np.zeros(len(sequences) + 1, dtype=np.int64)
+        np.cumsum(lengths, out=offsets[1:])
+        bursts = np.fromiter((burst for sequence in sequences for burst in sequence), dtype=np.int64,
+                             count=int(offsets[-1]))
+        device = np.full(len(bursts), -1, dtype=np.int32)
+        for start, sequence_devices in zip(offsets.tolist(), devices):
+            for k, name in enumerate(sequence_devices or ()):
+                device[start + 2 * k + 1] = names.setdefault(name, len(names))
+        return cls(offsets, bursts, device, names)
+
+    @classmethod
+    def concat(cls, process_sets):
+        # Une las ráfagas de varios conjuntos; los procesos sin E/S tienen una sola ráfaga
+        names = {}
+        offsets, bursts, device = [np.zeros(1, dtype=np.int64)], [], []
+        for processes in process_sets:
+            io = processes.io
+            if io is None:
+                io = cls(np.arange(len(processes) + 1), processes.burst, np.full(len(processes), -1), [])
+            remap = np.array([names.setdefault(name, len(names)) for name in io.device_names] + [-1],
+                             dtype=np.int32)
+            offsets.append(io.offsets[1:] + offsets[-1][-1])
+            bursts.append(io.bursts)
+            device.append(remap[io.device])
+        return cls(np.concatenate(offsets), np.concatenate(bursts), np.concatenate(device), names)
+
+    def sequence(self, row):
+        return self.bursts[self.offsets[row]:self.offsets[row + 1]].tolist()
+
+    def devices(self, row):
+        device = self.device[self.offsets[row] + 1:self.offsets[row + 1]:2]
+        return [self.device_names[index] for index in device.tolist()]
+
+    def cpu_total(self):
+        # Suma de las ráfagas de CPU de cada proceso
+        cpu = np.where(self.device < 0, self.bursts, 0)
+        return np.add.reduceat(cpu, self.offsets[:-1]) if len(cpu) else np.zeros(0, dtype=np.int64)
+
+
+class ProcessSet:
+    # `burst` es el tiempo total de CPU de cada proceso. Si algún proceso alterna ráfagas
+    # de CPU y E/S, `io` las guarda (ver IOBursts); si ninguno lo hace es None
+    __slots__ = ("ids", "arrival", "burst", "priority", "io", "_digest")
+
+    def __init__(self, ids, arrival, burst, priority=None, io=None):
+        self.ids = ids if isinstance(ids, np.ndarray) else _as_id_array(ids)
+        self.arrival = np.asarray(arrival, dtype=np.int64)
+        self.burst = np.asarray(burst, dtype=np.int64)
+        if priority is None:
+            priority = np.zeros(len(self.ids), dtype=np.int64)
+        self.priority = np.asarray(priority, dtype=np.int64)
+        if not len(self.ids) == len(self.arrival) == len(self.burst) == len(self.priority):
+            raise ValueError("Las columnas de procesos tienen longitudes distintas")
+        if io is not None and len(io.offsets) != len(self.ids) + 1:
+            raise ValueError("Las ráfagas de E/S no corresponden a los procesos")
+        self.io = io
+        self._digest = None
+
+    @classmethod
+    def from_dicts(cls, processes):
+        io = None
+        if any(len(p.get("bursts", ())) > 1 for p in processes):
+            io = IOBursts.from_sequences(
+                [p["bursts"] if "bursts" in p else [p["burst"]] for p in processes],
+                [io_devices(p) if "bursts" in p else None for p in processes])
+        return cls(
+            [p["id"] for p in processes],
+            [p["arrival"] for p in processes],
+            [p["burst"] if "burst" in p else sum(p["bursts"][::2]) for p in processes],
+            [p.get("priority", 0) for p in processes],
+            io
+        )
+
+    def to_dicts(self):
+        processes = [
+            {"id": pid, "arrival": arrival, "burst": burst, "priority": priority}
+            for pid, arrival, burst, priority in zip(
+                self.ids.tolist(), self.arrival.tolist(), self.burst.tolist(), self.priority.tolist())
+        ]
+        if self.io is not None:
+            for row in np.flatnonzero(np.diff(self.io.offsets) > 1).tolist():
+                processes[row]["bursts"] = self.io.sequence(row)
+                processes[row]["device"] = self.io.devices(row)
+        return processes
+
+    def digest(self):
+        # Hash del contenido en orden de filas (el timeline guarda filas, así que el
+        # mismo conjunto en otro orden es otra carga). Se calcula una sola vez: las
+        # columnas no se modifican después de construir el conjunto
+        if self._digest is None:
+            digest = hashlib.blake2b(digest_size=16)
+            digest.update(self.ids.dtype.str.encode())
+            if self.ids.dtype.kind == "O":
+                digest.update(repr(self.ids.tolist()).encode())
+            else:
+                digest.update(np.ascontiguousarray(self.ids).tobytes())
+            for column in (self.arrival, self.burst, self.priority):
+                digest.update(np.ascontiguousarray(column).tobytes())
+            if self.io is not None:
+                for column in (self.io.offsets, self.io.bursts, self.io.device):
+                    digest.update(np.ascontiguousarray(column).tobytes())
+                digest.update(repr(self.io.device_names).encode())
+            self._digest = digest.hexdigest()
+        return self._digest
+
+    def __len__(self):
+        return len(self.ids)
+
+
+# Contadores que los motores llevan en sus bucles (ver Timeline.stats)
+ENGINE_COUNTERS = ("dispatches", "preemptions", "heap_pushes", "heap_pops")
+
+
+def engine_stats(dispatches, preemptions, heap_pushes=0, heap_pops=0):
+    return dict(zip(ENGINE_COUNTERS, (dispatches, preemptions, heap_pushes, heap_pops)))
+
+
+def streamed(engine):
+    # engine es un generador que emite el timeline en bloques de chunk_size tramos, o
+    # en uno solo si chunk_size es None. La función decorada devuelve ese único
+    # Timeline, como siempre; .chunks es el generador, para recorrerlo por partes
+    @functools.wraps(engine)
+    def run(*args, **kwargs):
+        [timeline] = engine(*args, **kwargs)
+        return timeline
+    run.chunks = engine
+    return run
+
+
+class Timeline:
+    # Cada tramo es (fila del proceso en `processes`, inicio, fin). En simulaciones de
+    # varios núcleos `cpu` indica el núcleo de cada tramo y los tramos se ordenan por
+    # inicio; con un solo núcleo `cpu` es None. Si se modela el costo de cambio de
+    # contexto, `overhead` es el tiempo perdido justo antes de cada tramo al cambiar
+    # de proceso; sin costo es None. Si los procesos tienen ráfagas de E/S, las columnas
+    # io_* describen cada operación: proceso, dispositivo (índice en
+    # processes.io.device_names), instante en que se bloqueó, y inicio y fin del servicio
+    # en el dispositivo (la diferencia entre bloqueo e inicio es la espera en su cola).
+    # Si se piden al motor (stats=True), `stats` tiene sus contadores de toda la
+    # simulación (ENGINE_COUNTERS); al emitir por bloques solo los lleva el último
+    __slots__ = ("processes", "pid", "start", "end", "cpu", "cores", "overhead",
+                 "io_pid", "io_device", "io_blocked", "io_start", "io_end", "stats")
+
+    def __init__(self, processes, pid, start, end, cpu=None, cores=1, overhead=None,
+                 io_pid=None, io_device=None, io_blocked=None, io_start=None, io_end=None, stats=None):
+        self.processes = processes
+        self.stats = stats
+        self.pid = np.asarray(pid, dtype=np.int32)
+        self.start = np.asarray(start, dtype=np.int64)
+        self.end = np.asarray(end, dtype=np.int64)
+        self.cpu = None if cpu is None else np.asarray(cpu, dtype=np.int16)
+        self.cores = int(cores)
+        self.overhead = None if overhead is None else np.asarray(overhead, dtype=np.int64)
+        self.io_pid = None if io_pid is None else np.asarray(io_pid, dtype=np.int32)
+        self.io_device = None if io_device is None else np.asarray(io_device, dtype=np.int32)
+        self.io_blocked = None if io_blocked is None else np.asarray(io_blocked, dtype=np.int64)
+        self.io_start = None if io_start is None else np.asarray(io_start, dtype=np.int64)
+        self.io_end = None if io_end is None else np.asarray(io_end, dtype=np.int64)
+
+    @classmethod
+    def builder(cls, resume=None, overhead=False):
+        # Buffers compactos para que los algoritmos agreguen tramos sin crear objetos;
+        # al reanudar una simulación empiezan con los tramos ya calculados. El buffer de
+        # costos de cambio solo existe si se pide (si no, es None)
+        pids, starts, ends = array("i"), array("q"), array("q")
+        overheads = array("q") if overhead else None
+        if resume is not None:
+            pids.frombytes(np.ascontiguousarray(resume["pid"], dtype=np.int32).tobytes())
+            starts.frombytes(np.ascontiguousarray(resume["start"], dtype=np.int64).tobytes())
+            ends.frombytes(np.ascontiguousarray(resume["end"], dtype=np.int64).tobytes())
+            if overhead:
+                overheads.frombytes(np.ascontiguousarray(resume["overhead"], dtype=np.int64).tobytes())
+        return pids, starts, ends, overheads
+
+    @classmethod
+    def concat(cls, chunks):
+        # Une los bloques de un mismo timeline emitidos en orden (ver iter_algorithm)
+        chunks = list(chunks)
+        first = chunks[0]
+        columns = {}
+        for name, column in first.columns().items():
+            columns[name] = column if name == "cores" else np.concatenate([chunk.columns()[name] for chunk in chunks])
+        return cls(first.processes, **columns, stats=chunks[-1].stats)
+
+    @property
+    def ids(self):
+        return self.processes.ids[self.pid]
+
+    def columns(self):
+        # Lo necesario para reconstruir el timeline con Timeline(processes, **columns)
+        columns = {"pid": self.pid, "start": self.start, "end": self.end}
+        if self.cpu is not None:
+            columns.update(cpu=self.cpu, cores=self.cores)
+        if self.overhead is not None:
+            columns["overhead"] = self.overhead
+        if self.io_pid is not None:
+            columns.update(io_pid=self.io_pid, io_device=self.io_device, io_blocked=self.io_blocked,
+                           io_start=self.io_start, io_end=self.io_end)
+        return columns
+
+    def overhead_blocks(self, indices=None):
+        # (inicio, fin) de los cambios de contexto con costo de los tramos indicados
+        # (todos si es None), en el mismo orden
+        if self.overhead is None:
+            return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+        start = self.start if indices is None else self.start[indices]
+        overhead = self.overhead if indices is None else self.overhead[indices]
+        switched = np.flatnonzero(overhead)
+        return start[switched] - overhead[switched], start[switched]
+
+    def lane(self, core):
+        # Índices de los tramos de un núcleo, ordenados por inicio
+        if self.cpu is None:
+            return np.arange(len(self.pid))
+        return np.flatnonzero(self.cpu == core)
+
+    def slices(self):
+        # Itera (id, inicio, fin) sin materializar un diccionario por tramo
+        return zip(self.ids.tolist(), self.start.tolist(), self.end.tolist())
+
+    def to_dicts(self):
+        processes = self.processes
+        slices = [
+            {"process": pid, "start": start, "end": end,
+             "arrival": arrival, "burst": burst, "priority": priority}
+            for pid, start, end, arrival, burst, priority in zip(
+                self.ids.tolist(), self.start.tolist(), self.end.tolist(),
+                processes.arrival[self.pid].tolist(), processes.burst[self.pid].tolist(),
+                processes.priority[self.pid].tolist())
+        ]
+        if self.cpu is not None:
+            for entry, cpu in zip(slices, self.cpu.tolist()):
+                entry["cpu"] = cpu
+        if self.overhead is not None:
+            for entry, overhead in zip(slices, self.overhead.tolist()):
+                entry["overhead"] = overhead
+        return slices
+
+    def io_dicts(self):
+        # Operaciones de E/S en el mismo formato que to_dicts
+        if self.io_pid is None:
+            return []
+        names = self.processes.io.device_names
+        return [
+            {"process": pid, "device": names[device], "blocked": blocked, "start": start, "end": end}
+            for pid, device, blocked, start, end in zip(
+                self.processes.ids[self.io_pid].tolist(), self.io_device.tolist(), self.io_blocked.tolist(),
+                self.io_start.tolist(), self.io_end.tolist())
+        ]
+
+    def __len__(self):
+        return len(self.pid)
+
+
+class ProcessStore:
+    # Almacén editable de procesos para la interfaz. Guarda columnas compactas, un
+    # índice ID -> fila para que agregar, buscar y eliminar sean O(1), y genera el
+    # ProcessSet para el motor solo cuando cambia. Las secuencias de ráfagas de los pocos
+    # procesos con E/S se guardan aparte, por ID.
+    # Eliminar deja la fila marcada (lápida) y las filas se compactan, conservando el
+    # orden de inserción, la próxima vez que se leen las columnas completas: borrar
+    # varios procesos seguidos cuesta una sola pasada. window lee las filas visibles
+    # de la tabla saltando las lápidas, sin compactar
+    def __init__(self, processes=None):
+        self.clear()
+        if processes is not None:
+            self.extend(processes)
+
+    def clear(self):
+        self._ids = []
+        self._arrival = array("q")
+        self._burst = array("q")
+        self._priority = array("q")
+        self.io = {}
+        self._index = {}
+        # Filas eliminadas, ordenadas
+        self._removed = []
+        self.max_numeric_id = None
+        self._process_set = None
+
+    # Columnas por posición (sin filas eliminadas)
+    @property
+    def ids(self):
+        self._compact()
+        return self._ids
+
+    @property
+    def arrival(self):
+        self._compact()
+        return self._arrival
+
+    @property
+    def burst(self):
+        self._compact()
+        return self._burst
+
+    @property
+    def priority(self):
+        self._compact()
+        return self._priority
+
+    def _compact(self):
+        if not self._removed:
+            return
+        first = self._removed[0]
+        keep = np.ones(len(self._ids), dtype=bool)
+        keep[self._removed] = False
+        self._ids = [pid for pid, kept in zip(self._ids, keep.tolist()) if kept]
+        for name in ("_arrival", "_burst", "_priority"):
+            column = np.frombuffer(getattr(self, name), dtype=np.int64)[keep]
+            setattr(self, name, array("q", column.tobytes()))
+        # Solo se renumeran las filas que siguen a la primera eliminada
+        self._index.update(zip(self._ids[first:], range(first, len(self._ids))))
+        self._removed = []
+
+    def _track_numeric_id(self, pid):
+        if isinstance(pid, str):
+            if not pid.isdigit():
+                return
+            pid = int(pid)
+        if self.max_numeric_id is None or pid > self.max_numeric_id:
+            self.max_numeric_id = pid
+
+    def append(self, pid, arrival, burst, priority=0, bursts=None, device=None):
+        # bursts: ráfagas alternadas de CPU y E/S; device: dispositivo de cada ráfaga de E/S
+        if pid in self:
+            raise ValueError(f"El proceso con ID {pid} ya existe")
+        if bursts is not None and len(bursts) > 1:
+            self.io[pid] = (list(bursts), io_devices({"bursts": bursts, "device": device or DEFAULT_DEVICE}))
+        self._index[pid] = len(self._ids)
+        self._ids.append(pid)
+        self._arrival.append(arrival)
+        self._burst.append(burst)
+        self._priority.append(priority)
+        self._track_numeric_id(pid)
+        self._process_set = None
+
+    def extend(self, processes):
+        new_ids = processes.ids.tolist()
+        new_index = dict(zip(new_ids, range(len(self._ids), len(self._ids) + len(new_ids))))
+        if len(new_index) != len(new_ids) or (self._index and any(pid in self for pid in new_ids)):
+            raise ValueError("El conjunto de procesos contiene IDs duplicados")
+
+        self._index.update(new_index)
+        self._ids.extend(new_ids)
+        self._arrival.frombytes(processes.arrival.astype(np.int64).tobytes())
+        self._burst.frombytes(processes.burst.astype(np.int64).tobytes())
+        self._priority.frombytes(processes.priority.astype(np.int64).tobytes())
+        if processes.io is not None:
+            for row in np.flatnonzero(np.diff(processes.io.offsets) > 1).tolist():
+                self.io[new_ids[row]] = (processes.io.sequence(row), processes.io.devices(row))
+        if processes.ids.dtype.kind in "iu":
+            if len(new_ids):
+                self._track_numeric_id(int(processes.ids.max()))
+        else:
+            for pid in new_ids:
+                self._track_numeric_id(pid)
+        self._process_set = None
+
+    def index(self, pid):
+        # Posición del proceso en las columnas. Los IDs llegan como texto desde el
+        # formulario y pueden ser enteros en el archivo
+        self._compact()
+        return self._find(pid)
+
+    def _find(self, pid):
+        # Fila en el almacén sin compactar (puede haber lápidas antes)
+        row = self._index.get(pid)
+        if row is None and isinstance(pid, str) and pid.isdigit():
+            row = self._index.get(int(pid))
+        return row
+
+    def remove(self, pid):
+        row = self._find(pid)
+        if row is None:
+            return
+        del self._index[self._ids[row]]
+        self.io.pop(self._ids[row], None)
+        bisect.insort(self._removed, row)
+        self._process_set = None
+
+    def _row(self, row):
+        process = {"id": self._ids[row], "arrival": self._arrival[row],
+                   "burst": self._burst[row], "priority": self._priority[row]}
+        if self._ids[row] in self.io:
+            process["bursts"], process["device"] = self.io[self._ids[row]]
+        return process
+
+    def row(self, row):
+        self._compact()
+        return self._row(row)
+
+    def window(self, start, count):
+        # Procesos en las posiciones start..start+count sin compactar: la fila física
+        # es la primera cuya cantidad de filas vivas anteriores llega a start
+        removed = self._removed
+        low, high = start, start + len(removed)
+        while low < high:
+            middle = (low + high) // 2
+            if middle - bisect.bisect_left(removed, middle) < start:
+                low = middle + 1
+            else:
+                high = middle
+        skip = bisect.bisect_left(removed, low)
+        processes = []
+        row = low
+        while len(processes) < count and row < len(self._ids):
+            if skip < len(removed) and removed[skip] == row:
+                skip += 1
+            else:
+                processes.append(self._row(row))
+            row += 1
+        return processes
+
+    def get(self, pid):
+        row = self._find(pid)
+        return None if row is None else self._row(row)
+
+    def to_process_set(self):
+        if self._process_set is None:
+            self._compact()
+            # Copia: un arreglo NumPy que comparte el buffer impediría seguir agregando
+            io = None
+            if self.io:
+                io = IOBursts.from_sequences(
+                    [self.io[pid][0] if pid in self.io else [burst] for pid, burst in zip(self._ids, self._burst)],
+                    [self.io[pid][1] if pid in self.io else None for pid in self._ids])
+            self._process_set = ProcessSet(
+                self._ids, np.array(self._arrival, dtype=np.int64), np.array(self._burst, dtype=np.int64),
+                np.array(self._priority, dtype=np.int64), io)
+        return self._process_set
+
+    def to_dicts(self):
+        self._compact()
+        return [self._row(row) for row in range(len(self))]
+
+    def __contains__(self, pid):
+        return self._find(pid) is not None
+
+    def __len__(self):
+        return len(self._ids) - len(self._removed)
@@ -0,0 +1,883 @@
+"""Motor de planificación sin dependencias de interfaz gráfica.
+
+Puede usarse como biblioteca o desde la línea de comandos:
+
+    python scheduler.py Proceso.json --algorithm "Round Robin" --quantum 2
+"""
+import argparse
+import heapq
+import json
+import sys
+from collections import deque
+
+import numpy as np
+
+from cache import ResultCache, result_key
+from export import export_timeline
+from loaders import load_workload
+from model import ProcessSet, Timeline, engine_stats, streamed
+from smp import SMP_ALGORITHMS, smp_algorithm
+from storage import save_timeline
+
+
+PERCENTILES = (50, 95, 99)
+# Quantum de cada nivel de MLFQ, del más prioritario al menos prioritario
+MLFQ_QUANTA = (2, 4, 8)
+# Tramos mínimos entre dos puntos de control de la simulación incremental
+CHECKPOINT_INTERVAL = 4096
+# Tramos por bloque de iter_algorithm
+STREAM_CHUNK = 1 << 16
+
+
+def load_processes(file_path):
+    # .json, .jsonl/.ndjson o .csv según la extensión
+    return load_workload(file_path)
+
+
+def _arrival_order(processes, *tie_breakers):
+    # Orden estable por llegada (y criterios de desempate opcionales)
+    return np.lexsort(tuple(reversed(tie_breakers)) + (processes.arrival,)).tolist()
+
+
+def arrival_order(algorithm, processes):
+    # Orden en que cada algoritmo admite los procesos; lo usa la simulación incremental
+    if algorithm == "SJF":
+        return np.asarray(_arrival_order(processes, processes.burst), dtype=np.int64)
+    return np.asarray(_arrival_order(processes), dtype=np.int64)
+
+
+def _next_checkpoint(slices, queue_size):
+    # El intervalo crece con la cola para que copiar el estado cueste O(1) amortizado por tramo
+    return slices + max(CHECKPOINT_INTERVAL, queue_size)
+
+
+@streamed
+def fcfs_algorithm(processes, switch_cost=0, warmup=0, chunk_size=None, stats=False):
+    # Cada proceso se ejecuta una sola vez, así que nunca paga el calentamiento (warmup)
+    # ni se expropia: hay un despacho por proceso
+    order = np.argsort(processes.arrival, kind="stable")
+    arrival = processes.arrival[order]
+    burst = processes.burst[order]
+    # Todos los procesos salvo el primero pagan el cambio de contexto antes de empezar:
+    # equivale a alargar su ráfaga
+    overhead = np.full(len(order), switch_cost, dtype=np.int64)
+    overhead[:1] = 0
+    occupied = burst + overhead
+
+    # fin_i = max(llegada_i, fin_{i-1}) + ráfaga_i, resuelto sin bucle:
+    # fin_i = C_i + max(0, max_{j<=i}(llegada_j - C_{j-1})) con C la suma acumulada de ráfagas
+    cumulative = np.cumsum(occupied)
+    offset = np.maximum.accumulate(arrival - (cumulative - occupied)) if len(order) else cumulative
+    end = cumulative + np.maximum(offset, 0)
+
+    start = end - burst
+    overhead = overhead if switch_cost else None
+    counters = engine_stats(len(order), 0) if stats else None
+    if chunk_size is None:
+        yield Timeline(processes, order, start, end, overhead=overhead, stats=counters)
+        return
+    # Sin procesos se emite un bloque vacío, como en los demás motores
+    for first in range(0, max(len(order), 1), chunk_size):
+        part = slice(first, first + chunk_size)
+        last = first + chunk_size >= len(order)
+        yield Timeline(processes, order[part], start[part], end[part],
+                       overhead=None if overhead is None else overhead[part], stats=counters if last else None)
+
+
+@streamed
+def sjf_algorithm(processes, switch_cost=0, warmup=0, resume=None, checkpoints=None, chunk_size=None, stats=False):
+    # resume: estado guardado en `checkpoints` por una ejecución anterior (ver incremental.py).
+    # Sin expropiación ningún proceso se reanuda, así que warmup no aplica
+    order = _arrival_order(processes, processes.burst)
+    arrival = processes.arrival.tolist()
+    burst = processes.burst.tolist()
+    pids, starts, ends, overheads = Timeline.builder(resume, bool(switch_cost))
+    if resume is None:
+        current_time = 0
+        ready_queue = []
+        process_index = 0
+        last_row = None
+        dispatches = heap_pushes = 0
+    else:
+        current_time = resume["time"]
+        process_index = resume["process_index"]
+        ready_queue = [(burst[row], seq, row) for seq, row in zip(resume["seqs"], resume["queue"])]
+        last_row = resume["last_row"]
+        dispatches, heap_pushes = resume["counters"]
+    next_checkpoint = len(pids)
+
+    while process_index < len(order) or ready_queue:
+        if chunk_size is not None and len(pids) >= chunk_size:
+            yield Timeline(processes, pids, starts, ends, overhead=overheads)
+            pids, starts, ends, overheads = Timeline.builder(overhead=overheads is not None)
+        if checkpoints is not None and len(pids) >= next_checkpoint:
+            checkpoints.append({
+                "time": current_time, "process_index": process_index, "slices": len(pids),
+                "queue": [entry[2] for entry in ready_queue], "seqs": [entry[1] for entry in ready_queue],
+                "last_row": last_row, "counters": (dispatches, heap_pushes)
+            })
+            next_checkpoint = _next_checkpoint(len(pids), len(ready_queue))
+
+        while process_index < len(order) and arrival[order[process_index]] <= current_time:
+            row = order[process_index]
+            # El índice en el orden de llegada desempata ráfagas iguales
+            heapq.heappush(ready_queue, (burst[row], process_index, row))
+            heap_pushes += 1
+            process_index += 1
+
+        if not ready_queue:
+            if process_index < len(order):
+                current_time = arrival[order[process_index]]
+                continue
+            else:
+                break
+
+        row = heapq.heappop(ready_queue)[2]
+        dispatches += 1
+        if last_row is not None:
+            current_time += switch_cost
+            if overheads is not None:
+                overheads.append(switch_cost)
+        elif overheads is not None:
+            overheads.append(0)
+        last_row = row
+
+        pids.append(row)
+        starts.append(current_time)
+        current_time += burst[row]
+        ends.append(current_time)
+
+    yield Timeline(processes, pids, starts, ends, overhead=overheads,
+                   stats=engine_stats(dispatches, 0, heap_pushes, dispatches) if stats else None)
+
+
+@streamed
+def srtf_algorithm(processes, switch_cost=0, warmup=0, resume=None, checkpoints=None, chunk_size=None, stats=False):
+    # SJF expropiativo: gana el proceso con menor ráfaga restante
+    return preemptive_algorithm.chunks(processes, lambda row, remaining: remaining, switch_cost, warmup, resume,
+                                       checkpoints, chunk_size, stats)
+
+
+@streamed
+def round_robin_algorithm(processes, quantum, switch_cost=0, warmup=0, resume=None, checkpoints=None, chunk_size=None,
+                          stats=False):
+    # switch_cost: tiempo perdido al cambiar de proceso entre dos tramos consecutivos;
+    # warmup: tiempo adicional que pierde un proceso al reanudarse con la caché fría
+    order = _arrival_order(processes)
+    arrival = processes.arrival.tolist()
+    burst = processes.burst.tolist()
+    remaining_burst = list(burst)
+    pids, starts, ends, overheads = Timeline.builder(resume, bool(switch_cost or warmup))
+    if resume is None:
+        current_time = 0
+        ready_queue = deque()
+        process_index = 0
+        last_row = None
+        dispatches = preemptions = 0
+    else:
+        current_time = resume["time"]
+        process_index = resume["process_index"]
+        ready_queue = deque(resume["queue"])
+        last_row = resume["last_row"]
+        dispatches, preemptions = resume["counters"]
+        for row, remaining in zip(resume["queue"], resume["remaining"]):
+            remaining_burst[row] = remaining
+    next_checkpoint = len(pids)
+
+    while process_index < len(order) or ready_queue:
+        if chunk_size is not None and len(pids) >= chunk_size:
+            yield Timeline(processes, pids, starts, ends, overhead=overheads)
+            pids, starts, ends, overheads = Timeline.builder(overhead=overheads is not None)
+        if checkpoints is not None and len(pids) >= next_checkpoint:
+            checkpoints.append({
+                "time": current_time, "process_index": process_index, "slices": len(pids),
+                "queue": list(ready_queue), "remaining": [remaining_burst[row] for row in ready_queue],
+                "last_row": last_row, "counters": (dispatches, preemptions)
+            })
+            next_checkpoint = _next_checkpoint(len(pids), len(ready_queue))
+
+        while process_index < len(order) and arrival[order[process_index]] <= current_time:
+            ready_queue.append(order[process_index])
+            process_index += 1
+
+        if not ready_queue:
+            if process_index < len(order):
+                current_time = arrival[order[process_index]]
+                continue
+            else:
+                break
+
+        row = ready_queue.popleft()
+        dispatches += 1
+        exec_time = min(quantum, remaining_burst[row])
+        overhead = 0
+        if last_row is not None and row != last_row:
+            overhead = switch_cost + (warmup if remaining_burst[row] < burst[row] else 0)
+            current_time += overhead
+        if overheads is not None:
+            overheads.append(overhead)
+        last_row = row
+
+        pids.append(row)
+        starts.append(current_time)
+        current_time += exec_time
+        ends.append(current_time)
+        remaining_burst[row] -= exec_time
+
+        while process_index < len(order) and arrival[order[process_index]] <= current_time:
+            ready_queue.append(order[process_index])
+            process_index += 1
+
+        if remaining_burst[row] > 0:
+            ready_queue.append(row)
+            preemptions += 1
+
+    yield Timeline(processes, pids, starts, ends, overhead=overheads,
+                   stats=engine_stats(dispatches, preemptions) if stats else None)
+
+
+@streamed
+def priority_algorithm(processes, switch_cost=0, warmup=0, resume=None, checkpoints=None, chunk_size=None,
+                       stats=False):
+    # Menor número = mayor prioridad
+    priority = processes.priority.tolist()
+    return preemptive_algorithm.chunks(processes, lambda row, remaining: priority[row], switch_cost, warmup, resume,
+                                       checkpoints, chunk_size, stats)
+
+
+@streamed
+def preemptive_algorithm(processes, key, switch_cost=0, warmup=0, resume=None, checkpoints=None, chunk_size=None,
+                         stats=False):
+    # key(fila, ráfaga restante) devuelve el valor a minimizar; solo un valor
+    # estrictamente menor expropia al proceso en ejecución.
+    # Con costo de cambio el proceso elegido empieza en start_time, después del cambio;
+    # si durante el cambio llega un proceso mejor, el cambio se redirige a ese y el
+    # tiempo ya perdido se suma a su costo (switch_start marca dónde empezó)
+    order = _arrival_order(processes)
+    arrival = processes.arrival.tolist()
+    burst = processes.burst.tolist()
+    remaining_burst = list(burst)
+    pids, starts, ends, overheads = Timeline.builder(resume, bool(switch_cost or warmup))
+    if resume is None:
+        current_time = 0
+        ready_queue = []
+        process_index = 0
+        current = None
+        last_row = None
+        switch_start = 0
+        # El contador desempata valores iguales por orden de llegada a la cola
+        sequence = 0
+        # Contadores de stats=True; cada extracción del montículo es un despacho
+        dispatches = preemptions = heap_pushes = 0
+    else:
+        current_time = resume["time"]
+        process_index = resume["process_index"]
+        current = resume["current"]
+        start_time = resume["start_time"]
+        last_row = resume["last_row"]
+        switch_start = resume["switch_start"]
+        sequence = resume["sequence"]
+        dispatches, preemptions, heap_pushes = resume["counters"]
+        for row, remaining in zip(resume["queue"], resume["remaining"]):
+            remaining_burst[row] = remaining
+        ready_queue = [(key(row, remaining_burst[row]), seq, row) for seq, row in zip(resume["seqs"], resume["queue"])]
+        if current is not None:
+            remaining_burst[current] = resume["current_remaining"]
+    next_checkpoint = len(pids)
+
+    while process_index < len(order) or ready_queue or current is not None:
+        if chunk_size is not None and len(pids) >= chunk_size:
+            yield Timeline(processes, pids, starts, ends, overhead=overheads)
+            pids, starts, ends, overheads = Timeline.builder(overhead=overheads is not None)
+        if checkpoints is not None and len(pids) >= next_checkpoint:
+            checkpoints.append({
+                "time": current_time, "process_index": process_index, "slices": len(pids),
+                "queue": [entry[2] for entry in ready_queue], "seqs": [entry[1] for entry in ready_queue],
+                "remaining": [remaining_burst[entry[2]] for entry in ready_queue],
+                "current": current, "start_time": start_time if current is not None else None,
+                "current_remaining": remaining_burst[current] if current is not None else None,
+                "last_row": last_row, "switch_start": switch_start, "sequence": sequence,
+                "counters": (dispatches, preemptions, heap_pushes)
+            })
+            next_checkpoint = _next_checkpoint(len(pids), len(ready_queue))
+
+        # Agregar procesos que han llegado al sistema
+        while process_index < len(order) and arrival[order[process_index]] <= current_time:
+            row = order[process_index]
+            heapq.heappush(ready_queue, (key(row, remaining_burst[row]), sequence, row))
+            heap_pushes += 1
+            sequence += 1
+            process_index += 1
+
+        if current is not None:
+            # Durante un cambio de contexto el proceso aún no avanza
+            current_remaining = remaining_burst[current] - max(current_time - start_time, 0)
+
+        # Seleccionar el mejor proceso listo (si hay uno)
+        if ready_queue and (current is None or ready_queue[0][0] < key(current, current_remaining)):
+            if current is None:
+                switch_start = current_time
+            else:
+                if current_time > start_time:
+                    # Interrumpir el proceso actual y guardar su progreso
+                    pids.append(current)
+                    starts.append(start_time)
+                    ends.append(current_time)
+                    if overheads is not None:
+                        overheads.append(start_time - switch_start)
+                    remaining_burst[current] = current_remaining
+                    last_row = current
+                    switch_start = current_time
+                heapq.heappush(ready_queue, (key(current, remaining_burst[current]), sequence, current))
+                heap_pushes += 1
+                preemptions += 1
+                sequence += 1
+            # Tomar el nuevo proceso
+            current = heapq.heappop(ready_queue)[2]
+            dispatches += 1
+            start_time = current_time
+            if last_row is not None and current != last_row:
+                start_time += switch_cost + (warmup if remaining_burst[current] < burst[current] else 0)
+
+        # Si no hay proceso en ejecución, saltar a la siguiente llegada
+        if current is None:
+            current_time = arrival[order[process_index]]
+            continue
+
+        # Avanzar hasta el siguiente evento: una llegada o el fin del proceso actual
+        finish_time = start_time + remaining_burst[current]
+        if process_index < len(order) and arrival[order[process_index]] < finish_time:
+            current_time = arrival[order[process_index]]
+            continue
+
+        current_time = finish_time
+        remaining_burst[current] = 0
+        pids.append(current)
+        starts.append(start_time)
+        ends.append(current_time)
+        if overheads is not None:
+            overheads.append(start_time - switch_start)
+        last_row = current
+        current = None
+
+    yield Timeline(processes, pids, starts, ends, overhead=overheads,
+                   stats=engine_stats(dispatches, preemptions, heap_pushes, dispatches) if stats else None)
+
+
+def mlfq_settings(quanta=MLFQ_QUANTA, boost_interval=0, aging=0):
+    # Parámetros de MLFQ validados; boost_interval o aging en 0 desactivan esa regla
+    quanta = [int(quantum) for quantum in quanta]
+    if not quanta:
+        raise ValueError("MLFQ necesita al menos un nivel")
+    if any(quantum <= 0 for quantum in quanta):
+        raise ValueError("Los quanta de MLFQ deben ser mayores que 0")
+    if boost_interval < 0 or aging < 0:
+        raise ValueError("El intervalo de boost y el envejecimiento no pueden ser negativos")
+    return {"quanta": quanta, "boost_interval": int(boost_interval), "aging": int(aging)}
+
+
+@streamed
+def mlfq_algorithm(processes, quanta=MLFQ_QUANTA, boost_interval=0, aging=0, switch_cost=0, warmup=0, resume=None,
+                   checkpoints=None, chunk_size=None, stats=False):
+    # Colas multinivel con realimentación. Los procesos llegan al nivel 0 y bajan un
+    # nivel al consumir el quantum del suyo; el último nivel es Round Robin. Una llegada
+    # expropia a un proceso de un nivel inferior, que conserva lo consumido del quantum.
+    # Cada boost_interval unidades todos los procesos vuelven al nivel 0, y un proceso
+    # que espera `aging` unidades en su cola sube un nivel.
+    # Cada nivel es una deque: los procesos entran en orden de tiempo, así que el que
+    # más espera siempre está al frente y el envejecimiento cuesta O(1) por promoción.
+    # Como en preemptive_algorithm, una llegada durante un cambio de contexto lo cancela
+    # y el tiempo perdido se suma al del siguiente (switch_start marca dónde empezó)
+    order = _arrival_order(processes)
+    arrival = processes.arrival.tolist()
+    burst = processes.burst.tolist()
+    remaining_burst = list(burst)
+    last_level = len(quanta) - 1
+    level = [0] * len(remaining_burst)
+    used = [0] * len(remaining_burst)
+    waiting_since = [0] * len(remaining_burst)
+    queues = [deque() for _ in quanta]
+    pids, starts, ends, overheads = Timeline.builder(resume, bool(switch_cost or warmup))
+    if resume is None:
+        current_time = 0
+        process_index = 0
+        next_boost = boost_interval
+        last_row = None
+        switch_start = None
+        dispatches = preemptions = 0
+    else:
+        current_time = resume["time"]
+        process_index = resume["process_index"]
+        next_boost = resume["next_boost"]
+        last_row = resume["last_row"]
+        switch_start = resume["switch_start"]
+        dispatches, preemptions = resume["counters"]
+        for row, row_level, row_used, since, remaining in zip(
+                resume["queue"], resume["levels"], resume["used"], resume["waiting"], resume["remaining"]):
+            queues[row_level].append(row)
+            level[row] = row_level
+            used[row] = row_used
+            waiting_since[row] = since
+            remaining_burst[row] = remaining
+    next_checkpoint = len(pids)
+
+    def enqueue(row, row_level):
+        if row_level != level[row]:
+            level[row] = row_level
+            used[row] = 0
+        waiting_since[row] = current_time
+        queues[row_level].append(row)
+
+    while process_index < len(order) or any(queues):
+        if chunk_size is not None and len(pids) >= chunk_size:
+            yield Timeline(processes, pids, starts, ends, overhead=overheads)
+            pids, starts, ends, overheads = Timeline.builder(overhead=overheads is not None)
+        if checkpoints is not None and len(pids) >= next_checkpoint:
+            queue = [row for level_queue in queues for row in level_queue]
+            checkpoints.append({
+                "time": current_time, "process_index": process_index, "slices": len(pids),
+                "queue": queue, "levels": [level[row] for row in queue], "used": [used[row] for row in queue],
+                "waiting": [waiting_since[row] for row in queue],
+                "remaining": [remaining_burst[row] for row in queue], "next_boost": next_boost,
+                "last_row": last_row, "switch_start": switch_start, "counters": (dispatches, preemptions)
+            })
+            next_checkpoint = _next_checkpoint(len(pids), len(queue))
+
+        while process_index < len(order) and arrival[order[process_index]] <= current_time:
+            enqueue(order[process_index], 0)
+            process_index += 1
+
+        if boost_interval and current_time >= next_boost:
+            for level_queue in queues[1:]:
+                while level_queue:
+                    enqueue(level_queue.popleft(), 0)
+            next_boost = (current_time // boost_interval + 1) * boost_interval
+
+        if aging:
+            # De arriba hacia abajo para que un proceso suba como mucho un nivel por vez
+            for row_level in range(1, last_level + 1):
+                level_queue = queues[row_level]
+                while level_queue and current_time - waiting_since[level_queue[0]] >= aging:
+                    enqueue(level_queue.popleft(), row_level - 1)
+
+        row_level = next((row_level for row_level, level_queue in enumerate(queues) if level_queue), None)
+        if row_level is None:
+            current_time = arrival[order[process_index]]
+            continue
+
+        row = queues[row_level].popleft()
+        dispatches += 1
+        if switch_start is None:
+            switch_start = current_time
+        start = current_time
+        if last_row is not None and row != last_row:
+            start += switch_cost + (warmup if remaining_burst[row] < burst[row] else 0)
+        slice_end = start + min(quanta[row_level] - used[row], remaining_burst[row])
+        if row_level > 0:
+            # Una llegada (nivel 0) o un boost interrumpen a los niveles inferiores
+            if process_index < len(order):
+                slice_end = min(slice_end, arrival[order[process_index]])
+            if boost_interval:
+                slice_end = min(slice_end, next_boost)
+
+        if slice_end <= start:
+            # La interrupción llegó durante el cambio de contexto: el proceso vuelve a su
+            # cola sin ejecutarse
+            preemptions += 1
+            current_time = slice_end
+            while process_index < len(order) and arrival[order[process_index]] <= current_time:
+                enqueue(order[process_index], 0)
+                process_index += 1
+            enqueue(row, row_level)
+            continue
+
+        pids.append(row)
+        starts.append(start)
+        ends.append(slice_end)
+        if overheads is not None:
+            overheads.append(start - switch_start)
+        switch_start = None
+        last_row = row
+        remaining_burst[row] -= slice_end - start
+        used[row] += slice_end - start
+        current_time = slice_end
+
+        while process_index < len(order) and arrival[order[process_index]] <= current_time:
+            enqueue(order[process_index], 0)
+            process_index += 1
+
+        if remaining_burst[row] > 0:
+            preemptions += 1
+            if used[row] >= quanta[row_level]:
+                enqueue(row, min(row_level + 1, last_level))
+                used[row] = 0
+            else:
+                enqueue(row, row_level)
+
+    yield Timeline(processes, pids, starts, ends, overhead=overheads,
+                   stats=engine_stats(dispatches, preemptions) if stats else None)
+
+
+def calculate_metrics(processes, timeline, per_process=True, max_listed=None):
+    # max_listed limita process_metrics a los primeros procesos (en orden de filas).
+    # Sin procesos todas las métricas valen 0
+    # Primer inicio y último fin de cada proceso: mínimo/máximo agrupado por fila
+    first_run = np.full(len(processes), np.iinfo(np.int64).max, dtype=np.int64)
+    last_run = np.full(len(processes), -1, dtype=np.int64)
+    np.minimum.at(first_run, timeline.pid, timeline.start)
+    np.maximum.at(last_run, timeline.pid, timeline.end)
+    ran = last_run >= 0
+    cores = timeline.cores
+
+    arrival = processes.arrival[ran]
+    burst = processes.burst[ran]
+    response_times = first_run[ran] - arrival
+    turnaround_times = last_run[ran] - arrival
+    wait_times = turnaround_times - burst
+    if timeline.io_pid is not None:
+        # El tiempo bloqueado (en la cola del dispositivo o en servicio) no es espera
+        blocked = np.bincount(timeline.io_pid, weights=timeline.io_end - timeline.io_blocked,
+                              minlength=len(processes)).astype(np.int64)
+        wait_times = wait_times - blocked[ran]
+
+    num_processes = len(processes)
+    if timeline.cpu is None:
+        context_switches = int(np.count_nonzero(timeline.pid[1:] != timeline.pid[:-1]))
+    else:
+        # Cambios dentro de cada núcleo: tramos consecutivos del mismo núcleo
+        by_core = np.lexsort((timeline.start, timeline.cpu))
+        pid, cpu = timeline.pid[by_core], timeline.cpu[by_core]
+        context_switches = int(np.count_nonzero((pid[1:] != pid[:-1]) & (cpu[1:] == cpu[:-1])))
+    total_time = int(timeline.end.max()) if len(timeline) else 0
+    total_cpu_time = int(burst.sum())
+    overhead_time = int(timeline.overhead.sum()) if timeline.overhead is not None else 0
+
+    metrics = {
+        "avg_wait_time": float(wait_times.sum()) / num_processes if num_processes else 0.0,
+        "avg_response_time": float(response_times.sum()) / num_processes if num_processes else 0.0,
+        "avg_turnaround_time": float(turnaround_times.sum()) / num_processes if num_processes else 0.0,
+        "cpu_usage": (total_cpu_time / (total_time * cores)) * 100 if total_time > 0 else 0,
+        # Procesos completados por unidad de tiempo
+        "throughput": int(ran.sum()) / total_time if total_time > 0 else 0,
+        "context_switches": context_switches,
+        # Tiempo de núcleo perdido en cambios de contexto
+        "overhead_time": overhead_time,
+        "overhead_pct": (overhead_time / (total_time * cores)) * 100 if total_time > 0 else 0
+    }
+    for name, values in (("wait_time", wait_times), ("response_time", response_times),
+                         ("turnaround_time", turnaround_times)):
+        percentiles = np.percentile(values, PERCENTILES).tolist() if len(values) else [0.0] * len(PERCENTILES)
+        for percentile, value in zip(PERCENTILES, percentiles):
+            metrics[f"p{percentile}_{name}"] = value
+
+    if timeline.cpu is not None:
+        busy = np.bincount(timeline.cpu, weights=timeline.end - timeline.start, minlength=cores)
+        metrics["core_usage"] = (busy / total_time * 100).tolist() if total_time > 0 else [0.0] * cores
+
+    if timeline.io_pid is not None:
+        names = processes.io.device_names
+        busy = np.bincount(timeline.io_device, weights=timeline.io_end - timeline.io_start, minlength=len(names))
+        metrics["device_usage"] = {
+            name: float(value / total_time * 100) if total_time > 0 else 0.0 for name, value in zip(names, busy)
+        }
+
+    if per_process:
+        listed = slice(max_listed)
+        metrics["process_metrics"] = {
+            pid: {"wait_time": wait, "response_time": response, "turnaround_time": turnaround}
+            for pid, wait, response, turnaround in zip(
+                processes.ids[ran][listed].tolist(), wait_times[listed].tolist(),
+                response_times[listed].tolist(), turnaround_times[listed].tolist())
+        }
+        metrics["completed"] = int(ran.sum())
+    return metrics
+
+
+ALGORITHMS = {
+    "FCFS": fcfs_algorithm,
+    "SJF": sjf_algorithm,
+    "SRTF": srtf_algorithm,
+    "Round Robin": round_robin_algorithm,
+    "Prioridades": priority_algorithm,
+    "MLFQ": mlfq_algorithm,
+}
+
+
+def run_algorithm(algorithm, processes, quantum=2, switch_cost=0, cores=1, per_core_queues=False,
+                  work_stealing=False, mlfq=None, warmup=0, stats=False):
+    # mlfq: parámetros de mlfq_settings (por defecto, los de MLFQ_QUANTA sin boost ni envejecimiento).
+    # switch_cost se paga al pasar de un proceso a otro en un núcleo; warmup se suma cuando
+    # el proceso que entra ya se había ejecutado (reanuda con la caché fría).
+    # Con stats=True el timeline trae los contadores del motor en .stats
+    [timeline] = iter_algorithm(algorithm, processes, quantum, switch_cost, cores, per_core_queues, work_stealing,
+                                mlfq, warmup, chunk_size=None, stats=stats)
+    return timeline
+
+
+def iter_algorithm(algorithm, processes, quantum=2, switch_cost=0, cores=1, per_core_queues=False,
+                   work_stealing=False, mlfq=None, warmup=0, chunk_size=STREAM_CHUNK, stats=False):
+    # Como run_algorithm, pero el motor emite el timeline por bloques de unos chunk_size
+    # tramos mientras simula (Timeline sobre los mismos procesos): recorrerlo guarda en
+    # memoria solo el bloque actual, y Timeline.concat de los bloques es el resultado de
+    # run_algorithm. Con chunk_size None se emite un único bloque
+    if not isinstance(processes, ProcessSet):
+        processes = ProcessSet.from_dicts(processes)
+    if algorithm not in ALGORITHMS:
+        raise ValueError(f"Algoritmo no implementado: {algorithm}")
+    if switch_cost < 0 or warmup < 0:
+        raise ValueError("El costo de cambio de contexto no puede ser negativo")
+    if cores != 1 or processes.io is not None:
+        # Las ráfagas de E/S solo se simulan en el motor de eventos de smp.py
+        return smp_algorithm.chunks(processes, algorithm, cores, quantum, per_core_queues, work_stealing,
+                                    switch_cost=switch_cost, warmup=warmup, chunk_size=chunk_size, stats=stats)
+    if algorithm == "Round Robin":
+        if quantum <= 0:
+            raise ValueError("El quantum debe ser mayor que 0")
+        return round_robin_algorithm.chunks(processes, quantum, switch_cost, warmup, chunk_size=chunk_size,
+                                            stats=stats)
+    if algorithm == "MLFQ":
+        mlfq = mlfq_settings(**(mlfq or {}))
+        return mlfq_algorithm.chunks(processes, mlfq["quanta"], mlfq["boost_interval"], mlfq["aging"], switch_cost,
+                                     warmup, chunk_size=chunk_size, stats=stats)
+    return ALGORITHMS[algorithm].chunks(processes, switch_cost, warmup, chunk_size=chunk_size, stats=stats)
+
+
+def parse_int_range(text):
+    # "1-10" -> [1, ..., 10]; "1,2,4,8" -> [1, 2, 4, 8]; se pueden combinar: "1-4,8,16"
+    values = []
+    for part in text.replace(" ", "").split(","):
+        if not part:
+            continue
+        low, _, high = part.partition("-")
+        low = int(low)
+        high = int(high) if high else low
+        if high < low:
+            raise ValueError(f"Rango inválido: {part}")
+        values.extend(range(low, high + 1))
+    if not values:
+        raise ValueError("El rango está vacío")
+    return sorted(set(values))
+
+
+# Por debajo de este número de procesos el arranque del pool cuesta más que la simulación
+PARALLEL_THRESHOLD = 10_000
+
+_worker_processes = None
+
+
+def _init_worker(processes):
+    # El conjunto de procesos se envía una sola vez a cada worker
+    global _worker_processes
+    _worker_processes = processes
+
+
+def _simulate(job, keep_timeline=True, processes=None):
+    processes = _worker_processes if processes is None else processes
+    algorithm, *params = job
+    timeline = run_algorithm(algorithm, processes, *params)
+    metrics = calculate_metrics(processes, timeline, per_process=False)
+    if not keep_timeline:
+        return None, metrics
+    # Solo viajan las columnas del timeline; el padre ya tiene el ProcessSet
+    return timeline.columns(), metrics
+
+
+def _cached_result(cache, key, processes, keep_timeline):
+    entry = cache.get(key)
+    if entry is None:
+        return None
+    columns, metrics = entry
+    if keep_timeline and columns is None:
+        return None
+    if metrics is None:
+        # Entradas guardadas desde la interfaz: solo tienen el timeline
+        metrics = calculate_metrics(processes, Timeline(processes, **columns), per_process=False)
+    return (columns if keep_timeline else None), metrics
+
+
+def run_parallel(processes, jobs, max_workers=None, keep_timelines=True, cache=None, progress=None):
+    # jobs: lista de argumentos de run_algorithm (algoritmo, quantum[, switch_cost, ...]); devuelve [(timeline, métricas)]
+    # en el mismo orden. Con keep_timelines=False el timeline es None y solo quedan métricas.
+    # Con una ResultCache solo se simulan los trabajos que no estén en ella.
+    # progress(hechos, total) se llama tras cada trabajo; si lanza una excepción se
+    # cancelan los trabajos pendientes.
+    if not isinstance(processes, ProcessSet):
+        processes = ProcessSet.from_dicts(processes)
+    jobs = list(jobs)
+
+    results = [None] * len(jobs)
+    keys = [None] * len(jobs)
+    if cache is not None:
+        for i, job in enumerate(jobs):
+            keys[i] = result_key(processes, *job)
+            results[i] = _cached_result(cache, keys[i], processes, keep_timelines)
+    pending = [i for i, result in enumerate(results) if result is None]
+    computed = []
+
+    def report():
+        if progress is not None:
+            progress(len(jobs) - len(pending) + len(computed), len(jobs))
+
+    report()
+    if len(pending) <= 1 or max_workers == 1 or len(processes) < PARALLEL_THRESHOLD:
+        for i in pending:
+            computed.append(_simulate(jobs[i], keep_timelines, processes))
+            report()
+    else:
+        # multiprocessing solo se importa si hace falta: alarga el arranque de la interfaz
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+        # La interfaz llama desde un hilo de fondo: hacer fork de un proceso con hilos (y
+        # con Tk/Xlib abiertos) puede dejar al hijo bloqueado, así que los workers nacen
+        # de un servidor limpio (forkserver) o de un intérprete nuevo (spawn)
+        method = "forkserver" if "forkserver" in multiprocessing.get_all_start_methods() else "spawn"
+        executor = ProcessPoolExecutor(max_workers=max_workers, mp_context=multiprocessing.get_context(method),
+                                       initializer=_init_worker, initargs=(processes,))
+        try:
+            futures = [executor.submit(_simulate, jobs[i], keep_timelines) for i in pending]
+            for future in futures:
+                computed.append(future.result())
+                report()
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+    for i, result in zip(pending, computed):
+        results[i] = result
+        columns, metrics = result
+        if cache is not None:
+            cache.put(keys[i], Timeline(processes, **columns) if columns else None, metrics)
+
+    return [(Timeline(processes, **columns) if columns else None, metrics) for columns, metrics in results]
+
+
+def supported_algorithms(cores=1, io=False):
+    # Algoritmos que pueden simular la carga: con varios núcleos o ráfagas de E/S (io)
+    # solo los del motor de smp.py
+    if cores != 1 or io:
+        return list(SMP_ALGORITHMS)
+    return list(ALGORITHMS)
+
+
+def compare_algorithms(processes, algorithms=None, quantum=2, max_workers=None, cache=None,
+                       progress=None, cores=1, per_core_queues=False, work_stealing=False, mlfq=None, switch_cost=0,
+                       warmup=0):
+    # Cada algoritmo se simula una sola vez; el resultado sirve para el Gantt y las métricas.
+    # Sin algorithms se comparan todos los que soportan la carga y el número de núcleos
+    if not isinstance(processes, ProcessSet):
+        processes = ProcessSet.from_dicts(processes)
+    if algorithms is None:
+        algorithms = supported_algorithms(cores, processes.io is not None)
+    jobs = [(algorithm, quantum, switch_cost, cores, per_core_queues, work_stealing, mlfq, warmup)
+            for algorithm in algorithms]
+    results = run_parallel(processes, jobs, max_workers, cache=cache, progress=progress)
+    return dict(zip(algorithms, results))
+
+
+def quantum_sweep(processes, quanta, switch_costs=(0,), max_workers=None, cache=None, progress=None, warmup=0):
+    # Evalúa Round Robin para cada combinación de quantum y costo de cambio de contexto
+    jobs = [("Round Robin", quantum, cost, 1, False, False, None, warmup) for cost in switch_costs for quantum in quanta]
+    results = run_parallel(processes, jobs, max_workers, keep_timelines=False, cache=cache, progress=progress)
+    return [
+        {
+            "quantum": quantum,
+            "switch_cost": cost,
+            "avg_wait_time": metrics["avg_wait_time"],
+            "avg_response_time": metrics["avg_response_time"],
+            "avg_turnaround_time": metrics["avg_turnaround_time"],
+            "context_switches": metrics["context_switches"],
+            "overhead_pct": metrics["overhead_pct"],
+            "cpu_usage": metrics["cpu_usage"]
+        }
+        for (_, quantum, cost, *_), (_, metrics) in zip(jobs, results)
+    ]
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulador de planificación de procesos (sin interfaz gráfica)")
+    parser.add_argument("file", help="archivo de procesos: JSON (como Proceso.json), JSON Lines, CSV o .npz")
+    parser.add_argument("-a", "--algorithm", default="FCFS", choices=list(ALGORITHMS))
+    parser.add_argument("-q", "--quantum", type=int, default=2, help="quantum para Round Robin")
+    parser.add_argument("--switch-cost", default="0",
+                        help="costo de cambio de contexto entre tramos de procesos distintos "
+                             "(en modo barrido acepta rangos: 0,1,2)")
+    parser.add_argument("--warmup", type=int, default=0,
+                        help="penalización adicional al reanudar un proceso que ya se había ejecutado (caché fría)")
+    parser.add_argument("--sweep", metavar="QUANTA",
+                        help="barrido de quanta de Round Robin, p.ej. 1-20 o 1,2,4,8; imprime solo métricas")
+    parser.add_argument("--cores", type=int, default=1, help="número de núcleos (SMP)")
+    parser.add_argument("--per-core-queues", action="store_true",
+                        help="una cola de listos por núcleo en lugar de una cola global")
+    parser.add_argument("--work-stealing", action="store_true",
+                        help="con colas por núcleo, un núcleo libre roba procesos de la cola más larga")
+    parser.add_argument("--mlfq-quanta", default=",".join(map(str, MLFQ_QUANTA)),
+                        help="quantum de cada nivel de MLFQ, del más prioritario al menos prioritario")
+    parser.add_argument("--boost-interval", type=int, default=0,
+                        help="en MLFQ, cada cuántas unidades todos los procesos vuelven al primer nivel (0: nunca)")
+    parser.add_argument("--aging", type=int, default=0,
+                        help="en MLFQ, espera tras la cual un proceso sube un nivel (0: sin envejecimiento)")
+    parser.add_argument("--cache-dir", metavar="DIR",
+                        help="directorio donde guardar resultados para reutilizarlos entre ejecuciones")
+    parser.add_argument("--save-timeline", metavar="ARCHIVO",
+                        help="guardar el timeline en formato binario (.npz) en lugar de imprimirlo")
+    parser.add_argument("--export", metavar="ARCHIVO",
+                        help="exportar el timeline por bloques mientras se simula (.csv, .jsonl o .npz), sin "
+                             "guardarlo completo en memoria; no calcula métricas")
+    args = parser.parse_args(argv)
+
+    try:
+        processes = load_processes(args.file)
+        switch_costs = parse_int_range(args.switch_cost)
+        cache = ResultCache(directory=args.cache_dir) if args.cache_dir else None
+        if args.sweep:
+            json.dump(quantum_sweep(processes, parse_int_range(args.sweep), switch_costs, cache=cache,
+                                    warmup=args.warmup),
+                      sys.stdout, indent=2)
+            sys.stdout.write("\n")
+            return
+        if len(switch_costs) > 1:
+            raise ValueError("Solo el modo --sweep acepta varios costos de cambio de contexto")
+        mlfq = mlfq_settings([int(quantum) for quantum in args.mlfq_quanta.split(",")], args.boost_interval,
+                             args.aging)
+        job = (args.algorithm, args.quantum, switch_costs[0], args.cores, args.per_core_queues, args.work_stealing,
+               mlfq, args.warmup)
+        output = {
+            "algorithm": args.algorithm,
+            "quantum": args.quantum if args.algorithm == "Round Robin" else None,
+            "cores": args.cores,
+            "mlfq": mlfq if args.algorithm == "MLFQ" else None,
+        }
+        # Lo que se guarda junto al timeline en los archivos .npz
+        info = dict(output, switch_cost=switch_costs[0], warmup=args.warmup, per_core_queues=args.per_core_queues,
+                    work_stealing=args.work_stealing)
+        if args.export:
+            # Los bloques se escriben a medida que el motor los emite
+            output["slices"] = export_timeline(args.export, iter_algorithm(args.algorithm, processes, *job[1:]), info)
+            output["timeline_file"] = args.export
+            json.dump(output, sys.stdout, indent=2)
+            sys.stdout.write("\n")
+            return
+        if cache is not None:
+            [(timeline, _)] = run_parallel(processes, [job], cache=cache)
+        else:
+            timeline = run_algorithm(args.algorithm, processes, *job[1:])
+    except (OSError, ValueError) as e:
+        parser.exit(1, f"Error: {e}\n")
+
+    if args.save_timeline:
+        # Un timeline de millones de tramos no se imprime: queda en el archivo binario
+        try:
+            save_timeline(args.save_timeline, timeline, info)
+        except OSError as e:
+            parser.exit(1, f"Error: {e}\n")
+        output["timeline_file"] = args.save_timeline
+    else:
+        output["timeline"] = timeline.to_dicts()
+    output["metrics"] = calculate_metrics(processes, timeline) if timeline else None
+    if timeline.io_pid is not None and not args.save_timeline:
+        output["io"] = timeline.io_dicts()
+    json.dump(output, sys.stdout, indent=2)
+    sys.stdout.write("\n")
+
+
+if __name__ == "__main__":
+    main()
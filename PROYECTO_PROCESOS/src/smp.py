@@ -0,0 +1,397 @@
+"""Planificación en varios núcleos (SMP).
+
+Un único bucle de eventos sirve a todos los algoritmos: los núcleos terminan tramos
+(fin de ráfaga o de quantum) y los procesos llegan; en cada instante se despachan
+los núcleos libres y, en los algoritmos expropiativos, un proceso listo expropia
+al núcleo cuyo proceso en ejecución tiene el peor valor.
+
+Con colas globales todos los núcleos comparten una cola de listos. Con colas por
+núcleo cada llegada se asigna a los núcleos por turno y un proceso expropiado o
+con el quantum agotado vuelve a la cola de su núcleo; con robo de trabajo un
+núcleo que se queda sin procesos toma uno de la cola más larga.
+
+El costo de cambio de contexto se paga por núcleo, igual que en scheduler.py: antes
+de un tramo de un proceso distinto del último que usó ese núcleo. Si un proceso mejor
+expropia al núcleo durante el cambio, el cambio se redirige y el tiempo ya perdido se
+suma al del nuevo proceso.
+
+Si los procesos tienen ráfagas de E/S, al terminar una ráfaga de CPU el proceso se
+bloquea y espera en la cola FIFO de su dispositivo, que atiende una operación a la
+vez; al terminarla vuelve a la cola de listos (con colas por núcleo, a la del último
+núcleo que lo ejecutó). SJF y SRTF ordenan por la ráfaga de CPU en curso.
+
+Con un solo núcleo y cola global el resultado coincide con los motores de
+scheduler.py.
+
+Los tramos se registran al terminar, pero el timeline se ordena por inicio: al
+emitirlo por bloques (chunk_size) solo salen los tramos que empiezan antes que el
+tramo en curso más antiguo, y el resto espera al bloque siguiente.
+
+Con stats=True el último bloque trae los contadores del bucle (despachos,
+expropiaciones incluido el quantum agotado y operaciones sobre los montículos de
+listos; FCFS y Round Robin usan colas FIFO y no los tocan).
+"""
+import heapq
+from array import array
+from collections import deque
+
+import numpy as np
+
+from model import Timeline, engine_stats, streamed
+
+
+SMP_ALGORITHMS = ("FCFS", "SJF", "SRTF", "Round Robin", "Prioridades")
+# Tramos entre dos llamadas a progress
+PROGRESS_INTERVAL = 4096
+INFINITY = float("inf")
+
+
+def _sorted_slices(pids, starts, ends, cpus, overheads):
+    # Columnas de los tramos registrados, ordenadas por inicio y núcleo
+    order = np.lexsort((np.frombuffer(cpus, dtype=np.int16), np.frombuffer(starts, dtype=np.int64)))
+    return (np.frombuffer(pids, dtype=np.int32)[order], np.frombuffer(starts, dtype=np.int64)[order],
+            np.frombuffer(ends, dtype=np.int64)[order], np.frombuffer(cpus, dtype=np.int16)[order],
+            None if overheads is None else np.frombuffer(overheads, dtype=np.int64)[order])
+
+
+@streamed
+def smp_algorithm(processes, algorithm, cores=2, quantum=2, per_core_queues=False, work_stealing=False,
+                  progress=None, switch_cost=0, warmup=0, chunk_size=None, stats=False):
+    # progress(admitidos, total) se llama cada PROGRESS_INTERVAL tramos y puede lanzar
+    # una excepción para cancelar
+    if algorithm not in SMP_ALGORITHMS:
+        raise ValueError(f"{algorithm} no está soportado con varios núcleos ni con ráfagas de E/S")
+    if cores <= 0:
+        raise ValueError("El número de núcleos debe ser mayor que 0")
+    if algorithm == "Round Robin" and quantum <= 0:
+        raise ValueError("El quantum debe ser mayor que 0")
+
+    io = processes.io
+    # burst y remaining son los de la ráfaga de CPU en curso; position, su índice en io.bursts
+    burst_column = processes.burst if io is None else io.bursts[io.offsets[:-1]]
+    if algorithm == "SJF":
+        order = np.lexsort((burst_column, processes.arrival)).tolist()
+    else:
+        order = np.argsort(processes.arrival, kind="stable").tolist()
+    arrival = processes.arrival.tolist()
+    arrival_rank = [0] * len(order)
+    for rank, row in enumerate(order):
+        arrival_rank[row] = rank
+    burst = burst_column.tolist()
+    remaining = list(burst)
+    if io is not None:
+        position = io.offsets[:-1].tolist()
+        last_position = (io.offsets[1:] - 1).tolist()
+        io_bursts = io.bursts.tolist()
+        io_device = io.device.tolist()
+        # Núcleo al que vuelve cada proceso tras la E/S (colas por núcleo)
+        home = [0] * len(order)
+        started = io.offsets[:-1].tolist()
+        device_count = len(io.device_names)
+        device_queues = [deque() for _ in range(device_count)]
+        device_busy = [False] * device_count
+        # (fin de la operación, dispositivo, proceso, instante de bloqueo, inicio)
+        io_events = []
+        io_pids, io_devices, io_blockeds, io_starts, io_ends = array("i"), array("i"), array("q"), array("q"), array("q")
+    else:
+        io_events = ()
+    priority = processes.priority.tolist()
+    total = len(order)
+
+    fifo = algorithm in ("FCFS", "Round Robin")
+    preemptive = algorithm in ("SRTF", "Prioridades")
+    time_slice = quantum if algorithm == "Round Robin" else None
+    if algorithm in ("SJF", "SRTF"):
+        key = remaining.__getitem__
+    else:
+        key = priority.__getitem__
+    # En SRTF el valor de un proceso en ejecución baja con el tiempo; se compara su
+    # instante de fin (restante + ahora), que no cambia mientras se ejecuta
+    relative = algorithm == "SRTF"
+
+    queue_count = cores if per_core_queues else 1
+    queues = [deque() if fifo else [] for _ in range(queue_count)]
+    queued = 0
+    sequence = 0
+    next_queue = 0
+    dispatches = preemptions = heap_pushes = heap_pops = 0
+
+    running = [None] * cores
+    # run_start es el fin del cambio de contexto; switch_start, su comienzo
+    run_start = [0] * cores
+    switch_start = [None] * cores
+    last_row = [None] * cores
+    tokens = [0] * cores
+    # Montículo de núcleos libres, salvo con colas por núcleo sin robo de trabajo: ahí
+    # cada núcleo solo toma de su propia cola y no compite con los demás
+    shared = not per_core_queues or work_stealing
+    idle = list(range(cores))
+    # (fin del tramo, núcleo, token): un token viejo indica un tramo expropiado
+    events = []
+    # Montículo de máximos (valor negado) de los procesos en ejecución para expropiar
+    running_rank = []
+
+    pids, starts, ends, cpus = array("i"), array("q"), array("q"), array("h")
+    # Como en scheduler.py, sin costo de cambio la columna de sobrecarga solo existe si
+    # algún proceso puede reanudarse (y pagar el calentamiento)
+    resumable = preemptive or time_slice is not None or io is not None
+    overheads = array("q") if switch_cost or (warmup and resumable) else None
+    next_report = PROGRESS_INTERVAL
+    process_index = 0
+    # Tramos ya emitidos en bloques anteriores
+    emitted = 0
+    next_chunk = chunk_size
+    now = 0
+
+    def io_columns():
+        if io is None:
+            return {}
+        return {"io_pid": np.frombuffer(io_pids, dtype=np.int32), "io_device": np.frombuffer(io_devices, dtype=np.int32),
+                "io_blocked": np.frombuffer(io_blockeds, dtype=np.int64),
+                "io_start": np.frombuffer(io_starts, dtype=np.int64), "io_end": np.frombuffer(io_ends, dtype=np.int64)}
+
+    def enqueue(row, queue_index):
+        nonlocal queued, sequence, heap_pushes
+        if fifo:
+            queues[queue_index].append(row)
+        elif preemptive:
+            heapq.heappush(queues[queue_index], (key(row), sequence, row))
+            sequence += 1
+            heap_pushes += 1
+        else:
+            # SJF: la posición en el orden de llegada desempata ráfagas iguales, también
+            # para los procesos que vuelven de la E/S
+            heapq.heappush(queues[queue_index], (key(row), arrival_rank[row], row))
+            heap_pushes += 1
+        queued += 1
+
+    def pop(queue_index):
+        nonlocal queued, heap_pops
+        queued -= 1
+        queue = queues[queue_index]
+        if fifo:
+            return queue.popleft()
+        heap_pops += 1
+        return heapq.heappop(queue)[2]
+
+    def dispatch(core, now):
+        nonlocal dispatches, heap_pushes, heap_pops
+        queue_index = core if per_core_queues else 0
+        if not queues[queue_index]:
+            if not (work_stealing and queued):
+                return
+            # Robo de trabajo: la cola más larga cede un proceso
+            queue_index = max(range(queue_count), key=lambda i: len(queues[i]))
+            if fifo:
+                queued_row = queues[queue_index].pop()
+                queues[core].append(queued_row)
+            else:
+                entry = heapq.heappop(queues[queue_index])
+                heapq.heappush(queues[core], entry)
+                heap_pops += 1
+                heap_pushes += 1
+            queue_index = core
+        row = pop(queue_index)
+        dispatches += 1
+        running[core] = row
+        if switch_start[core] is None:
+            switch_start[core] = now
+        if last_row[core] is not None and row != last_row[core]:
+            resumed = remaining[row] < burst[row] or (io is not None and position[row] != started[row])
+            now += switch_cost + (warmup if resumed else 0)
+        run_start[core] = now
+        tokens[core] += 1
+        length = remaining[row] if time_slice is None else min(time_slice, remaining[row])
+        heapq.heappush(events, (now + length, core, tokens[core]))
+        if preemptive:
+            rank = now + remaining[row] if relative else key(row)
+            heapq.heappush(running_rank, (-rank, core, tokens[core]))
+
+    def stop(core, now):
+        row = running[core]
+        if now > run_start[core]:
+            pids.append(row)
+            starts.append(run_start[core])
+            ends.append(now)
+            cpus.append(core)
+            if overheads is not None:
+                overheads.append(run_start[core] - switch_start[core])
+            remaining[row] -= now - run_start[core]
+            last_row[core] = row
+            switch_start[core] = None
+        running[core] = None
+        tokens[core] += 1
+        return row
+
+    def start_io(device, row, blocked, now):
+        device_busy[device] = True
+        heapq.heappush(io_events, (now + io_bursts[position[row] + 1], device, row, blocked, now))
+
+    def current_rank(core, now):
+        # Durante un cambio de contexto el proceso de SRTF aún no avanza, así que su
+        # instante de fin se cuenta desde ahora
+        if relative:
+            return min(now, run_start[core]) + remaining[running[core]]
+        return key(running[core])
+
+    def worst_running(now):
+        # Núcleo cuyo proceso tiene el peor valor. Las entradas de los núcleos que están
+        # cambiando de contexto (solo en SRTF) no reflejan su valor actual: se apartan y
+        # se comparan aparte; como mucho hay una por núcleo
+        switching = []
+        worst = None
+        while running_rank:
+            rank, core, token = running_rank[0]
+            if token != tokens[core]:
+                heapq.heappop(running_rank)
+            elif relative and run_start[core] > now:
+                switching.append(heapq.heappop(running_rank))
+            else:
+                worst = (-rank, core)
+                break
+        for entry in switching:
+            core = entry[1]
+            rank = current_rank(core, now)
+            if worst is None or rank > worst[0] or (rank == worst[0] and core < worst[1]):
+                worst = (rank, core)
+            heapq.heappush(running_rank, entry)
+        return worst
+
+    def preempt(now, queue_index):
+        nonlocal preemptions
+        # Con colas por núcleo un proceso solo compite con el de su propio núcleo
+        queue = queues[queue_index]
+        while queue:
+            if per_core_queues:
+                core = queue_index
+                if running[core] is None:
+                    return
+                rank = current_rank(core, now)
+            else:
+                worst = worst_running(now)
+                if worst is None:
+                    return
+                rank, core = worst
+            best = queue[0][0] + now if relative else queue[0][0]
+            if best >= rank:
+                return
+            row = stop(core, now)
+            preemptions += 1
+            enqueue(row, queue_index)
+            dispatch(core, now)
+            if per_core_queues:
+                return
+
+    while process_index < total or events or io_events:
+        if progress is not None and emitted + len(pids) >= next_report:
+            progress(process_index, total)
+            next_report = emitted + len(pids) + PROGRESS_INTERVAL
+
+        if chunk_size is not None and len(pids) >= next_chunk:
+            # Ningún tramo futuro empieza antes que el más antiguo de los que están en curso
+            # ni antes del instante actual
+            watermark = min([run_start[core] for core in range(cores) if running[core] is not None] + [now])
+            pid, start, end, cpu, overhead = _sorted_slices(pids, starts, ends, cpus, overheads)
+            ready = int(np.searchsorted(start, watermark))
+            if ready:
+                yield Timeline(processes, pid[:ready], start[:ready], end[:ready], None if cores == 1 else cpu[:ready],
+                               cores, None if overhead is None else overhead[:ready], **io_columns())
+                emitted += ready
+                pids, starts, ends, cpus = (array("i", pid[ready:].tobytes()), array("q", start[ready:].tobytes()),
+                                            array("q", end[ready:].tobytes()), array("h", cpu[ready:].tobytes()))
+                if overheads is not None:
+                    overheads = array("q", overhead[ready:].tobytes())
+                if io is not None:
+                    io_pids, io_devices, io_blockeds, io_starts, io_ends = (array("i"), array("i"), array("q"),
+                                                                            array("q"), array("q"))
+            # Si un tramo largo retiene el bloque, se reintenta después de otros chunk_size tramos
+            next_chunk = len(pids) + chunk_size
+
+        now = events[0][0] if events else INFINITY
+        if process_index < total and arrival[order[process_index]] < now:
+            now = arrival[order[process_index]]
+        if io_events and io_events[0][0] < now:
+            now = io_events[0][0]
+
+        # 1. Tramos que terminan ahora (fin de ráfaga o de quantum)
+        expired = []
+        blocked = []
+        freed = []
+        while events and events[0][0] == now:
+            _, core, token = heapq.heappop(events)
+            if token != tokens[core]:
+                continue
+            row = stop(core, now)
+            freed.append(core)
+            if remaining[row] > 0:
+                expired.append((row, core))
+                preemptions += 1
+            elif io is not None and position[row] != last_position[row]:
+                home[row] = core
+                blocked.append(row)
+
+        # E/S: las operaciones que terminan liberan su dispositivo para el siguiente de
+        # la cola; después los procesos recién bloqueados piden el suyo
+        returned = []
+        while io_events and io_events[0][0] == now:
+            _, device, row, blocked_at, io_start = heapq.heappop(io_events)
+            io_pids.append(row)
+            io_devices.append(device)
+            io_blockeds.append(blocked_at)
+            io_starts.append(io_start)
+            io_ends.append(now)
+            device_busy[device] = False
+            if device_queues[device]:
+                start_io(device, *device_queues[device].popleft(), now)
+            position[row] += 2
+            burst[row] = remaining[row] = io_bursts[position[row]]
+            returned.append(row)
+        for row in blocked:
+            device = io_device[position[row] + 1]
+            if device_busy[device]:
+                device_queues[device].append((row, now))
+            else:
+                start_io(device, row, now, now)
+
+        # 2. Llegadas; como en round_robin_algorithm, antes que los procesos que
+        # vuelven a la cola por agotar su quantum. Los que vuelven de la E/S van entre
+        # unos y otros
+        touched = set()
+        while process_index < total and arrival[order[process_index]] <= now:
+            queue_index = next_queue if per_core_queues else 0
+            next_queue = (next_queue + 1) % queue_count
+            enqueue(order[process_index], queue_index)
+            touched.add(queue_index)
+            process_index += 1
+        for row in returned:
+            queue_index = home[row] if per_core_queues else 0
+            enqueue(row, queue_index)
+            touched.add(queue_index)
+        for row, core in expired:
+            enqueue(row, core if per_core_queues else 0)
+
+        # 3. Núcleos libres, empezando por el de menor índice
+        if shared:
+            # Con una cola compartida (o con robo) cada núcleo libre toma un proceso
+            # mientras quede alguno en cola
+            for core in freed:
+                heapq.heappush(idle, core)
+            while idle and queued:
+                core = heapq.heappop(idle)
+                dispatch(core, now)
+        else:
+            # Un núcleo libre ya tenía su cola vacía; solo pueden despachar los que se
+            # liberaron ahora y los de las colas que recibieron procesos
+            for core in sorted(touched.union(freed)):
+                if running[core] is None:
+                    dispatch(core, now)
+
+        # 4. Expropiación por las llegadas
+        if preemptive:
+            for queue_index in touched:
+                preempt(now, queue_index)
+
+    pid, start, end, cpu, overhead = _sorted_slices(pids, starts, ends, cpus, overheads)
+    # Con un solo núcleo no hay columna de núcleos, como en los motores de scheduler.py
+    yield Timeline(processes, pid, start, end, None if cores == 1 else cpu, cores, overhead, **io_columns(),
+                   stats=engine_stats(dispatches, preemptions, heap_pushes, heap_pops) if stats else None)
@@ -0,0 +1,195 @@
+"""Formato binario de procesos y timelines: .npz sin comprimir, un arreglo por columna.
+
+np.savez guarda cada arreglo como un .npy sin comprimir dentro del zip, así que sus
+datos son bytes contiguos en el archivo y se pueden mapear en memoria con np.memmap:
+abrir una carga o un timeline de millones de filas no lee ni copia nada hasta que se
+usan las columnas, y el sistema operativo carga solo las páginas que se tocan (por
+ejemplo, las del tramo visible del Gantt). Las columnas de procesos son id, arrival,
+burst y priority (las mismas que escribe generator.py) y, si hay ráfagas de E/S,
+bursts_offsets, bursts, bursts_device y device_names. Un timeline guarda además los
+procesos y sus columnas (las de Timeline.columns()), más un JSON con el algoritmo y
+sus parámetros.
+
+save_timeline_chunks escribe el mismo archivo a partir de los bloques de
+iter_algorithm sin juntar el timeline en memoria: cada columna se acumula en un
+archivo temporal y al final se copia dentro del zip.
+"""
+import json
+import os
+import shutil
+import struct
+import tempfile
+import zipfile
+from contextlib import ExitStack
+from itertools import chain
+
+import numpy as np
+
+from cache import TIMELINE_COLUMNS
+from model import IOBursts, ProcessSet, Timeline
+
+
+# Se incrementa si cambian los nombres o el significado de las columnas
+STORAGE_VERSION = 1
+# Encabezado local de cada archivo del zip: 30 bytes y luego nombre y campo extra
+_ZIP_LOCAL_HEADER = struct.Struct("<4s5H3L2H")
+
+
+def _json_array(value):
+    return np.frombuffer(json.dumps(value).encode(), dtype=np.uint8)
+
+
+def _json_value(array):
+    return json.loads(np.asarray(array).tobytes().decode())
+
+
+def process_arrays(processes):
+    if processes.ids.dtype.kind == "O":
+        # IDs mezclados (números y texto): no caben en un arreglo de tipo fijo
+        arrays = {"id_json": _json_array(processes.ids.tolist())}
+    else:
+        arrays = {"id": processes.ids}
+    arrays.update(arrival=processes.arrival, burst=processes.burst, priority=processes.priority)
+    if processes.io is not None:
+        arrays.update(bursts_offsets=processes.io.offsets, bursts=processes.io.bursts,
+                      bursts_device=processes.io.device, device_names=_json_array(processes.io.device_names))
+    return arrays
+
+
+def _write(file_path, arrays):
+    arrays["format_version"] = np.int64(STORAGE_VERSION)
+    # Con un objeto archivo np.savez no agrega la extensión .npz al nombre
+    with open(file_path, "wb") as f:
+        np.savez(f, **arrays)
+
+
+def save_process_set(file_path, processes):
+    _write(file_path, process_arrays(processes))
+
+
+def save_timeline(file_path, timeline, info=None):
+    # info: algoritmo y parámetros de la simulación (cualquier dato serializable a JSON)
+    arrays = process_arrays(timeline.processes)
+    arrays.update(timeline.columns())
+    if "cores" in arrays:
+        arrays["cores"] = np.int64(arrays["cores"])
+    arrays["info"] = _json_array(info or {})
+    _write(file_path, arrays)
+
+
+def save_timeline_chunks(file_path, chunks, info=None):
+    # Devuelve la cantidad de tramos escritos
+    chunks = iter(chunks)
+    first = next(chunks)
+    names = list(first.columns())
+    scalars = {"cores": np.int64(first.cores)} if "cores" in names else {}
+    names = [name for name in names if name not in scalars]
+    dtypes = {name: first.columns()[name].dtype for name in names}
+    directory = tempfile.mkdtemp(prefix=".timeline-", dir=os.path.dirname(os.path.abspath(file_path)))
+    try:
+        counts = dict.fromkeys(names, 0)
+        with ExitStack() as stack:
+            files = {name: stack.enter_context(open(os.path.join(directory, name), "wb")) for name in names}
+            for chunk in chain([first], chunks):
+                columns = chunk.columns()
+                for name in names:
+                    files[name].write(np.ascontiguousarray(columns[name], dtype=dtypes[name]).tobytes())
+                    counts[name] += len(columns[name])
+
+        arrays = process_arrays(first.processes)
+        arrays.update(scalars)
+        arrays["info"] = _json_array(info or {})
+        arrays["format_version"] = np.int64(STORAGE_VERSION)
+        with zipfile.ZipFile(file_path, "w", zipfile.ZIP_STORED, allowZip64=True) as archive:
+            for name, array in arrays.items():
+                with archive.open(f"{name}.npy", "w", force_zip64=True) as member:
+                    np.lib.format.write_array(member, np.asanyarray(array), allow_pickle=False)
+            for name in names:
+                with archive.open(f"{name}.npy", "w", force_zip64=True) as member, \
+                        open(os.path.join(directory, name), "rb") as column:
+                    header = {"descr": np.lib.format.dtype_to_descr(dtypes[name]), "fortran_order": False,
+                              "shape": (counts[name],)}
+                    np.lib.format.write_array_header_2_0(member, header)
+                    shutil.copyfileobj(column, member)
+    finally:
+        shutil.rmtree(directory, ignore_errors=True)
+    return counts["pid"]
+
+
+def _member_offsets(file_path):
+    # Posición de los datos de cada .npy guardado sin comprimir dentro del zip
+    offsets = {}
+    with zipfile.ZipFile(file_path) as archive, open(file_path, "rb") as f:
+        for member in archive.infolist():
+            if member.compress_type != zipfile.ZIP_STORED or not member.filename.endswith(".npy"):
+                continue
+            f.seek(member.header_offset)
+            header = _ZIP_LOCAL_HEADER.unpack(f.read(_ZIP_LOCAL_HEADER.size))
+            offsets[member.filename[:-4]] = member.header_offset + _ZIP_LOCAL_HEADER.size + header[-2] + header[-1]
+    return offsets
+
+
+def _memmap(file_path, offset):
+    with open(file_path, "rb") as f:
+        f.seek(offset)
+        version = np.lib.format.read_magic(f)
+        if version == (1, 0):
+            shape, fortran_order, dtype = np.lib.format.read_array_header_1_0(f)
+        else:
+            shape, fortran_order, dtype = np.lib.format.read_array_header_2_0(f)
+        offset = f.tell()
+    if dtype.hasobject or not shape or 0 in shape:
+        # Objetos, escalares y arreglos vacíos no se pueden mapear; se leen normalmente
+        return None
+    return np.memmap(file_path, dtype=dtype, mode="r", offset=offset, shape=shape,
+                     order="F" if fortran_order else "C")
+
+
+def read_arrays(file_path, mmap=True):
+    # Columnas del archivo por nombre. Con mmap, las que están sin comprimir se mapean
+    # en memoria (de solo lectura) y el resto se lee; así también se abren los .npz
+    # comprimidos o escritos por otras herramientas
+    with np.load(file_path, allow_pickle=False) as data:
+        arrays = {}
+        offsets = _member_offsets(file_path) if mmap else {}
+        for name in data.files:
+            array = _memmap(file_path, offsets[name]) if name in offsets else None
+            arrays[name] = data[name] if array is None else array
+    version = int(arrays.get("format_version", STORAGE_VERSION))
+    if version > STORAGE_VERSION:
+        raise ValueError(f"El archivo usa una versión más nueva del formato binario ({version})")
+    return arrays
+
+
+def processes_from_arrays(arrays):
+    if not {"arrival", "burst"} <= set(arrays) or not {"id", "id_json"} & set(arrays):
+        raise ValueError("El archivo .npz debe tener los arreglos id, arrival, burst (y opcionalmente priority)")
+    ids = arrays["id"] if "id" in arrays else _json_value(arrays["id_json"])
+    arrival, burst, priority = arrays["arrival"], arrays["burst"], arrays.get("priority")
+    if any(column is not None and column.dtype.kind not in "iu" for column in (arrival, burst, priority)):
+        raise ValueError("Los tiempos y prioridades de los procesos deben ser enteros")
+    if len(burst) and burst.min() <= 0:
+        raise ValueError("El tiempo de ráfaga de todos los procesos debe ser mayor que 0")
+    if len(arrival) and arrival.min() < 0:
+        raise ValueError("El tiempo de llegada de los procesos no puede ser negativo")
+    io = None
+    if "bursts_offsets" in arrays:
+        io = IOBursts(arrays["bursts_offsets"], arrays["bursts"], arrays["bursts_device"],
+                      _json_value(arrays["device_names"]))
+    return ProcessSet(ids, arrival, burst, priority, io)
+
+
+def load_process_set(file_path, mmap=True):
+    return processes_from_arrays(read_arrays(file_path, mmap))
+
+
+def load_timeline(file_path, mmap=True):
+    # Devuelve (timeline, info)
+    arrays = read_arrays(file_path, mmap)
+    if "pid" not in arrays:
+        raise ValueError("El archivo no contiene un timeline")
+    columns = {name: arrays[name] for name in TIMELINE_COLUMNS if name in arrays}
+    if "cores" in columns:
+        columns["cores"] = int(columns["cores"])
+    info = _json_value(arrays["info"]) if "info" in arrays else {}
+    return Timeline(processes_from_arrays(arrays), **columns), info
@@ -0,0 +1,51 @@
+"""Simulaciones en segundo plano para que la interfaz siga respondiendo.
+
+La función de trabajo recibe la tarea y le informa del avance con
+task.report(hecho, total); si el usuario canceló, report lanza TaskCancelled y la
+simulación se interrumpe en ese punto. La interfaz consulta el estado con after()
+y solo dibuja el resultado en el hilo de Tk.
+"""
+import threading
+
+
+class TaskCancelled(Exception):
+    pass
+
+
+class BackgroundTask:
+    def __init__(self, function, description=""):
+        self.function = function
+        self.description = description
+        self.fraction = 0.0
+        self.result = None
+        self.error = None
+        self._cancelled = threading.Event()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+
+    def start(self):
+        self._thread.start()
+        return self
+
+    def _run(self):
+        try:
+            self.result = self.function(self)
+        except TaskCancelled:
+            pass
+        except Exception as e:
+            self.error = e
+
+    def report(self, done, total):
+        if self._cancelled.is_set():
+            raise TaskCancelled()
+        self.fraction = done / total if total else 1.0
+
+    def cancel(self):
+        self._cancelled.set()
+
+    @property
+    def cancelled(self):
+        return self._cancelled.is_set()
+
+    @property
+    def finished(self):
+        return not self._thread.is_alive()
@@ -0,0 +1,38 @@
+import numpy as np
+
+from cache import ResultCache
+from model import ProcessSet, Timeline
+
+
+def timeline(slices):
+    processes = ProcessSet([1], [0], [slices])
+    return Timeline(processes, np.zeros(slices), np.arange(slices), np.arange(1, slices + 1))
+
+
+def test_memory_is_bounded_by_bytes():
+    # Cada tramo ocupa 4 + 8 + 8 bytes (pid, inicio y fin)
+    cache = ResultCache(max_bytes=2500)
+    for key in "abc":
+        cache.put(key, timeline(50))
+    assert cache.nbytes == 2000
+    assert "a" not in cache and "b" in cache and "c" in cache
+    cache.get("b")
+    cache.put("d", timeline(50))
+    assert "c" not in cache and "b" in cache and "d" in cache
+    assert cache.nbytes <= cache.max_bytes
+
+
+def test_oversized_entry_is_not_kept_in_memory():
+    cache = ResultCache(max_bytes=1000)
+    cache.put("small", timeline(10))
+    cache.put("large", timeline(100))
+    assert len(cache) == 0 and cache.nbytes == 0
+
+
+def test_replacing_an_entry_updates_the_size():
+    cache = ResultCache(max_bytes=10 ** 6)
+    cache.put("a", timeline(10))
+    cache.put("a", timeline(20))
+    assert cache.nbytes == 20 * 20
+    cache.clear()
+    assert cache.nbytes == 0
@@ -0,0 +1,108 @@
+import threading
+import tracemalloc
+
+import pytest
+
+from diagnostics import Instrumentation, timeline_counters
+from incremental import IncrementalSimulator
+from model import ProcessSet, Timeline
+from scheduler import iter_algorithm, run_algorithm
+from smp import smp_algorithm
+
+
+def test_round_robin_counts_expired_quanta_as_preemptions():
+    processes = ProcessSet([1, 2], [0, 0], [3, 1])
+    timeline = run_algorithm("Round Robin", processes, quantum=2, stats=True)
+    # 1 corre 0-2 (agota el quantum), 2 corre 2-3 y 1 termina en 3-4; la cola es FIFO
+    assert timeline_counters(timeline) == {"slices": 3, "dispatches": 3, "preemptions": 1, "heap_pushes": 0,
+                                           "heap_pops": 0, "io_operations": 0}
+
+
+def test_srtf_counts_heap_operations():
+    # A corre 0-1, B lo expropia y C expropia a B; A y B vuelven al montículo
+    processes = ProcessSet(["A", "B", "C"], [0, 1, 2], [7, 4, 1])
+    timeline = run_algorithm("SRTF", processes, stats=True)
+    assert timeline.stats == {"dispatches": 5, "preemptions": 2, "heap_pushes": 5, "heap_pops": 5}
+
+
+def test_sjf_pushes_every_arrival_once():
+    processes = ProcessSet(["A", "B", "C"], [0, 1, 2], [7, 4, 1])
+    assert run_algorithm("SJF", processes, stats=True).stats == {
+        "dispatches": 3, "preemptions": 0, "heap_pushes": 3, "heap_pops": 3}
+
+
+def test_counters_are_only_collected_when_asked():
+    processes = ProcessSet([1, 2], [0, 0], [3, 1])
+    timeline = run_algorithm("Round Robin", processes, quantum=2)
+    assert timeline.stats is None
+    assert timeline_counters(timeline) == {"slices": 3, "io_operations": 0}
+
+
+def test_only_the_last_chunk_carries_the_counters():
+    processes = ProcessSet(list(range(6)), [0] * 6, [3] * 6)
+    chunks = list(iter_algorithm("Round Robin", processes, quantum=1, chunk_size=4, stats=True))
+    assert all(chunk.stats is None for chunk in chunks[:-1])
+    assert chunks[-1].stats == run_algorithm("Round Robin", processes, quantum=1, stats=True).stats
+    assert Timeline.concat(chunks).stats["dispatches"] == 18
+
+
+@pytest.mark.parametrize("algorithm", ["FCFS", "SJF", "SRTF", "Round Robin", "Prioridades"])
+def test_smp_counts_like_the_single_core_engines(algorithm):
+    processes = ProcessSet(list(range(8)), [0, 1, 1, 3, 4, 4, 9, 10], [5, 2, 7, 1, 3, 3, 2, 4],
+                           [3, 1, 2, 1, 3, 2, 1, 2])
+    expected = run_algorithm(algorithm, processes, quantum=2, switch_cost=1, stats=True).stats
+    assert smp_algorithm(processes, algorithm, 1, 2, switch_cost=1, stats=True).stats == expected
+
+
+def test_resumed_simulation_counts_from_the_start():
+    rows = [{"id": i, "arrival": i * 3, "burst": 4 + i % 3} for i in range(20000)]
+    simulator = IncrementalSimulator("Round Robin")
+    simulator.run(ProcessSet.from_dicts(rows), progress=lambda done, total: None, stats=True)
+    rows[-1]["burst"] += 1
+    processes = ProcessSet.from_dicts(rows)
+    timeline = simulator.run(processes, progress=lambda done, total: None, stats=True)
+    assert simulator.resumed_from > 0
+    assert timeline.stats == run_algorithm("Round Robin", processes, stats=True).stats
+    # Sin cambios se reutiliza el resultado, con sus contadores
+    assert simulator.run(processes, stats=True).stats == timeline.stats
+
+
+def test_slices_that_block_on_io_are_not_preempted():
+    processes = ProcessSet.from_dicts([{"id": 1, "arrival": 0, "bursts": [2, 3, 1], "device": "disco"},
+                                       {"id": 2, "arrival": 0, "burst": 4}])
+    timeline = run_algorithm("FCFS", processes, stats=True)
+    assert timeline_counters(timeline) == {"slices": 3, "dispatches": 3, "preemptions": 0, "heap_pushes": 0,
+                                           "heap_pops": 0, "io_operations": 1}
+
+
+def test_phases_record_their_thread_and_profile_it_separately():
+    instrumentation = Instrumentation(profile=True)
+
+    def simulate():
+        with instrumentation.phase("Simulación"):
+            run_algorithm("Round Robin", ProcessSet([1, 2], [0, 0], [3, 1]))
+
+    worker = threading.Thread(target=simulate, name="tarea")
+    worker.start()
+    worker.join()
+    with instrumentation.phase("Gantt"):
+        sorted(range(10))
+    assert instrumentation.threads == {"Simulación": "tarea", "Gantt": threading.current_thread().name}
+    functions = {thread: " ".join(row["function"] for row in instrumentation.profile_rows(thread, limit=None))
+                 for thread in instrumentation.profilers}
+    assert "round_robin_algorithm" in functions["tarea"]
+    assert "round_robin_algorithm" not in functions[threading.current_thread().name]
+    assert set(instrumentation.to_dict()["profile"]) == {"tarea", threading.current_thread().name}
+
+
+def test_tracemalloc_started_elsewhere_keeps_running():
+    tracemalloc.start()
+    try:
+        with Instrumentation(trace_memory=True).phase("Métricas"):
+            pass
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+    with Instrumentation(trace_memory=True).phase("Métricas"):
+        assert tracemalloc.is_tracing()
+    assert not tracemalloc.is_tracing()
@@ -0,0 +1,37 @@
+import pytest
+
+import generator
+from loaders import load_workload
+
+
+FORMATS = [".npz", ".jsonl", ".csv"]
+OPTIONS = [
+    [],
+    ["--burst", "pareto", "--priority", "geometric"],
+    ["--burst", "bimodal", "--long-fraction", "0.2", "--arrival-rate", "0.3"],
+]
+
+
+@pytest.fixture(autouse=True)
+def small_chunks(monkeypatch):
+    # Bloques pequeños para que la carga se genere en varios bloques
+    monkeypatch.setattr(generator, "GENERATOR_CHUNK", 7)
+
+
+def generated_digest(path, seed, options):
+    generator.main(["50", "-o", str(path), "--seed", str(seed), *options])
+    return load_workload(str(path)).digest()
+
+
+@pytest.mark.parametrize("extension", FORMATS)
+@pytest.mark.parametrize("options", OPTIONS)
+def test_same_seed_same_workload(tmp_path, extension, options):
+    first = generated_digest(tmp_path / f"a{extension}", 1, options)
+    assert generated_digest(tmp_path / f"b{extension}", 1, options) == first
+    assert generated_digest(tmp_path / f"c{extension}", 2, options) != first
+
+
+@pytest.mark.parametrize("options", OPTIONS)
+def test_same_seed_same_workload_in_every_format(tmp_path, options):
+    digests = {generated_digest(tmp_path / f"carga{extension}", 3, options) for extension in FORMATS}
+    assert len(digests) == 1
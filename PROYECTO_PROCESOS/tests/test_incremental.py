@@ -0,0 +1,58 @@
+import random
+
+import pytest
+
+import scheduler
+from incremental import IncrementalSimulator
+from model import ProcessStore
+
+
+def random_store(rng, count):
+    store = ProcessStore()
+    for pid in range(count):
+        store.append(pid, rng.randint(0, 60), rng.randint(1, 9), rng.randint(0, 3))
+    return store
+
+
+def edit(rng, store, pid):
+    # Cambia la llegada o la ráfaga de un proceso existente conservando su ID
+    process = store.get(pid)
+    store.remove(pid)
+    if rng.random() < 0.5:
+        store.append(pid, rng.randint(0, 60), process["burst"], process["priority"])
+    else:
+        store.append(pid, process["arrival"], rng.randint(1, 9), process["priority"])
+
+
+@pytest.mark.parametrize("algorithm", list(scheduler.ALGORITHMS))
+@pytest.mark.parametrize("operation", ["edit", "insert", "delete"])
+def test_resumed_runs_match_full_runs(monkeypatch, algorithm, operation):
+    # Un punto de control por tramo: cada edición reanuda desde el estado más cercano
+    monkeypatch.setattr(scheduler, "CHECKPOINT_INTERVAL", 1)
+    rng = random.Random(f"{algorithm}-{operation}")
+    resumed = 0
+    for trial in range(25):
+        store = random_store(rng, rng.randint(2, 30))
+        quantum, switch_cost, warmup = rng.randint(1, 4), rng.randint(0, 2), rng.randint(0, 1)
+        mlfq = scheduler.mlfq_settings([rng.randint(1, 3), rng.randint(2, 6)], rng.choice([0, 15]),
+                                       rng.choice([0, 10]))
+        simulator = IncrementalSimulator(algorithm)
+        next_id = len(store)
+        for step in range(6):
+            processes = store.to_process_set()
+            timeline = simulator.run(processes, quantum, switch_cost, mlfq=mlfq, warmup=warmup)
+            expected = scheduler.run_algorithm(algorithm, processes, quantum, switch_cost, mlfq=mlfq, warmup=warmup)
+            assert timeline.to_dicts() == expected.to_dicts(), (trial, step)
+            if simulator.resumed_from:
+                resumed += 1
+
+            if operation == "insert" or len(store) < 2:
+                store.append(next_id, rng.randint(0, 60), rng.randint(1, 9), rng.randint(0, 3))
+                next_id += 1
+            elif operation == "delete":
+                store.remove(rng.choice(store.ids))
+            else:
+                edit(rng, store, rng.choice(store.ids))
+    if algorithm != "FCFS":
+        # FCFS siempre se recalcula completo; los demás deben haber reanudado alguna vez
+        assert resumed
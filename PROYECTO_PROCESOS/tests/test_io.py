@@ -0,0 +1,65 @@
+import pytest
+
+from model import ProcessSet
+from scheduler import calculate_metrics, run_algorithm
+
+
+def shared_disk():
+    # 1 y 2 usan el mismo disco; 3 solo usa CPU
+    return ProcessSet.from_dicts([{"id": 1, "arrival": 0, "bursts": [2, 3, 1], "device": "disco"},
+                                  {"id": 2, "arrival": 0, "bursts": [1, 4, 1], "device": "disco"},
+                                  {"id": 3, "arrival": 0, "burst": 4}])
+
+
+def io_operations(timeline):
+    return [(entry["process"], entry["device"], entry["blocked"], entry["start"], entry["end"])
+            for entry in timeline.io_dicts()]
+
+
+def test_fcfs_blocks_on_io_and_waits_for_a_busy_device():
+    timeline = run_algorithm("FCFS", shared_disk())
+    # 2 se bloquea en t=3 pero el disco atiende a 1 hasta t=5; 2 espera en su cola
+    assert list(timeline.slices()) == [(1, 0, 2), (2, 2, 3), (3, 3, 7), (1, 7, 8), (2, 9, 10)]
+    assert io_operations(timeline) == [(1, "disco", 2, 2, 5), (2, "disco", 3, 5, 9)]
+
+
+def test_round_robin_requeues_io_returns_before_expired_quanta():
+    timeline = run_algorithm("Round Robin", shared_disk(), quantum=2)
+    # En t=5 vuelve 1 de la E/S y 3 agota su quantum: 1 entra a la cola antes que 3
+    assert list(timeline.slices()) == [(1, 0, 2), (2, 2, 3), (3, 3, 5), (1, 5, 6), (3, 6, 8), (2, 9, 10)]
+
+
+def test_srtf_orders_by_the_current_cpu_burst():
+    timeline = run_algorithm("SRTF", shared_disk())
+    # 2 vuelve del disco en t=5 con una ráfaga de 1 y expropia a 3, al que le quedan 2
+    assert list(timeline.slices()) == [(2, 0, 1), (1, 1, 3), (3, 3, 5), (2, 5, 6), (3, 6, 8), (1, 8, 9)]
+    assert io_operations(timeline) == [(2, "disco", 1, 1, 5), (1, "disco", 3, 5, 8)]
+
+
+def test_blocked_time_is_not_waiting_time():
+    processes = shared_disk()
+    metrics = calculate_metrics(processes, run_algorithm("FCFS", processes))
+    # 1: retorno 8 - CPU 3 - bloqueado 3; 2: retorno 10 - CPU 2 - bloqueado 6 (2 en cola)
+    assert metrics["process_metrics"][1] == {"wait_time": 2, "response_time": 0, "turnaround_time": 8}
+    assert metrics["process_metrics"][2] == {"wait_time": 2, "response_time": 2, "turnaround_time": 10}
+    assert metrics["process_metrics"][3]["wait_time"] == 3
+    # El disco está ocupado de 2 a 9 de un total de 10
+    assert metrics["device_usage"] == {"disco": 70.0}
+    assert metrics["cpu_usage"] == 90.0
+
+
+def test_each_operation_uses_its_own_device():
+    processes = ProcessSet.from_dicts([{"id": "A", "arrival": 0, "bursts": [1, 4, 2, 2, 1], "device": ["disco", "red"]},
+                                       {"id": "B", "arrival": 1, "bursts": [1, 2, 1], "device": "red"}])
+    timeline = run_algorithm("FCFS", processes)
+    assert list(timeline.slices()) == [("A", 0, 1), ("B", 1, 2), ("B", 4, 5), ("A", 5, 7), ("A", 9, 10)]
+    assert sorted(io_operations(timeline), key=lambda operation: operation[3]) == [
+        ("A", "disco", 1, 1, 5), ("B", "red", 2, 2, 4), ("A", "red", 7, 7, 9)]
+    metrics = calculate_metrics(processes, timeline)
+    assert metrics["device_usage"] == {"disco": 40.0, "red": 40.0}
+    assert metrics["avg_wait_time"] == 0
+
+
+def test_mlfq_rejects_io_bursts():
+    with pytest.raises(ValueError):
+        run_algorithm("MLFQ", shared_disk())
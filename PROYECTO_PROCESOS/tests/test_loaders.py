@@ -0,0 +1,65 @@
+import json
+
+import pytest
+
+from loaders import load_workload
+from worker import TaskCancelled
+
+
+PROCESSES = [
+    {"id": 1, "arrival": 0, "burst": 5, "priority": 2},
+    {"id": 2, "arrival": 1, "burst": 3, "priority": 0},
+    {"id": "web", "arrival": 2, "bursts": [2, 4, 1], "device": ["disco"]},
+    {"id": 10, "arrival": 4, "burst": 6, "priority": 1},
+]
+
+
+def write_csv(path, processes):
+    with open(path, "w", newline="") as f:
+        f.write("id,arrival,burst,priority,bursts,device\n")
+        for p in processes:
+            bursts = ", ".join(str(b) for b in p.get("bursts", []))
+            device = p["device"][0] if "device" in p else ""
+            burst = p.get("burst", "")
+            f.write(f'{p["id"]},{p["arrival"]},{burst},{p.get("priority", "")},"{bursts}",{device}\n')
+
+
+def write_jsonl(path, processes):
+    with open(path, "w") as f:
+        for p in processes:
+            f.write(json.dumps(p) + "\n")
+
+
+def test_csv_and_jsonl_give_the_same_process_set(tmp_path):
+    write_csv(tmp_path / "carga.csv", PROCESSES)
+    write_jsonl(tmp_path / "carga.jsonl", PROCESSES)
+    from_csv = load_workload(str(tmp_path / "carga.csv"))
+    from_jsonl = load_workload(str(tmp_path / "carga.jsonl"))
+    assert from_csv.ids.tolist() == [1, 2, "web", 10]
+    assert from_csv.to_dicts() == from_jsonl.to_dicts()
+    assert from_csv.digest() == from_jsonl.digest()
+
+
+def test_numeric_csv_ids_are_integers(tmp_path):
+    numeric = [p for p in PROCESSES if isinstance(p["id"], int)]
+    write_csv(tmp_path / "carga.csv", numeric)
+    write_jsonl(tmp_path / "carga.jsonl", numeric)
+    from_csv = load_workload(str(tmp_path / "carga.csv"))
+    assert from_csv.ids.dtype.kind == "i"
+    assert from_csv.digest() == load_workload(str(tmp_path / "carga.jsonl")).digest()
+
+
+@pytest.mark.parametrize("extension", ["csv", "jsonl"])
+def test_load_reports_progress_and_can_be_cancelled(tmp_path, extension):
+    path = tmp_path / f"carga.{extension}"
+    (write_csv if extension == "csv" else write_jsonl)(path, [dict(p, id=i) for i, p in enumerate(PROCESSES * 50)])
+    reports = []
+    processes = load_workload(str(path), chunk_size=30, progress=lambda done, total: reports.append((done, total)))
+    assert len(processes) == 200 and len(reports) == 7
+    assert reports[-1] == (path.stat().st_size, path.stat().st_size)
+
+    def cancel(done, total):
+        raise TaskCancelled()
+
+    with pytest.raises(TaskCancelled):
+        load_workload(str(path), chunk_size=30, progress=cancel)
@@ -0,0 +1,61 @@
+import pytest
+
+from model import ProcessSet
+from scheduler import ALGORITHMS, calculate_metrics, run_algorithm
+
+
+def round_robin_metrics(**options):
+    # Quantum 2: 1 corre 0-2, 2 corre 2-4, 3 corre 4-5, 2 termina en 5-6, la CPU queda
+    # libre hasta que llega 4, que corre 10-12
+    processes = ProcessSet([1, 2, 3, 4], [0, 0, 1, 10], [2, 3, 1, 2])
+    timeline = run_algorithm("Round Robin", processes, quantum=2)
+    assert list(timeline.slices()) == [(1, 0, 2), (2, 2, 4), (3, 4, 5), (2, 5, 6), (4, 10, 12)]
+    return calculate_metrics(processes, timeline, **options)
+
+
+def test_averages_usage_and_throughput():
+    metrics = round_robin_metrics()
+    # Espera 0, 3, 3 y 0; respuesta 0, 2, 3 y 0; retorno 2, 6, 4 y 2
+    assert metrics["avg_wait_time"] == 1.5
+    assert metrics["avg_response_time"] == 1.25
+    assert metrics["avg_turnaround_time"] == 3.5
+    # 8 unidades de CPU en 12, y 4 procesos completados en 12
+    assert metrics["cpu_usage"] == pytest.approx(100 * 8 / 12)
+    assert metrics["throughput"] == pytest.approx(4 / 12)
+    assert metrics["context_switches"] == 4
+    assert metrics["completed"] == 4
+    assert metrics["process_metrics"][2] == {"wait_time": 3, "response_time": 2, "turnaround_time": 6}
+
+
+def test_percentiles_interpolate_between_processes():
+    metrics = round_robin_metrics()
+    # Interpolación lineal sobre los valores ordenados: respuesta 0, 0, 2, 3
+    assert metrics["p50_response_time"] == 1.0
+    assert metrics["p95_response_time"] == pytest.approx(2.85)
+    assert metrics["p99_response_time"] == pytest.approx(2.97)
+    assert metrics["p50_wait_time"] == 1.5 and metrics["p99_wait_time"] == 3.0
+    assert metrics["p50_turnaround_time"] == 3.0
+
+
+def test_max_listed_limits_only_the_per_process_listing():
+    metrics = round_robin_metrics(max_listed=2)
+    assert list(metrics["process_metrics"]) == [1, 2]
+    assert metrics["completed"] == 4 and metrics["avg_wait_time"] == 1.5
+
+
+def test_context_switches_ignore_consecutive_slices_of_one_process():
+    processes = ProcessSet([1, 2], [0, 10], [4, 1])
+    # Round Robin parte a 1 en dos tramos seguidos sin cambiar de proceso
+    timeline = run_algorithm("Round Robin", processes, quantum=2)
+    assert len(timeline) == 3
+    assert calculate_metrics(processes, timeline)["context_switches"] == 1
+
+
+@pytest.mark.parametrize("algorithm", ALGORITHMS)
+def test_empty_workload_has_zeroed_metrics(algorithm):
+    processes = ProcessSet([], [], [])
+    metrics = calculate_metrics(processes, run_algorithm(algorithm, processes))
+    assert metrics["avg_wait_time"] == metrics["avg_turnaround_time"] == 0
+    assert metrics["cpu_usage"] == metrics["throughput"] == metrics["context_switches"] == 0
+    assert metrics["p99_response_time"] == 0
+    assert metrics["process_metrics"] == {} and metrics["completed"] == 0
@@ -0,0 +1,46 @@
+import random
+
+import numpy as np
+
+from model import ProcessSet
+from scheduler import mlfq_algorithm, round_robin_algorithm
+
+
+def slices(timeline, process=None):
+    return [(row["process"], row["start"], row["end"]) for row in timeline.to_dicts()
+            if process is None or row["process"] == process]
+
+
+def test_single_level_is_round_robin():
+    rng = random.Random("mlfq")
+    for trial in range(40):
+        count = rng.randint(1, 30)
+        processes = ProcessSet(np.arange(count), [rng.randint(0, 40) for _ in range(count)],
+                               [rng.randint(1, 9) for _ in range(count)])
+        quantum, switch_cost, warmup = rng.randint(1, 4), rng.randint(0, 2), rng.randint(0, 1)
+        timeline = mlfq_algorithm(processes, [quantum], switch_cost=switch_cost, warmup=warmup)
+        expected = round_robin_algorithm(processes, quantum, switch_cost, warmup)
+        assert timeline.to_dicts() == expected.to_dicts(), trial
+
+
+def test_aging_promotes_a_starving_process():
+    # A baja al nivel 1 en t=2 y después llega un proceso corto cada 2 unidades, que
+    # mantiene ocupado el nivel 0 hasta t=22
+    ids = ["A"] + [f"P{i}" for i in range(1, 11)]
+    processes = ProcessSet(ids, [0] + [2 * i for i in range(1, 11)], [3] + [2] * 10)
+    assert slices(mlfq_algorithm(processes, [2, 4]), "A") == [("A", 0, 2), ("A", 22, 23)]
+    # Con aging=5 sube al nivel 0 en t=8 (detrás de P4, que llegó en ese instante)
+    assert slices(mlfq_algorithm(processes, [2, 4], aging=5), "A") == [("A", 0, 2), ("A", 10, 11)]
+
+
+def test_boost_returns_every_process_to_level_zero():
+    processes = ProcessSet(["B", "C"], [0, 0], [20, 20])
+    timeline = slices(mlfq_algorithm(processes, [1, 2, 4], boost_interval=12))
+    # El boost corta el tramo de C en el último nivel y, en t=12 y t=24, ambos procesos
+    # vuelven a recibir el quantum del nivel 0
+    assert ("C", 10, 12) in timeline
+    for boost in (12, 24):
+        first = [start for _, start, _ in timeline].index(boost)
+        assert timeline[first:first + 2] == [("B", boost, boost + 1), ("C", boost + 1, boost + 2)]
+    # Sin boost se quedan en el último nivel, con el quantum de 4
+    assert slices(mlfq_algorithm(processes, [1, 2, 4]))[6:8] == [("B", 14, 18), ("C", 18, 22)]
@@ -0,0 +1,68 @@
+import random
+
+from model import ProcessSet, ProcessStore
+
+
+def store_of(count):
+    return ProcessStore(ProcessSet(list(range(1, count + 1)), list(range(count)), [2] * count))
+
+
+def test_remove_keeps_insertion_order():
+    store = store_of(6)
+    for pid in (2, 5):
+        store.remove(pid)
+    assert len(store) == 4
+    assert store.ids == [1, 3, 4, 6]
+    assert [store.index(pid) for pid in (1, 3, 4, 6)] == [0, 1, 2, 3]
+    assert store.row(2) == {"id": 4, "arrival": 3, "burst": 2, "priority": 0}
+    assert [process["id"] for process in store.to_dicts()] == [1, 3, 4, 6]
+    assert store.to_process_set().arrival.tolist() == [0, 2, 3, 5]
+
+
+def test_lookups_between_removals_and_compaction():
+    store = store_of(5)
+    store.remove(1)
+    store.remove("3")
+    assert 1 not in store and 3 not in store and "4" in store
+    assert store.get(4)["arrival"] == 3
+    store.append(7, 10, 1)
+    assert store.ids == [2, 4, 5, 7]
+    store.remove(7)
+    store.remove(7)
+    assert len(store) == 3 and store.ids == [2, 4, 5]
+
+
+def test_removal_gives_the_workload_without_that_process():
+    # Quitar un proceso debe dar la misma carga, en el mismo orden, que si nunca se
+    # hubiera agregado
+    store = store_of(4)
+    store.remove(2)
+    processes = store.to_process_set()
+    assert processes.ids.tolist() == [1, 3, 4]
+    assert processes.arrival.tolist() == [0, 2, 3] and processes.burst.tolist() == [2, 2, 2]
+
+
+def test_window_skips_removed_rows_without_compacting():
+    # Como la tabla de la interfaz: eliminar y redibujar la ventana visible no
+    # reconstruye las columnas
+    store = store_of(10)
+    store.to_process_set()
+    columns = store._arrival
+    for pid in (1, 4, 5, 9):
+        store.remove(pid)
+        store.window(0, 3)
+    assert store._arrival is columns
+    assert [process["id"] for process in store.window(0, 3)] == [2, 3, 6]
+    assert [process["id"] for process in store.window(2, 10)] == [6, 7, 8, 10]
+    assert store.window(6, 3) == []
+    assert store._arrival is columns
+
+
+def test_window_matches_the_compacted_rows():
+    rng = random.Random("window")
+    store = store_of(200)
+    for pid in rng.sample(range(1, 201), 80):
+        store.remove(pid)
+    windows = [store.window(start, 7) for start in range(0, 125, 3)]
+    rows = store.to_dicts()
+    assert windows == [rows[start:start + 7] for start in range(0, 125, 3)]
@@ -0,0 +1,171 @@
+import random
+import threading
+
+import numpy as np
+import pytest
+
+from model import ProcessSet
+import scheduler
+from scheduler import calculate_metrics, compare_algorithms, parse_int_range, quantum_sweep, run_algorithm
+
+
+def slices(timeline):
+    return list(timeline.slices())
+
+
+def test_priority_preemption_charges_the_interrupted_process_once():
+    # 2 llega en t=2 con mejor prioridad y expropia a 1, que ya corrió 2 de sus 5
+    # unidades: le quedan 3, no 1 (el bucle anterior descontaba el tramo dos veces)
+    processes = ProcessSet([1, 2, 3], [0, 2, 3], [5, 2, 1], [2, 1, 2])
+    timeline = run_algorithm("Prioridades", processes)
+    assert slices(timeline) == [(1, 0, 2), (2, 2, 4), (1, 4, 7), (3, 7, 8)]
+    received = np.bincount(timeline.pid, weights=timeline.end - timeline.start, minlength=len(processes))
+    assert received.tolist() == processes.burst.tolist()
+
+
+def test_priority_ties_do_not_preempt():
+    # Con la misma prioridad gana quien entró antes a la cola y nadie expropia
+    processes = ProcessSet([1, 2, 3], [0, 1, 1], [3, 2, 2], [1, 1, 1])
+    assert slices(run_algorithm("Prioridades", processes)) == [(1, 0, 3), (2, 3, 5), (3, 5, 7)]
+
+
+def test_priority_preemption_pays_the_switch_cost():
+    processes = ProcessSet([1, 2, 3], [0, 2, 3], [5, 2, 1], [2, 1, 2])
+    timeline = run_algorithm("Prioridades", processes, switch_cost=1)
+    assert slices(timeline) == [(1, 0, 2), (2, 3, 5), (1, 6, 9), (3, 10, 11)]
+    assert timeline.overhead.tolist() == [0, 1, 1, 1]
+
+
+def reference_srtf(processes):
+    # SRTF de referencia, una unidad de tiempo por paso: solo una ráfaga restante
+    # estrictamente menor expropia, y los empates van a quien entró antes a la cola
+    arrival, remaining = processes.arrival.tolist(), processes.burst.tolist()
+    pending = sorted(range(len(processes)), key=arrival.__getitem__)
+    ready, result = [], []
+    time, sequence, current = 0, 0, None
+    while pending or ready or current is not None:
+        while pending and arrival[pending[0]] <= time:
+            ready.append((sequence, pending.pop(0)))
+            sequence += 1
+        best = min(ready, key=lambda entry: (remaining[entry[1]], entry[0]), default=None)
+        if best is not None and (current is None or remaining[best[1]] < remaining[current]):
+            if current is not None:
+                ready.append((sequence, current))
+                sequence += 1
+            ready.remove(best)
+            current = best[1]
+        if current is None:
+            time += 1
+            continue
+        if result and result[-1][0] == current and result[-1][2] == time:
+            result[-1] = (current, result[-1][1], time + 1)
+        else:
+            result.append((current, time, time + 1))
+        remaining[current] -= 1
+        time += 1
+        if not remaining[current]:
+            current = None
+    return result
+
+
+def test_sjf_runs_the_shortest_ready_job_to_completion():
+    processes = ProcessSet(["A", "B", "C"], [0, 1, 2], [7, 4, 1])
+    assert slices(run_algorithm("SJF", processes)) == [("A", 0, 7), ("C", 7, 8), ("B", 8, 12)]
+
+
+def test_srtf_preempts_for_a_shorter_remaining_time():
+    processes = ProcessSet(["A", "B", "C"], [0, 1, 2], [7, 4, 1])
+    assert slices(run_algorithm("SRTF", processes)) == [
+        ("A", 0, 1), ("B", 1, 2), ("C", 2, 3), ("B", 3, 6), ("A", 6, 12)]
+
+
+def test_srtf_redirects_a_switch_when_a_shorter_job_arrives():
+    # B expropia en t=1; C llega durante el cambio hacia B y se lo queda, con el tiempo
+    # ya perdido sumado a su costo
+    processes = ProcessSet(["A", "B", "C"], [0, 1, 2], [7, 4, 1])
+    timeline = run_algorithm("SRTF", processes, switch_cost=1)
+    assert slices(timeline) == [("A", 0, 1), ("C", 3, 4), ("B", 5, 9), ("A", 10, 16)]
+    assert timeline.overhead.tolist() == [0, 2, 1, 1]
+
+
+def test_srtf_matches_a_tick_by_tick_reference():
+    rng = random.Random("srtf")
+    for trial in range(50):
+        count = rng.randint(1, 25)
+        processes = ProcessSet(np.arange(count), [rng.randint(0, 30) for _ in range(count)],
+                               [rng.randint(1, 8) for _ in range(count)])
+        timeline = run_algorithm("SRTF", processes)
+        expected = reference_srtf(processes)
+        assert list(zip(timeline.pid.tolist(), timeline.start.tolist(), timeline.end.tolist())) == expected, trial
+
+
+def test_sjf_matches_a_sorted_list_reference():
+    # Referencia O(n²): en cada despacho, la ráfaga más corta entre los que ya llegaron
+    rng = random.Random("sjf")
+    for trial in range(50):
+        count = rng.randint(1, 25)
+        processes = ProcessSet(np.arange(count), [rng.randint(0, 30) for _ in range(count)],
+                               [rng.randint(1, 8) for _ in range(count)])
+        pending = sorted(range(count), key=lambda row: (processes.arrival[row], processes.burst[row]))
+        expected, time = [], 0
+        while pending:
+            time = max(time, int(processes.arrival[pending[0]]))
+            row = min((row for row in pending if processes.arrival[row] <= time),
+                      key=lambda row: (processes.burst[row], pending.index(row)))
+            pending.remove(row)
+            expected.append((row, time, time + int(processes.burst[row])))
+            time += int(processes.burst[row])
+        timeline = run_algorithm("SJF", processes)
+        assert list(zip(timeline.pid.tolist(), timeline.start.tolist(), timeline.end.tolist())) == expected, trial
+
+
+def test_pool_started_from_a_worker_thread_matches_sequential_runs(monkeypatch):
+    # Como desde la interfaz: la comparación corre en un hilo de fondo y usa el pool
+    monkeypatch.setattr(scheduler, "PARALLEL_THRESHOLD", 0)
+    rng = random.Random("pool")
+    processes = ProcessSet(np.arange(200), [rng.randint(0, 300) for _ in range(200)],
+                           [rng.randint(1, 9) for _ in range(200)])
+    algorithms = ("FCFS", "SRTF", "Round Robin")
+    results = {}
+    thread = threading.Thread(target=lambda: results.update(compare_algorithms(processes, algorithms, max_workers=2)))
+    thread.start()
+    thread.join(timeout=60)
+    assert not thread.is_alive()
+    for algorithm in algorithms:
+        timeline, metrics = results[algorithm]
+        expected = run_algorithm(algorithm, processes)
+        assert np.array_equal(timeline.start, expected.start) and np.array_equal(timeline.pid, expected.pid)
+        assert metrics == calculate_metrics(processes, expected, per_process=False)
+
+
+def test_quantum_sweep_covers_every_quantum_and_switch_cost():
+    # Dos procesos de 3 unidades: con quantum 1 se alternan seis veces, con quantum 3
+    # corren uno detrás del otro. Con costo 1 cada cambio deja la CPU ociosa una unidad
+    processes = ProcessSet([1, 2], [0, 0], [3, 3])
+    sweep = quantum_sweep(processes, [1, 3], switch_costs=[0, 1])
+    assert [(row["quantum"], row["switch_cost"]) for row in sweep] == [(1, 0), (3, 0), (1, 1), (3, 1)]
+    assert [row["avg_wait_time"] for row in sweep] == [2.5, 1.5, 7.0, 2.0]
+    assert [row["context_switches"] for row in sweep] == [5, 1, 5, 1]
+    # Con quantum 1 y costo 1 el último tramo termina en 11, tras 5 unidades de cambios
+    assert sweep[2]["overhead_pct"] == pytest.approx(100 * 5 / 11)
+    assert sweep[2]["cpu_usage"] == pytest.approx(100 * 6 / 11)
+
+
+def test_quantum_sweep_matches_single_runs():
+    rng = random.Random("sweep")
+    processes = ProcessSet(np.arange(30), [rng.randint(0, 40) for _ in range(30)],
+                           [rng.randint(1, 9) for _ in range(30)])
+    for row in quantum_sweep(processes, range(1, 6), switch_costs=(0, 2), warmup=1):
+        timeline = run_algorithm("Round Robin", processes, row["quantum"], row["switch_cost"], warmup=1)
+        metrics = calculate_metrics(processes, timeline, per_process=False)
+        assert {name: metrics[name] for name in row if name in metrics} == {
+            name: value for name, value in row.items() if name not in ("quantum", "switch_cost")}
+
+
+def test_parse_int_range():
+    assert parse_int_range("1-4,8, 16") == [1, 2, 3, 4, 8, 16]
+    assert parse_int_range("3,1,3") == [1, 3]
+    with pytest.raises(ValueError):
+        parse_int_range("5-2")
+    with pytest.raises(ValueError):
+        parse_int_range(",")
@@ -0,0 +1,106 @@
+import random
+
+import numpy as np
+import pytest
+
+import scheduler
+from model import ProcessSet
+from smp import SMP_ALGORITHMS, smp_algorithm
+
+
+def random_processes(rng, count, io=False):
+    processes = []
+    for pid in range(count):
+        process = {"id": pid, "arrival": rng.randint(0, 60), "priority": rng.randint(0, 3)}
+        if io and rng.random() < 0.5:
+            operations = rng.randint(1, 3)
+            process["bursts"] = [rng.randint(1, 6) for _ in range(2 * operations + 1)]
+            process["device"] = [rng.choice(["disco", "red"]) for _ in range(operations)]
+        else:
+            process["burst"] = rng.randint(1, 9)
+        processes.append(process)
+    return ProcessSet.from_dicts(processes)
+
+
+def cpu_time(processes):
+    # Tiempo de CPU total de cada proceso (las ráfagas pares cuando hay E/S)
+    return [sum(process["bursts"][::2]) if "bursts" in process else process["burst"]
+            for process in processes.to_dicts()]
+
+
+def non_overlapping(starts, ends, gaps=None):
+    # Tramos ordenados por inicio; gaps es el tiempo de cambio de contexto previo a cada uno
+    order = np.argsort(starts, kind="stable")
+    starts, ends = starts[order], ends[order]
+    before = starts[1:] - (0 if gaps is None else gaps[order][1:])
+    return bool(np.all(before >= ends[:-1]))
+
+
+@pytest.mark.parametrize("algorithm", SMP_ALGORITHMS)
+def test_one_core_matches_single_core_engines(algorithm):
+    rng = random.Random(algorithm)
+    for trial in range(30):
+        processes = random_processes(rng, rng.randint(1, 40))
+        quantum, switch_cost, warmup = rng.randint(1, 4), rng.randint(0, 2), rng.randint(0, 1)
+        expected = scheduler.run_algorithm(algorithm, processes, quantum, switch_cost, warmup=warmup)
+        timeline = smp_algorithm(processes, algorithm, 1, quantum, switch_cost=switch_cost, warmup=warmup)
+        for name in ("pid", "start", "end"):
+            assert np.array_equal(getattr(timeline, name), getattr(expected, name)), (trial, name)
+        # Misma columna de sobrecarga (o ninguna): la caché y las exportaciones no deben
+        # depender del motor
+        if expected.overhead is None:
+            assert timeline.overhead is None, trial
+        else:
+            assert np.array_equal(timeline.overhead, expected.overhead), trial
+
+
+MODES = {"global": (False, False), "per_core": (True, False), "work_stealing": (True, True)}
+
+
+@pytest.mark.parametrize("algorithm", SMP_ALGORITHMS)
+@pytest.mark.parametrize("mode", list(MODES))
+@pytest.mark.parametrize("io", [False, True])
+def test_multi_core_invariants(algorithm, mode, io):
+    per_core_queues, work_stealing = MODES[mode]
+    rng = random.Random(f"{algorithm}-{mode}-{io}")
+    for trial in range(20):
+        processes = random_processes(rng, rng.randint(1, 50), io)
+        cores = rng.randint(2, 4)
+        timeline = smp_algorithm(processes, algorithm, cores, rng.randint(1, 4), per_core_queues, work_stealing,
+                                 switch_cost=rng.randint(0, 2), warmup=rng.randint(0, 1))
+        assert timeline.cores == cores and np.all((timeline.cpu >= 0) & (timeline.cpu < cores))
+        assert np.all(timeline.end > timeline.start)
+        assert np.all(timeline.start >= processes.arrival[timeline.pid])
+
+        # Cada proceso recibe exactamente su tiempo de CPU
+        received = np.bincount(timeline.pid, weights=timeline.end - timeline.start, minlength=len(processes))
+        assert received.astype(np.int64).tolist() == cpu_time(processes), trial
+
+        # Un núcleo ejecuta un tramo (y su cambio de contexto) a la vez
+        for core in range(cores):
+            on_core = timeline.cpu == core
+            gaps = None if timeline.overhead is None else timeline.overhead[on_core]
+            assert non_overlapping(timeline.start[on_core], timeline.end[on_core], gaps), (trial, core)
+
+        # Un proceso no corre en dos núcleos a la vez
+        for row in range(len(processes)):
+            own = timeline.pid == row
+            assert non_overlapping(timeline.start[own], timeline.end[own]), (trial, row)
+
+
+def test_compare_algorithms_skips_what_the_smp_engine_cannot_run():
+    processes = random_processes(random.Random("compare"), 20, io=True)
+    assert set(scheduler.compare_algorithms(processes, max_workers=1)) == set(SMP_ALGORITHMS)
+    single = random_processes(random.Random("compare"), 20)
+    assert set(scheduler.compare_algorithms(single, max_workers=1)) == set(scheduler.ALGORITHMS)
+    assert set(scheduler.compare_algorithms(single, max_workers=1, cores=2)) == set(SMP_ALGORITHMS)
+
+
+def test_sjf_breaks_ties_by_arrival_order_after_io():
+    # 0 vuelve de la E/S en t=2 con una ráfaga de 3, igual que la de 2, que llegó
+    # después que 0 pero entró antes a la cola; en t=3 gana 0 por haber llegado primero
+    processes = ProcessSet.from_dicts([{"id": 0, "arrival": 0, "bursts": [1, 1, 3]},
+                                       {"id": 1, "arrival": 0, "burst": 2},
+                                       {"id": 2, "arrival": 1, "burst": 3}])
+    timeline = smp_algorithm(processes, "SJF", 1)
+    assert list(timeline.slices()) == [(0, 0, 1), (1, 1, 3), (0, 3, 6), (2, 6, 9)]
@@ -0,0 +1,79 @@
+import numpy as np
+import pytest
+
+import scheduler
+from model import ProcessSet
+from storage import load_timeline, read_arrays, save_timeline, save_timeline_chunks
+
+
+def io_processes():
+    return ProcessSet.from_dicts([
+        {"id": 1, "arrival": 0, "bursts": [3, 4, 2], "device": "disco"},
+        {"id": 2, "arrival": 1, "bursts": [2, 5, 1, 2, 1], "device": ["disco", "red"]},
+        {"id": 3, "arrival": 2, "burst": 4, "priority": 1},
+        {"id": 4, "arrival": 2, "bursts": [1, 3, 1]},
+    ])
+
+
+def plain_processes():
+    rng = np.random.default_rng(5)
+    return ProcessSet(np.arange(200), np.sort(rng.integers(0, 400, 200)), rng.integers(1, 9, 200),
+                      rng.integers(0, 4, 200))
+
+
+TIMELINES = {
+    # Núcleos, costo de cambio y E/S: todas las columnas opcionales
+    "smp_io": lambda: (io_processes(), dict(algorithm="Round Robin", quantum=2, switch_cost=1, cores=2)),
+    # FCFS sin costos no tiene columna de sobrecarga (overhead=None)
+    "plain": lambda: (plain_processes(), dict(algorithm="FCFS")),
+}
+
+
+def mapped(array):
+    # Las columnas del Timeline son vistas de los arreglos mapeados en memoria
+    while array is not None and not isinstance(array, np.memmap):
+        array = array.base
+    return array is not None
+
+
+def assert_loaded(file_path, expected, info):
+    timeline, loaded_info = load_timeline(str(file_path))
+    assert loaded_info == info
+    columns, expected_columns = timeline.columns(), expected.columns()
+    assert columns.keys() == expected_columns.keys()
+    for name, column in expected_columns.items():
+        if name == "cores":
+            assert columns[name] == column
+        else:
+            assert np.array_equal(columns[name], column), name
+            assert mapped(columns[name]), name
+    assert timeline.processes.digest() == expected.processes.digest()
+    assert timeline.to_dicts() == expected.to_dicts()
+
+    arrays = read_arrays(str(file_path))
+    for name in expected_columns:
+        if name != "cores":
+            assert isinstance(arrays[name], np.memmap), name
+
+
+@pytest.mark.parametrize("case", list(TIMELINES))
+def test_saved_timeline_round_trips(tmp_path, case):
+    processes, options = TIMELINES[case]()
+    algorithm = options.pop("algorithm")
+    expected = scheduler.run_algorithm(algorithm, processes, **options)
+    assert (expected.overhead is None) == (case == "plain")
+    info = {"algorithm": algorithm, **options}
+    save_timeline(str(tmp_path / "timeline.npz"), expected, info)
+    assert_loaded(tmp_path / "timeline.npz", expected, info)
+
+
+@pytest.mark.parametrize("case", list(TIMELINES))
+@pytest.mark.parametrize("chunk_size", [1, 3, 64])
+def test_chunked_timeline_round_trips(tmp_path, case, chunk_size):
+    processes, options = TIMELINES[case]()
+    algorithm = options.pop("algorithm")
+    expected = scheduler.run_algorithm(algorithm, processes, **options)
+    info = {"algorithm": algorithm, **options}
+    chunks = scheduler.iter_algorithm(algorithm, processes, chunk_size=chunk_size, **options)
+    assert save_timeline_chunks(str(tmp_path / "timeline.npz"), chunks, info) == len(expected)
+    assert_loaded(tmp_path / "timeline.npz", expected, info)
@@ -0,0 +1,54 @@
+import random
+
+import numpy as np
+import pytest
+
+import scheduler
+from model import ProcessSet, Timeline
+from smp import SMP_ALGORITHMS
+
+
+def random_processes(rng, count, io):
+    # Con io, la mitad de los procesos alterna ráfagas de CPU y de E/S en dos dispositivos
+    processes = []
+    for pid in range(count):
+        process = {"id": pid, "arrival": rng.randint(0, 80), "priority": rng.randint(0, 3)}
+        if io and rng.random() < 0.5:
+            operations = rng.randint(1, 3)
+            process["bursts"] = [rng.randint(1, 6) for _ in range(2 * operations + 1)]
+            process["device"] = [rng.choice(["disco", "red"]) for _ in range(operations)]
+        else:
+            process["burst"] = rng.randint(1, 9)
+        processes.append(process)
+    return ProcessSet.from_dicts(processes)
+
+
+def assert_same_timeline(timeline, expected):
+    columns, expected_columns = timeline.columns(), expected.columns()
+    assert columns.keys() == expected_columns.keys()
+    for name, column in expected_columns.items():
+        assert np.array_equal(columns[name], column), name
+
+
+CASES = [(algorithm, 1, False) for algorithm in scheduler.ALGORITHMS]
+CASES += [(algorithm, cores, io) for algorithm in SMP_ALGORITHMS for cores, io in ((1, True), (3, False), (3, True))]
+
+
+@pytest.mark.parametrize("algorithm, cores, io", CASES)
+def test_concatenated_chunks_match_full_run(algorithm, cores, io):
+    rng = random.Random(f"{algorithm}-{cores}-{io}")
+    for trial in range(20):
+        processes = random_processes(rng, rng.randint(1, 60), io)
+        options = dict(quantum=rng.randint(1, 4), switch_cost=rng.randint(0, 2), warmup=rng.randint(0, 1),
+                       cores=cores, per_core_queues=cores > 1 and rng.random() < 0.5)
+        options["work_stealing"] = options["per_core_queues"] and rng.random() < 0.5
+        if algorithm == "MLFQ":
+            options["mlfq"] = scheduler.mlfq_settings([rng.randint(1, 3), rng.randint(2, 6)], rng.choice([0, 15]),
+                                                      rng.choice([0, 10]))
+        expected = scheduler.run_algorithm(algorithm, processes, **options)
+        for chunk_size in (1, 7, 50):
+            chunks = list(scheduler.iter_algorithm(algorithm, processes, chunk_size=chunk_size, **options))
+            assert_same_timeline(Timeline.concat(chunks), expected)
+            # Los bloques salen en orden de inicio
+            starts = np.concatenate([chunk.start for chunk in chunks])
+            assert np.all(starts[1:] >= starts[:-1]), (trial, chunk_size)